@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the sqlalchemy and sqlite3 backends for the bundled SQLite file.
+
+Times typical lookups with new objects on every call (so that the data is
+always loaded from the database): api.get('S008M').value, a particle lookup
+by MC ID including its mass, and a lookup by name including the list of its
+branching fractions. Each lookup is timed with and without a session.
+
+Usage: python benchmarks/bench_backend.py [-n CALLS]
+"""
+
+import argparse
+import contextlib
+import time
+
+import sqlalchemy
+
+import pdg
+
+
+def time_per_call(fn, n_calls):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(n_calls):
+        fn()
+    return (time.perf_counter() - t0) / n_calls
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-n', '--calls', type=int, default=500, help='number of calls (default: 500)')
+    args = parser.parse_args()
+
+    apis = {backend: pdg.connect(backend=backend) for backend in ('sqlalchemy', 'sqlite3')}
+    lookups = (
+        ("api.get('S008M').value", lambda api: api.get('S008M').value),
+        ('get_particle_by_mcid().mass', lambda api: api.get_particle_by_mcid(321).mass),
+        ('K+ branching fractions', lambda api: list(api.get_particle_by_name('K+').branching_fractions())),
+    )
+    print('SQLAlchemy %s' % sqlalchemy.__version__)
+    print('%-30s %-8s %16s %16s %8s' % ('lookup', 'session', 'sqlalchemy [us]', 'sqlite3 [us]', 'speedup'))
+    print('-'*82)
+    for label, fn in lookups:
+        for use_session in (False, True):
+            times = {}
+            for backend, api in apis.items():
+                with api.session() if use_session else contextlib.nullcontext():
+                    times[backend] = time_per_call(lambda: fn(api), args.calls)
+            print('%-30s %-8s %16.1f %16.1f %8.1f' % (label, 'yes' if use_session else 'no',
+                                                      1e6*times['sqlalchemy'], 1e6*times['sqlite3'],
+                                                      times['sqlalchemy']/times['sqlite3']))
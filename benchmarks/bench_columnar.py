@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the columnar lookup of particle properties for many MC IDs.
+
+Compares PdgApi.get_particle_properties() for all MC IDs in the database with
+looking up every particle with get_particle_by_mcid() and getting its mass,
+width, lifetime, charge and errors from the PdgParticle object. Also times
+building an McidTable and vectorized lookups of a large array of random MC
+IDs (including unknown ones) with it. Finally compares PdgApi.particle_table()
+with getting the same columns from all particles returned by get_particles().
+
+Usage: python benchmarks/bench_columnar.py [-n MCIDS] [-e EVENTS] [--backend BACKEND]
+"""
+
+import argparse
+import time
+
+import numpy
+import sqlalchemy
+
+import pdg
+from pdg.columnar import FIELDS, TABLE_FLAGS
+from pdg.errors import PdgAmbiguousValueError, PdgNoDataError
+
+
+def scalar_lookup(api, mcids):
+    columns = {field: [] for field in FIELDS}
+    for mcid in mcids:
+        p = api.get_particle_by_mcid(mcid)
+        for field in FIELDS:
+            try:
+                columns[field].append(getattr(p, field))
+            except (PdgNoDataError, PdgAmbiguousValueError, AssertionError, ZeroDivisionError):
+                columns[field].append(None)
+    return columns
+
+
+def scalar_table(api):
+    columns = {field: [] for field in TABLE_FIELDS}
+    for plist in api.get_particles():
+        for p in plist:
+            for field in TABLE_FIELDS:
+                try:
+                    columns[field].append(getattr(p, field))
+                except (PdgNoDataError, PdgAmbiguousValueError, ZeroDivisionError):
+                    columns[field].append(None)
+    return columns
+
+
+TABLE_FIELDS = ('pdgid', 'name', 'mcid') + FIELDS + ('quantum_I', 'quantum_G', 'quantum_J', 'quantum_P',
+                                                     'quantum_C') + tuple(TABLE_FLAGS)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-n', '--mcids', type=int, default=None, help='number of MC IDs (default: all)')
+    parser.add_argument('-e', '--events', type=int, default=1000000,
+                        help='number of MC IDs for vectorized lookups (default: 1000000)')
+    parser.add_argument('--backend', default='sqlalchemy', choices=pdg.backend.BACKENDS,
+                        help='backend (default: sqlalchemy)')
+    args = parser.parse_args()
+
+    api = pdg.connect(backend=args.backend)
+    with api.connection() as conn:
+        mcids = [row.mcid for row in conn.execute(api.statement('particles_with_mcid'))][:args.mcids]
+    print('SQLAlchemy %s, backend %s, %d MC IDs' % (sqlalchemy.__version__, args.backend, len(mcids)))
+    print('%-28s %10s' % ('lookup', 'time [s]'))
+    print('-'*39)
+    t0 = time.perf_counter()
+    api.get_particle_properties(mcids)
+    print('%-28s %10.3f' % ('get_particle_properties()', time.perf_counter() - t0))
+    t0 = time.perf_counter()
+    scalar_lookup(api, mcids)
+    print('%-28s %10.3f' % ('get_particle_by_mcid()', time.perf_counter() - t0))
+    t0 = time.perf_counter()
+    table = api.get_mcid_table()
+    print('%-28s %10.3f' % ('get_mcid_table()', time.perf_counter() - t0))
+    rng = numpy.random.default_rng(1)
+    events = rng.choice(numpy.append(table.mcids, [0, 999999999]), args.events)
+    t0 = time.perf_counter()
+    table.lookup(events, ['charge', 'mass', 'width', 'lifetime', 'pdgid'])
+    print('%-28s %10.3f' % ('McidTable.lookup() (%d)' % args.events, time.perf_counter() - t0))
+    t0 = time.perf_counter()
+    table = api.particle_table()
+    print('%-28s %10.3f' % ('particle_table() (%d)' % len(table['name']), time.perf_counter() - t0))
+    t0 = time.perf_counter()
+    scalar_table(api)
+    print('%-28s %10.3f' % ('get_particles()', time.perf_counter() - t0))
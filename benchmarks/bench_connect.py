@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the cold-start time of pdg.connect().
+
+Each measurement is done in a fresh Python process, so that neither SQLAlchemy
+nor SQLite can reuse any state from a previous connection. The time for
+importing package `pdg` is reported separately and not included in the
+connection time.
+
+Usage: python benchmarks/bench_connect.py [-n RUNS] [DATABASE_URL]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+WORKER = """
+import time
+t0 = time.perf_counter()
+import pdg
+t1 = time.perf_counter()
+api = pdg.connect(%r, reflect=%r)
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+
+def run(database_url, reflect, n_runs):
+    import_times, connect_times = [], []
+    for _ in range(n_runs):
+        out = subprocess.check_output([sys.executable, '-c', WORKER % (database_url, reflect)])
+        t_import, t_connect = [float(t) for t in out.split()]
+        import_times.append(t_import)
+        connect_times.append(t_connect)
+    return statistics.median(import_times), statistics.median(connect_times)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-n', '--runs', type=int, default=10, help='number of runs (default: 10)')
+    parser.add_argument('database_url', nargs='?', default=None, help='database URL (default: bundled SQLite file)')
+    args = parser.parse_args()
+
+    print('%-32s %12s %12s' % ('pdg.connect() cold start', 'import [ms]', 'connect [ms]'))
+    print('-'*58)
+    for label, reflect in (('reflected schema', True), ('prebuilt schema', False)):
+        t_import, t_connect = run(args.database_url, reflect, args.runs)
+        print('%-32s %12.1f %12.1f' % (label, 1e3*t_import, 1e3*t_connect))
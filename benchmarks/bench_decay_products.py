@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark of loading the decay products of all decay modes of a particle.
+
+Compares listing the decay table of a particle (all branching fractions with
+the items of their decay products and the particles these refer to) with
+PdgParticle.branching_fractions() and with
+PdgParticle.branching_fractions(prefetch_products=True), counting the SQL
+statements executed. The row cache is cleared before each run.
+
+Usage: python benchmarks/bench_decay_products.py [PARTICLE ...]
+"""
+
+import argparse
+import time
+
+import sqlalchemy
+
+import pdg
+
+
+def decay_table(particle, prefetch_products):
+    "Decay products of all decay modes of a particle, with the names of the particles of their items."
+    table = []
+    for bf in particle.branching_fractions(require_summary_data=False, prefetch_products=prefetch_products):
+        for product in bf.decay_products:
+            table.append((bf.baseid, product.item.name, product.multiplier,
+                          [p.name for p in product.item.particles]))
+    return table
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('particles', nargs='*', default=['B0', 'D+', 'J/psi(1S)'],
+                        help='particle names (default: B0 D+ J/psi(1S))')
+    args = parser.parse_args()
+
+    # Statements are counted with the SQLAlchemy event listener, so backend sqlite3 cannot be used
+    api = pdg.connect(backend='sqlalchemy')
+    statements = []
+    sqlalchemy.event.listen(api.engine, 'before_cursor_execute',
+                            lambda conn, cursor, statement, *args: statements.append(statement))
+    print('SQLAlchemy %s' % sqlalchemy.__version__)
+    print()
+    print('%-12s %-20s %10s %10s %12s' % ('particle', 'method', 'products', 'time [s]', 'statements'))
+    print('-'*68)
+    for name in args.particles:
+        particle = api.get_particle_by_name(name)
+        for prefetch_products in (False, True):
+            api.row_cache.clear()
+            statements.clear()
+            t0 = time.perf_counter()
+            n = len(decay_table(particle, prefetch_products))
+            print('%-12s %-20s %10d %10.3f %12d' % (name, 'prefetch_products' if prefetch_products else 'default', n,
+                                                   time.perf_counter() - t0, len(statements)))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark of exploring decay chains with the in-memory decay graph.
+
+Compares following the decay chains of a particle to a given depth with the
+data objects of the API (branching_fractions(), decay_products and
+PdgItem.particle for every step) with PdgApi.get_decay_graph() and
+DecayGraph.chains(), counting the SQL statements executed. Also times the
+chains of a particle to a larger depth. The numbers of chains differ slightly,
+since the data objects also follow the decay modes of generic states (e.g. of
+K^*(892) for Kbar^*(892)0), which the graph assigns only to unique particles,
+while the graph assigns the decay modes to the decaying particle rather than to
+the PDG Identifier (e.g. the nucleon decay modes of n).
+
+Usage: python benchmarks/bench_graph.py [-p PARTICLE] [-d DEPTH]
+"""
+
+import argparse
+import time
+
+import sqlalchemy
+
+import pdg
+
+
+def object_chains(particle, depth, modes=()):
+    "Decay chains of a particle as tuples of PDG Identifiers, using the data objects."
+    for bf in particle.exclusive_branching_fractions(require_summary_data=False):
+        chain = modes + (bf.baseid,)
+        yield chain
+        if depth > 1:
+            seen = set()
+            for product in bf.decay_products:
+                if product.item.has_particle and product.item.particle.name not in seen:
+                    seen.add(product.item.particle.name)
+                    yield from object_chains(product.item.particle, depth - 1, chain)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-p', '--particle', default='D+', help='particle name (default: D+)')
+    parser.add_argument('-d', '--depth', type=int, default=2, help='depth of the decay chains (default: 2)')
+    args = parser.parse_args()
+
+    # Statements are counted with the SQLAlchemy event listener, so backend sqlite3 cannot be used
+    api = pdg.connect(backend='sqlalchemy')
+    particle = api.get_particle_by_name(args.particle)
+    statements = []
+    sqlalchemy.event.listen(api.engine, 'before_cursor_execute',
+                            lambda conn, cursor, statement, *args: statements.append(statement))
+    print('SQLAlchemy %s, chains of %s' % (sqlalchemy.__version__, args.particle))
+    print()
+    print('%-32s %10s %10s %12s' % ('method', 'chains', 'time [s]', 'statements'))
+    print('-'*67)
+    t0 = time.perf_counter()
+    n = sum(1 for _ in object_chains(particle, args.depth))
+    print('%-32s %10d %10.3f %12d' % ('data objects (depth %d)' % args.depth, n, time.perf_counter() - t0,
+                                      len(statements)))
+    statements.clear()
+    t0 = time.perf_counter()
+    graph = api.get_decay_graph()
+    print('%-32s %10s %10.3f %12d' % ('get_decay_graph()', '', time.perf_counter() - t0, len(statements)))
+    for depth in (args.depth, args.depth + 1):
+        t0 = time.perf_counter()
+        n = sum(1 for _ in graph.chains(args.particle, depth))
+        print('%-32s %10d %10.3f %12d' % ('DecayGraph.chains() (depth %d)' % depth, n, time.perf_counter() - t0,
+                                          len(statements)))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark of lookup latency for the file-backed and in-memory databases.
+
+Measures the latency distribution of a typical request-path lookup (particle by
+MC ID followed by its mass) for randomly chosen particles, for the bundled
+SQLite file and for an in-memory copy created with pdg.connect(in_memory=True).
+
+Usage: python benchmarks/bench_in_memory.py [-n LOOKUPS] [--seed SEED]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+import pdg
+from pdg.errors import PdgApiError, PdgAmbiguousValueError, PdgNoDataError
+
+
+def lookup_latencies(api, mcids):
+    latencies = []
+    for mcid in mcids:
+        t0 = time.perf_counter()
+        try:
+            api.get_particle_by_mcid(mcid).mass
+        except (PdgApiError, PdgAmbiguousValueError, PdgNoDataError):
+            pass
+        latencies.append(time.perf_counter() - t0)
+    return latencies
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100. * len(values)))]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-n', '--lookups', type=int, default=2000, help='number of lookups (default: 2000)')
+    parser.add_argument('--seed', type=int, default=1, help='random seed (default: 1)')
+    args = parser.parse_args()
+
+    mcids = [p.mcid for plist in pdg.connect().get_particles() for p in plist if p.mcid is not None]
+    random.seed(args.seed)
+    sample = [random.choice(mcids) for _ in range(args.lookups)]
+
+    print('%-12s %10s %10s %10s %10s %10s' % ('database', 'setup [s]', 'p50 [ms]', 'p90 [ms]', 'p99 [ms]', 'max [ms]'))
+    print('-'*67)
+    for label, in_memory in (('file', False), ('in-memory', True)):
+        t0 = time.perf_counter()
+        api = pdg.connect(in_memory=in_memory)
+        t_setup = time.perf_counter() - t0
+        latencies = lookup_latencies(api, sample)
+        print('%-12s %10.3f %10.3f %10.3f %10.3f %10.3f' % (label, t_setup,
+              1e3*statistics.median(latencies), 1e3*percentile(latencies, 90),
+              1e3*percentile(latencies, 99), 1e3*max(latencies)))
+        if api.in_memory_database is not None:
+            print('%-12s %s' % ('', api.in_memory_database))
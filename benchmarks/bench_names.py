@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark of looking up particles by name with the in-memory name index.
+
+Measures the time for building the name index of an API object, and the
+latency in microseconds of looking up names (exact and case-insensitive),
+of get_particle_by_name(), get_particles_by_name() and get_canonical_name()
+for all names referring to particles, and of prefix and fuzzy searches.
+
+Usage: python benchmarks/bench_names.py [-r REPEAT] [--backend BACKEND]
+"""
+
+import argparse
+import time
+
+import pdg
+
+
+def latency(fn, args, repeat):
+    "Mean time per call in microseconds."
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for arg in args:
+            fn(arg)
+    return 1e6*(time.perf_counter() - t0)/(repeat*len(args))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of repetitions (default: 3)')
+    parser.add_argument('--backend', default='sqlalchemy', choices=pdg.backend.BACKENDS,
+                        help='backend (default: sqlalchemy)')
+    args = parser.parse_args()
+
+    api = pdg.connect(backend=args.backend)
+    index = api.name_index
+    print('%s, backend %s' % (index, args.backend))
+    print()
+
+    names = index.particle_names
+    unique_names = [name for name in names if index.particle(index.item_ids(name)[0]) is not None]
+    prefixes = sorted(set(name[:2] for name in names))
+    misspelled = [name[:-1] + 'x' for name in names[::10]]
+    lookups = [
+        ('item_ids', lambda name: index.item_ids(name), names),
+        ('item_ids (case-insensitive)', lambda name: index.item_ids(name.upper(), False), names),
+        ('get_particle_by_name', api.get_particle_by_name, unique_names),
+        ('get_particles_by_name', api.get_particles_by_name, names),
+        ('get_canonical_name', api.get_canonical_name, unique_names),
+        ('prefix_search (2 chars)', lambda prefix: index.prefix_search(prefix, limit=10), prefixes),
+        ('prefix_search (case-insens.)', lambda prefix: index.prefix_search(prefix, False, 10), prefixes),
+        ('fuzzy_search', index.fuzzy_search, misspelled),
+    ]
+    print('%-30s %8s %14s' % ('lookup', 'names', 'latency [us]'))
+    print('-'*54)
+    for label, fn, lookup_args in lookups:
+        print('%-30s %8d %14.1f' % (label, len(lookup_args), latency(fn, lookup_args, args.repeat)))
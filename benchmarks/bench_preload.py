@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark of preloading the database tables with PdgApi.preload().
+
+Measures the time and memory needed for preloading, and compares the time and
+number of SQL statements for looking up the mass, branching fractions, decay
+products and best summary values of the branching fractions of many particles,
+with and without preloading.
+
+Usage: python benchmarks/bench_preload.py [-n PARTICLES] [--backend BACKEND]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import sqlalchemy
+
+import pdg
+
+
+def workload(api, pdgids):
+    for pdgid in pdgids:
+        for p in api.get(pdgid):
+            if p.has_mass_entry:
+                p.mass
+            for bf in p.branching_fractions():
+                bf.decay_products
+                bf.best_summary()
+
+
+def run(api, pdgids, statements):
+    statements.clear()
+    t0 = time.perf_counter()
+    workload(api, pdgids)
+    # Statements executed by backend sqlite3 are not seen by the SQLAlchemy event listener
+    return time.perf_counter() - t0, len(statements) if api.backend == 'sqlalchemy' else '-'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-n', '--particles', type=int, default=100,
+                        help='number of particle PDG Identifiers (default: 100)')
+    parser.add_argument('--backend', default='sqlalchemy', choices=pdg.backend.BACKENDS,
+                        help='backend (default: sqlalchemy)')
+    args = parser.parse_args()
+
+    api = pdg.connect(backend=args.backend)
+    pdgids = [plist.baseid for plist in api.get_particles()][:args.particles]
+    statements = []
+    sqlalchemy.event.listen(api.engine, 'before_cursor_execute',
+                            lambda conn, cursor, statement, *args: statements.append(statement))
+    print('SQLAlchemy %s, backend %s, %d particle PDG Identifiers' % (sqlalchemy.__version__, args.backend,
+                                                                      len(pdgids)))
+    print()
+    t_lazy, n_lazy = run(api, pdgids, statements)
+
+    # Memory is measured in a separate run, since tracing slows down preloading
+    api.clear_cache()
+    tracemalloc.start()
+    api.preload()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    api.clear_cache()
+    preloaded = api.preload()
+    print('%-16s %10s' % ('table', 'rows'))
+    print('-'*27)
+    for table_name, n_rows in preloaded.num_rows.items():
+        print('%-16s %10d' % (table_name, n_rows))
+    print('preload: %.3f s, %.1f MB' % (preloaded.load_time, memory/1024**2))
+    print()
+
+    t_preloaded, n_preloaded = run(api, pdgids, statements)
+    print('%-16s %10s %12s' % ('workload', 'time [s]', 'statements'))
+    print('-'*40)
+    print('%-16s %10.3f %12s' % ('lazy', t_lazy, n_lazy))
+    print('%-16s %10.3f %12s' % ('preloaded', t_preloaded, n_preloaded))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark of finding decays by their products with the in-memory product index.
+
+Compares finding all exclusive decays (data type BFX) with the given products
+by iterating over PdgApi.get_all('BFX') and the decay_products of each
+branching fraction with PdgApi.product_index, counting the SQL statements
+executed. The data objects compare item names, while the index also resolves
+aliases (e.g. K0S and K(S)0) and returns decays of all data types.
+
+Also compares canonicalizing the names in the descriptions of all exclusive
+decays of a particle with PdgApi.get_canonical_name() for every name with
+looking up all descriptions in one batch with PdgApi.find_decays().
+
+Usage: python benchmarks/bench_products.py [-n NUMBER] [-p PARTICLE] [PRODUCT ...]
+"""
+
+import argparse
+import time
+from collections import Counter
+
+import sqlalchemy
+
+import pdg
+from pdg.errors import PdgAmbiguousValueError, PdgNoDataError
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('products', nargs='*', default=['K0S', 'pi+'], help='decay products (default: K0S pi+)')
+    parser.add_argument('-n', '--number', type=int, default=1000, help='number of index queries (default: 1000)')
+    parser.add_argument('-p', '--particle', default='D+', help='particle whose decays are looked up (default: D+)')
+    args = parser.parse_args()
+
+    # Statements are counted with the SQLAlchemy event listener, so backend sqlite3 cannot be used
+    api = pdg.connect(backend='sqlalchemy')
+    statements = []
+    sqlalchemy.event.listen(api.engine, 'before_cursor_execute',
+                            lambda conn, cursor, statement, *args: statements.append(statement))
+    query = Counter(args.products)
+    print('SQLAlchemy %s, decays to %s' % (sqlalchemy.__version__, ' '.join(args.products)))
+    print()
+    print('%-32s %10s %12s %12s' % ('method', 'decays', 'time [ms]', 'statements'))
+    print('-'*69)
+    t0 = time.perf_counter()
+    n = 0
+    for bf in api.get_all('BFX'):
+        products = Counter()
+        for product in bf.decay_products:
+            products[product.item.name] += product.multiplier
+        if all(products[name] >= multiplicity for name, multiplicity in query.items()):
+            n += 1
+    print('%-32s %10d %12.1f %12d' % ('get_all() and decay_products', n, 1000*(time.perf_counter() - t0),
+                                      len(statements)))
+    statements.clear()
+    t0 = time.perf_counter()
+    index = api.product_index
+    print('%-32s %10s %12.1f %12d' % ('product_index', '', 1000*(time.perf_counter() - t0), len(statements)))
+    for exact in (False, True):
+        t0 = time.perf_counter()
+        for _ in range(args.number):
+            n = len(index.find(args.products, exact=exact))
+        print('%-32s %10d %12.3f %12d' % ('find(exact=%s) (per query)' % exact, n,
+                                          1000*(time.perf_counter() - t0)/args.number, len(statements)))
+
+    # Decays given as text, without decay chains and products described in text
+    decays = [bf.description for bf in
+              api.get_particle_by_name(args.particle).exclusive_branching_fractions(require_summary_data=False)
+              if api.find_decays([bf.description]) != [None]]
+    print()
+    print('%-32s %10s %12s %12s' % ('method (%d decays)' % len(decays), 'found', 'time [ms]', 'statements'))
+    print('-'*69)
+    api = pdg.connect(backend='sqlalchemy')
+    sqlalchemy.event.listen(api.engine, 'before_cursor_execute',
+                            lambda conn, cursor, statement, *args: statements.append(statement))
+    statements.clear()
+    t0 = time.perf_counter()
+    for decay in decays:
+        parent, products = decay.split('-->')
+        for name in parent.split() + products.split():
+            try:
+                api.get_canonical_name(name)
+            except (ValueError, PdgAmbiguousValueError, PdgNoDataError):      # e.g. multiplicities such as 2pi+
+                pass
+    print('%-32s %10s %12.1f %12d' % ('get_canonical_name()', '', 1000*(time.perf_counter() - t0), len(statements)))
+    statements.clear()
+    t0 = time.perf_counter()
+    api.product_index
+    print('%-32s %10s %12.1f %12d' % ('product_index', '', 1000*(time.perf_counter() - t0), len(statements)))
+    t0 = time.perf_counter()
+    n = sum(1 for found in api.find_decays(decays) if found)
+    print('%-32s %10d %12.1f %12d' % ('find_decays()', n, 1000*(time.perf_counter() - t0), len(statements)))
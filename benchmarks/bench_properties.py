@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark of PdgParticle.properties() and the lookups based on it.
+
+For many particles, counts the SQL statements executed and measures the time
+per call of properties() with different arguments (including using all data of
+the returned properties), and of the mass, width and lifetime lookups, which
+select the best of the particle's properties. Each particle is loaded before
+the measurement, so that only the statements needed for its properties are
+counted.
+
+Usage: python benchmarks/bench_properties.py [-n PARTICLES]
+"""
+
+import argparse
+import time
+
+import sqlalchemy
+
+import pdg
+from pdg.errors import PdgAmbiguousValueError, PdgNoDataError
+
+
+def use_properties(particle, *args):
+    for prop in particle.properties(*args):
+        prop.data_type, prop.data_flags, prop.description
+        prop.num_measurements
+        prop.best_summary()
+
+
+def lookup(particle, attribute):
+    try:
+        getattr(particle, attribute)
+    except (PdgNoDataError, PdgAmbiguousValueError, ZeroDivisionError):
+        pass
+
+
+CALLS = {
+    'properties()': lambda p: use_properties(p),
+    "properties('M')": lambda p: use_properties(p, 'M'),
+    "properties('BF%')": lambda p: use_properties(p, 'BF%'),
+    'mass': lambda p: lookup(p, 'mass'),
+    'width': lambda p: lookup(p, 'width'),
+    'lifetime': lambda p: lookup(p, 'lifetime'),
+}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-n', '--particles', type=int, default=100,
+                        help='number of particles (default: 100)')
+    args = parser.parse_args()
+
+    # Statements are counted with the SQLAlchemy event listener, so backend sqlite3 cannot be used
+    api = pdg.connect(backend='sqlalchemy')
+    particles = [p for plist in api.get_particles() for p in plist][:args.particles]
+    for p in particles:
+        p.charge
+    statements = []
+    sqlalchemy.event.listen(api.engine, 'before_cursor_execute',
+                            lambda conn, cursor, statement, *args: statements.append(statement))
+    print('SQLAlchemy %s, %d particles' % (sqlalchemy.__version__, len(particles)))
+    print()
+    print('%-20s %14s %14s' % ('call', 'time [ms]', 'statements'))
+    print('-'*50)
+    for name, call in CALLS.items():
+        statements.clear()
+        t0 = time.perf_counter()
+        for p in particles:
+            call(p)
+        t = time.perf_counter() - t0
+        print('%-20s %14.2f %14.1f' % (name, 1000*t/len(particles), len(statements)/len(particles)))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark of a full pass over the particle table with and without a session.
+
+For each particle, the name, MC ID, charge and mass are retrieved. The pass is
+timed for a plain SQLite connection (one pooled connection checkout per query),
+for the read-only tuned connection used for the bundled SQLite file, and for
+the latter within PdgApi.session(), where a single connection is used.
+
+Usage: python benchmarks/bench_session.py [-n RUNS]
+"""
+
+import argparse
+import os
+import time
+
+import sqlalchemy
+
+import pdg
+from pdg.api import PdgApi
+from pdg.errors import PdgApiError, PdgAmbiguousValueError, PdgNoDataError
+
+
+def particle_pass(api):
+    n = 0
+    for plist in api.get_particles():
+        for p in plist:
+            try:
+                p.name, p.mcid, p.charge, p.mass
+            except (PdgApiError, PdgAmbiguousValueError, PdgNoDataError):
+                pass
+            n += 1
+    return n
+
+
+def run(api, use_session, n_runs):
+    checkouts = [0]
+    sqlalchemy.event.listen(api.engine, 'checkout', lambda *args: checkouts.__setitem__(0, checkouts[0] + 1))
+    times = []
+    for _ in range(n_runs):
+        api.engine.dispose()
+        checkouts[0] = 0
+        t0 = time.perf_counter()
+        if use_session:
+            with api.session():
+                n = particle_pass(api)
+        else:
+            n = particle_pass(api)
+        times.append(time.perf_counter() - t0)
+    return n, min(times), checkouts[0]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-n', '--runs', type=int, default=3, help='number of runs (default: 3)')
+    args = parser.parse_args()
+
+    sqlite_file = os.path.join(os.path.dirname(pdg.__file__), pdg.SQLITE_FILENAME)
+    configurations = (
+        ('plain SQLite file', lambda: PdgApi('sqlite:///%s' % sqlite_file), False),
+        ('read-only tuned', lambda: pdg.connect(), False),
+        ('read-only tuned + session', lambda: pdg.connect(), True),
+    )
+    print('%-28s %10s %10s %12s' % ('particle table pass', 'particles', 'time [s]', 'checkouts'))
+    print('-'*63)
+    for label, make_api, use_session in configurations:
+        n, t, checkouts = run(make_api(), use_session, args.runs)
+        print('%-28s %10d %10.2f %12d' % (label, n, t, checkouts))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the per-call overhead of typical lazy-loading lookups.
+
+Times api.get('S008M').value and PdgParticle.mass for new objects on every
+call (so that the data is always loaded from the database) with the SQL
+statements prebuilt once per API object (see pdg.statements), and with the
+statements rebuilt for every query as was done previously. Run it with both
+SQLAlchemy 1.4 and 2.x, e.g. with "tox -e bench-SA14,bench-SA20".
+
+Usage: python benchmarks/bench_statements.py [-n CALLS]
+"""
+
+import argparse
+import time
+
+import sqlalchemy
+
+import pdg
+
+
+class NoStatementCache(dict):
+    "Replacement for PdgApi._statements that never stores a statement, so every query is rebuilt."
+    def __setitem__(self, key, value):
+        pass
+
+
+def time_per_call(fn, n_calls):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(n_calls):
+        fn()
+    return (time.perf_counter() - t0) / n_calls
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-n', '--calls', type=int, default=2000, help='number of calls (default: 2000)')
+    args = parser.parse_args()
+
+    api = pdg.connect()
+    pion = api.get_particle_by_name('pi+')
+    lookups = (
+        ("api.get('S008M').value", lambda: api.get('S008M').value),
+        ('PdgParticle.mass', lambda: pdg.particle.PdgParticle(api, pion.baseid, set_mcid=211).mass),
+    )
+    print('SQLAlchemy %s' % sqlalchemy.__version__)
+    print('%-26s %16s %16s' % ('lookup', 'prebuilt [us]', 'rebuilt [us]'))
+    print('-'*60)
+    for label, fn in lookups:
+        with api.session():
+            api._statements = {}
+            prebuilt = time_per_call(fn, args.calls)
+            api._statements = NoStatementCache()
+            rebuilt = time_per_call(fn, args.calls)
+            api._statements = {}
+        print('%-26s %16.1f %16.1f' % (label, 1e6*prebuilt, 1e6*rebuilt))
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark of request throughput for a single PdgApi shared by several threads.
+
+Each request looks up a randomly chosen particle by MC ID and retrieves its
+mass, the value of S008M (pi+- mass) via api.get(), and the list of its
+branching fractions, as a web service might do per request. The same number
+of requests is processed by thread pools of different sizes, all sharing one
+API object, and the throughput is reported for each pool size.
+
+Usage: python benchmarks/bench_threads.py [-n REQUESTS] [-t THREADS ...] [--in-memory] [--seed SEED]
+"""
+
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pdg
+from pdg.errors import PdgApiError, PdgAmbiguousValueError, PdgNoDataError
+
+
+def request(api, mcid):
+    try:
+        p = api.get_particle_by_mcid(mcid)
+        return p.mass, api.get('S008M').value, len(list(p.branching_fractions()))
+    except (PdgApiError, PdgAmbiguousValueError, PdgNoDataError):
+        return None
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('-n', '--requests', type=int, default=500, help='number of requests (default: 500)')
+    parser.add_argument('-t', '--threads', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='thread pool sizes (default: 1 2 4 8)')
+    parser.add_argument('--in-memory', action='store_true', help='use an in-memory copy of the database')
+    parser.add_argument('--seed', type=int, default=1, help='random seed (default: 1)')
+    args = parser.parse_args()
+
+    api = pdg.connect(in_memory=args.in_memory)
+    mcids = [p.mcid for plist in api.get_particles() for p in plist if p.mcid is not None]
+    random.seed(args.seed)
+    requests = [random.choice(mcids) for _ in range(args.requests)]
+
+    expected = [request(api, mcid) for mcid in requests]
+    print('%-10s %12s %14s' % ('threads', 'time [s]', 'requests/s'))
+    print('-'*38)
+    for n_threads in args.threads:
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            results = list(executor.map(lambda mcid: request(api, mcid), requests))
+        t = time.perf_counter() - t0
+        assert results == expected, 'inconsistent results with %d threads' % n_threads
+        print('%-10d %12.2f %14.1f' % (n_threads, t, len(requests)/t))
@@ -27,21 +27,43 @@ SQLITE_FILENAME = 'pdg.sqlite'      # Default SQLite database file used by this
 MIN_SCHEMA_VERSION = 0.3            # Minimum schema version required by this version of the API
 
 
-def connect(database_url: Optional[str]=None, pedantic: bool=False) -> PdgApi:
+def connect(database_url: Optional[str]=None, pedantic: bool=False, reflect: bool=False,
+            in_memory: bool=False, backend: Optional[str]=None, identity_map: int=0,
+            row_cache: int=10000) -> PdgApi:
     """Connect to PDG database and return configured PDG API object.
 
     Args:
         database_url: SQLAlchemy-style URL of the PDG database. If `None`, the
-            bundled SQLite file will be used.
+            bundled SQLite file will be used. Since this file is never
+            modified, it is opened in read-only mode with connections tuned
+            for read-only access.
         pedantic: Whether to enable the API's "pedantic" mode.
+        reflect: Whether to always reflect the database schema instead of using
+            the prebuilt table definitions for known schema versions.
+        in_memory: Whether to copy the database (which must be a SQLite file)
+            into memory. See :class:`~pdg.backend.InMemoryDatabase`.
+        backend: Backend for executing queries, either `'sqlalchemy'` or
+            `'sqlite3'` (see :class:`~pdg.api.PdgApi`). If `None`, the value of
+            environment variable `PDG_BACKEND` is used, and `'sqlalchemy'` if
+            it is not set.
+        identity_map: Maximum number of data objects kept in the identity map,
+            which returns the same object for equal lookups. Disabled if 0.
+            See :meth:`PdgApi.get_data_object <pdg.api.PdgApi.get_data_object>`.
+        row_cache: Maximum number of entries in the row cache shared by all data
+            objects. Disabled if 0. See :meth:`PdgApi.get_rows <pdg.api.PdgApi.get_rows>`.
 
     Returns:
         A :class:`~pdg.api.PdgApi` object.
     """
+    if backend is None:
+        backend = os.environ.get('PDG_BACKEND', 'sqlalchemy')
     if database_url is None:
-        api = PdgApi('sqlite:///%s' % os.path.join(os.path.dirname(__file__), SQLITE_FILENAME), pedantic)
+        api = PdgApi('sqlite:///%s' % os.path.join(os.path.dirname(__file__), SQLITE_FILENAME), pedantic, reflect,
+                     read_only=True, in_memory=in_memory, backend=backend, identity_map=identity_map,
+                     row_cache=row_cache)
     else:
-        api = PdgApi(database_url, pedantic)
+        api = PdgApi(database_url, pedantic, reflect, in_memory=in_memory, backend=backend,
+                     identity_map=identity_map, row_cache=row_cache)
     schema_version = float(api.info('schema_version'))
     if schema_version < MIN_SCHEMA_VERSION:
         raise PdgApiError('database schema v%s too old - need at least v%s' % (schema_version, MIN_SCHEMA_VERSION))
@@ -2,16 +2,34 @@
 PDG API top-level class.
 """
 
+import itertools
 import logging
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 import sqlalchemy
-from sqlalchemy import func, select, bindparam, distinct, desc
+from sqlalchemy import select, desc
+from sqlalchemy.engine import make_url
+from sqlalchemy.sql import Select
 import pdg
-from pdg.errors import PdgAmbiguousValueError, PdgInvalidPdgIdError, PdgNoDataError
+from pdg.backend import BACKENDS, InMemoryDatabase, Sqlite3Connection, create_engine
+from pdg.cache import LruCache
+from pdg.columnar import McidTable, get_particle_properties, get_particle_table
+from pdg.conjugation import ConjugationIndex
+from pdg.graph import DecayGraph
+from pdg.names import NameIndex
+from pdg.preload import PreloadedData
+from pdg.products import ProductIndex
+from pdg.errors import PdgApiError, PdgAmbiguousValueError, PdgInvalidPdgIdError, PdgNoDataError
+from pdg.schema import define_pdginfo, define_tables
+from pdg.statements import STATEMENTS
 from pdg.utils import parse_id
-from pdg.data import PdgData, PdgProperty, PdgMass, PdgWidth, PdgLifetime, PdgText
-from pdg.decay import PdgBranchingFraction, PdgBranchingRatio, PdgItem
+from pdg.data import PdgData, PdgProperty, PdgMass, PdgWidth, PdgLifetime, PdgSummaryValue, PdgText
+from pdg.decay import PdgBranchingFraction, PdgBranchingRatio
 from pdg.particle import PdgParticle, PdgParticleList
-from typing import Iterator, Optional, cast
+from typing import Any, Callable, Iterable, Iterator, Optional, cast
 
 
 # Map PDG data type codes to corresponding classes
@@ -38,8 +56,32 @@ DATA_TYPE_MAP = {
 
 
 class PdgApi:
-
-    def __init__(self, database_url: str, pedantic: bool=False):
+    """Access to the PDG database.
+
+    A single `PdgApi` object can be shared by all threads of a program. Each
+    query checks out its own connection from the engine's thread-safe
+    connection pool (or uses the connection pinned for the current thread by
+    :meth:`session`), and the database metadata cached by the API object is
+    loaded under a lock. The objects returned by the API, such as
+    :class:`~pdg.particle.PdgParticle`, can also be shared between threads:
+    their lazily loaded data is cached in plain dictionaries, but since each
+    cache entry is only ever set to the same value, concurrent loading of an
+    entry at most duplicates a query. Changing the :attr:`~pdg.data.PdgData.edition`
+    of an object, or the API's :attr:`pedantic` flag, while other threads use
+    it is not supported.
+
+    API objects, and thus also all data objects holding a reference to their
+    API object, can be pickled. An unpickled API object is the API object of the
+    current process for the same database and options, which is created if
+    needed (see :func:`get_process_api`), so that data objects can be passed to
+    worker processes (see :meth:`map`). API objects can also be used in
+    processes forked after their creation, where the connections inherited
+    from the parent process are discarded.
+    """
+
+    def __init__(self, database_url: str, pedantic: bool=False, reflect: bool=False,
+                 read_only: bool=False, in_memory: bool=False, backend: str='sqlalchemy',
+                 identity_map: int=0, row_cache: int=10000):
         """
         Args:
             database_url: URL of the PDG database to connect to. The default
@@ -49,22 +91,118 @@ class PdgApi:
                 where the choice of "PDG best value" might be ambiguous, no
                 assumptions are made and instead a
                 :exc:`~pdg.errors.PdgAmbiguousValueError` exception is raised.
+
+            reflect: Can be set `True` to always reflect the database schema
+                from the database. By default, the prebuilt table definitions
+                from :mod:`pdg.schema` are used if the database's schema version
+                is known, and the schema is only reflected otherwise.
+
+            read_only: Can be set `True` if the database is a SQLite file that
+                is not modified while the API is in use, such as the SQLite file
+                installed together with package `pdg`. The file is then opened
+                in immutable mode with connections tuned for read-only access
+                (see :func:`pdg.backend.create_engine`).
+
+            in_memory: Can be set `True` to copy the database (which must be a
+                SQLite file) into memory and use the in-memory copy for all
+                queries. The copy is shared by all connections. Its size and the
+                time needed for copying are available from attribute
+                :attr:`in_memory_database`.
+
+            backend: Can be set to `'sqlite3'` to execute all queries directly
+                with the `sqlite3` module of the Python standard library rather
+                than with SQLAlchemy, which substantially reduces the overhead
+                per query. Requires a SQLite database. See
+                :class:`pdg.backend.Sqlite3Connection`.
+
+            identity_map: Can be set to a positive number to enable the
+                identity map with (at most) this number of entries. See
+                :meth:`get_data_object`.
+
+            row_cache: Maximum number of entries in the row cache, which is
+                shared by all data objects (see :meth:`get_rows`). Can be set to
+                0 to disable the row cache.
+
+        Raises:
+            :exc:`~pdg.errors.PdgApiError`: If `backend` is unknown, or if
+                `backend` is `'sqlite3'` and the database is not a SQLite database.
         """
+        if backend not in BACKENDS:
+            raise PdgApiError('unknown backend %s - must be one of %s' % (backend, ', '.join(BACKENDS)))
+        if backend == 'sqlite3' and make_url(database_url).get_backend_name() != 'sqlite':
+            raise PdgApiError('backend sqlite3 requires a SQLite database, not %s' % database_url)
         self.database_url = database_url
-        self.engine = sqlalchemy.create_engine(self.database_url)
+        self.backend = backend
+        self._options = {'reflect': reflect, 'read_only': read_only, 'in_memory': in_memory, 'backend': backend,
+                         'identity_map': identity_map, 'row_cache': row_cache}
+        self.in_memory_database: Optional[InMemoryDatabase] = None
+        if in_memory:
+            self.in_memory_database = InMemoryDatabase(database_url)
+        self.engine = create_engine(self.database_url, read_only, self.in_memory_database)
+        self._copy_pending = False      # in-memory database to be copied again in a forked child (see _connect())
+        self._local = threading.local()     # per-thread state such as the session connection (see session())
+        self._statements: dict[tuple, Select] = {}    # see statement()
+        self._compiled_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()   # for backend sqlite3
         self.db = sqlalchemy.MetaData()
-        self.db.reflect(self.engine)
-        for k in self.info_keys():
-            setattr(self, k, self.info(k))
+        define_pdginfo(self.db)
+        self._info = self._read_info()
+        if reflect or not define_tables(self.db, self._info.get('schema_version')):
+            self.db = sqlalchemy.MetaData()
+            self.db.reflect(self.engine)
+        for k, v in self._info.items():
+            setattr(self, k, v)
         self.pedantic = pedantic
 
+        # Database metadata (editions, documentation table) loaded on first use
+        self._metadata: dict[str, list] = {}
+        self._lock = threading.RLock()      # protects loading of shared caches such as _metadata
+
+        # Identity map of data objects and the data object class for each PDG Identifier (see get_data_object())
+        self.identity_map: Optional[LruCache] = LruCache(identity_map) if identity_map else None
+        self._data_classes: dict[str, type[PdgData]] = {}
+
+        # Database rows loaded by all data objects (see get_rows()) and tables loaded by preload()
+        self.row_cache: Optional[LruCache] = LruCache(row_cache) if row_cache else None
+        self.preloaded: Optional[PreloadedData] = None
+        self._name_index: Optional[NameIndex] = None     # see name_index
+        self._conjugation_index: Optional[ConjugationIndex] = None     # see conjugation_index
+        self._product_index: Optional[ProductIndex] = None     # see product_index
+        self._decay_graphs: dict[tuple[str, bool], DecayGraph] = {}      # see get_decay_graph()
+
         self.logger = logging.getLogger('PDG')
         if not self.logger.handlers:
             self.logger.addHandler(logging.StreamHandler())
             self.logger.propagate = False
+        if self.in_memory_database is not None:
+            self.logger.info('Copied %s into memory (%.1f MB in %.3f s)', database_url,
+                             self.in_memory_database.size/1024**2, self.in_memory_database.copy_time)
 
         self._subdecay_warned = False # see PdgBranchingFraction.subdecays()
 
+        _apis.add(self)
+
+    def __reduce__(self) -> tuple:
+        "Pickle as a reference to the API object of the unpickling process (see :func:`get_process_api`)."
+        return get_process_api, (self.database_url, self.pedantic, self._options)
+
+    def _reset_after_fork(self) -> None:
+        """Discard database connections inherited by a forked child process.
+
+        The pooled connections of the parent process are dropped without closing
+        them, since SQLite connections must not be used across a fork. An
+        in-memory database is copied again by the first :meth:`connection` in
+        the child process, so that forks not using the API (e.g. for running
+        subprocesses) do not copy the database. The parent's in-memory copy is
+        kept (but not used) to avoid closing it in the child process.
+        """
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self.engine.dispose(close=False)
+        if self.in_memory_database is not None:
+            self._inherited_database = self.in_memory_database
+            self.in_memory_database = None
+            self._copy_pending = True
+
     def __str__(self) -> str:
         """Get description of the PDG API.
 
@@ -80,6 +218,216 @@ class PdgApi:
              ]
         return '\n'.join(s)
 
+    @contextmanager
+    def session(self) -> Iterator['PdgApi']:
+        """Pin a single database connection for all queries within a `with` block.
+
+        By default, every query checks out its own connection from the
+        engine's connection pool. Within a session, all queries issued from the
+        current thread, including those for the lazy loading of data by
+        :class:`~pdg.data.PdgData` objects, use the same connection. This
+        substantially reduces the overhead for batch workloads such as
+        iterating over all particles::
+
+            with api.session():
+                for plist in api.get_particles():
+                    for p in plist:
+                        print(p.name, p.mass)
+
+        Sessions can be nested, in which case the outermost session determines
+        the lifetime of the connection.
+
+        Returns:
+            Context manager yielding the API object itself.
+        """
+        if getattr(self._local, 'connection', None) is not None:
+            yield self
+            return
+        with self._connect() as conn:
+            self._local.connection = conn
+            try:
+                yield self
+            finally:
+                self._local.connection = None
+
+    def _connect(self) -> sqlalchemy.engine.Connection | Sqlite3Connection:
+        "Check out a new connection from the engine's connection pool for the selected backend."
+        if self._copy_pending:
+            with self._lock:
+                if self._copy_pending:
+                    self.in_memory_database = InMemoryDatabase(self.database_url)
+                    self.engine = create_engine(self.database_url, self._options['read_only'],
+                                                self.in_memory_database)
+                    self._copy_pending = False
+        if self.backend == 'sqlite3':
+            return Sqlite3Connection(self.engine, self._compiled_cache)
+        return self.engine.connect()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlalchemy.engine.Connection | Sqlite3Connection]:
+        """Get a database connection for executing queries.
+
+        Returns:
+            Context manager yielding the connection of the current
+            :func:`session`, or a new connection from the engine's connection
+            pool if no session is active. For backend `sqlite3`, the
+            connection is a :class:`~pdg.backend.Sqlite3Connection`.
+        """
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            yield conn
+        else:
+            with self._connect() as conn:
+                yield conn
+
+    def statement(self, name: str, *args) -> Select:
+        """Get a prebuilt SQL statement for one of the queries used by the API.
+
+        Each statement is built only once per API object (see
+        :mod:`pdg.statements`).
+
+        Args:
+            name: Name of the statement as given in :data:`pdg.statements.STATEMENTS`.
+            args: Additional arguments selecting a variant of the statement.
+
+        Returns:
+            SQLAlchemy `select()` construct with bound parameters.
+        """
+        key = (name,) + args
+        try:
+            return self._statements[key]
+        except KeyError:
+            statement = self._statements[key] = STATEMENTS[name](self.db, *args)
+            return statement
+
+    def get_rows(self, key: tuple, query: Select, params: dict) -> list[dict]:
+        """Get the rows returned by a query, using the row cache if enabled.
+
+        All data objects load their data from the database through this
+        method, so that the rows loaded by one object are shared with all other
+        objects of the API object that need the same rows. For example, all
+        :class:`~pdg.particle.PdgParticle` objects for the same particle share
+        the rows from table `pdgparticle`, and data objects whose edition is
+        changed only need to reload the rows that depend on the edition. The
+        row cache is an :class:`~pdg.cache.LruCache` available as attribute
+        :attr:`row_cache`. Its size is bounded by the number of cached
+        queries. Rows of tables loaded with :meth:`preload` are taken from
+        memory and are not added to the row cache.
+
+        Note:
+            This method is intended for internal API use. The returned rows are
+            shared and must not be modified.
+
+        Args:
+            key: Key identifying the rows in the row cache, given by the name of
+                the table, any column(s) selected and other conditions, the
+                column used for selecting the rows, and finally its value, e.g.
+                `('pdgitem', 'id', 42)` for the row with ID 42 of table
+                `pdgitem`, or `('pdgmeasurement', 'id', 'pdgid', 'S008M')` for
+                the IDs of the measurements of PDG Identifier S008M.
+            query: Query returning the rows (see :meth:`statement`).
+            params: Parameters of the query.
+
+        Returns:
+            List of rows as dictionaries.
+        """
+        preloaded = self.preloaded
+        if preloaded is not None:
+            rows = preloaded.get_rows(key)
+            if rows is not None:
+                return rows
+        if self.row_cache is not None:
+            rows = self.row_cache.get(key)
+            if rows is not None:
+                return rows
+        with self.connection() as conn:
+            rows = [dict(row._mapping) for row in conn.execute(query, params)]
+        if self.row_cache is not None:
+            self.row_cache.put(key, rows)
+        return rows
+
+    def preload(self, tables: Optional[Iterable[str]]=None, editions: Optional[Iterable[str]]=None) \
+            -> PreloadedData:
+        """Load the tables used by the data objects into memory.
+
+        The tables are read in one full-table scan each and indexed in memory,
+        after which all data objects get the rows of these tables from memory
+        instead of the database (see :mod:`pdg.preload`). With all tables
+        preloaded, looking up e.g. :attr:`PdgParticle.mass
+        <pdg.particle.PdgParticle.mass>`, the branching fractions of a
+        particle and their decay products, or the best summary value of a
+        property runs no SQL queries. This is intended for long-running
+        applications, which pay the time and memory needed for preloading once
+        at startup (see `benchmarks/bench_preload.py`). Calling
+        :meth:`clear_cache` discards the preloaded data.
+
+        Args:
+            tables: Names of the tables to be loaded. By default, all tables in
+                :data:`pdg.preload.PRELOAD_TABLES` are loaded.
+            editions: Editions for which the summary values are loaded. By
+                default, only the default edition is loaded. Data objects for
+                other editions load their summary values from the database.
+
+        Returns:
+            The preloaded data, also available as attribute :attr:`preloaded`,
+            including the number of rows read from each table and the time
+            needed for loading.
+
+        Raises:
+            :exc:`~pdg.errors.PdgApiError`: If a table cannot be preloaded.
+        """
+        preloaded = PreloadedData(self, tables, editions)
+        self.preloaded = preloaded
+        self.logger.info('Preloaded %s rows in %.3f s', sum(preloaded.num_rows.values()), preloaded.load_time)
+        return preloaded
+
+    def _read_info(self) -> dict[str, str]:
+        "Read all metadata from table `pdginfo` in a single query."
+        pdginfo_table = self.db.tables['pdginfo']
+        query = select(pdginfo_table.c.name, pdginfo_table.c.value)
+        with self.connection() as conn:
+            return {row.name: row.value for row in conn.execute(query)}
+
+    def _get_pdgdoc(self) -> list[dict]:
+        "Get all rows of the documentation table `pdgdoc` (loaded only once)."
+        with self._lock:
+            if 'pdgdoc' not in self._metadata:
+                pdgdoc_table = self.db.tables['pdgdoc']
+                query = select(pdgdoc_table).order_by(pdgdoc_table.c.id)
+                with self.connection() as conn:
+                    self._metadata['pdgdoc'] = [dict(row._mapping) for row in conn.execute(query)]
+            return self._metadata['pdgdoc']
+
+    def clear_cache(self) -> None:
+        """Discard all database metadata cached by the API object.
+
+        The metadata from table `pdginfo` (including the attributes set from
+        it), the list of editions, and the documentation table `pdgdoc` are
+        read only once and then served from memory. If the contents of the
+        database change while the API object is in use, this method must be
+        called for the changes to become visible. The identity map (see
+        :meth:`get_data_object`), the row cache (see :meth:`get_rows`), the
+        :attr:`name_index`, the :attr:`conjugation_index`, the
+        :attr:`product_index` and the decay graphs (see :meth:`get_decay_graph`)
+        are cleared as well, and any tables loaded with :meth:`preload` are
+        discarded.
+        """
+        with self._lock:
+            self._metadata = {}
+            self.preloaded = None
+            self._name_index = None
+            self._conjugation_index = None
+            self._product_index = None
+            self._decay_graphs = {}
+            self._data_classes = {}
+            if self.identity_map is not None:
+                self.identity_map.clear()
+            if self.row_cache is not None:
+                self.row_cache.clear()
+            self._info = self._read_info()
+            for k, v in self._info.items():
+                setattr(self, k, v)
+
     def info(self, key: str) -> str:
         """Get metadata info specified by key.
 
@@ -88,12 +436,9 @@ class PdgApi:
                 :func:`info_keys`.
 
         Returns:
-            Metadata info.
+            Metadata info, or `None` if there is no metadata for `key`.
         """
-        pdginfo_table = self.db.tables['pdginfo']
-        query = select(pdginfo_table.c.value).where(pdginfo_table.c.name == bindparam('key'))
-        with self.engine.connect() as conn:
-            return cast(str, conn.execute(query, {'key': key}).scalar())
+        return cast(str, self._info.get(key))
 
     def info_keys(self) -> list[str]:
         """Get list of all metadata keys.
@@ -101,18 +446,18 @@ class PdgApi:
         Returns:
             List of keys, each of which can be passed to :func:`info`.
         """
-        pdginfo_table = self.db.tables['pdginfo']
-        query = select(pdginfo_table.c.name)
-        with self.engine.connect() as conn:
-            return [k[0] for k in conn.execute(query).fetchall()]
+        return list(self._info)
 
     @property
     def editions(self) -> list[str]:
         """List of all editions of the Review for which the database has data."""
-        pdgdata_table = self.db.tables['pdgdata']
-        query = select(distinct(pdgdata_table.c.edition)).order_by(desc(pdgdata_table.c.edition))
-        with self.engine.connect() as conn:
-            return [e[0] for e in conn.execute(query).fetchall()]
+        with self._lock:
+            if 'editions' not in self._metadata:
+                pdgdata_table = self.db.tables['pdgdata']
+                query = select(pdgdata_table.c.edition).distinct().order_by(desc(pdgdata_table.c.edition))
+                with self.connection() as conn:
+                    self._metadata['editions'] = [e[0] for e in conn.execute(query).fetchall()]
+            return list(self._metadata['editions'])
 
     @property
     def default_edition(self) -> str:
@@ -139,20 +484,96 @@ class PdgApi:
             baseid, edition = parse_id(pdgid)
         else:
             baseid = pdgid
-        pdgid_table = self.db.tables['pdgid']
-        try:
-            query = select(pdgid_table.c.data_type).where(pdgid_table.c.pdgid == bindparam('pdgid'))
-            with self.engine.connect() as conn:
-                row = conn.execute(query, {'pdgid': baseid}).fetchone()
-                assert row is not None
-                data_type = row[0]
-        except Exception:
-            raise PdgInvalidPdgIdError('PDG Identifier %s not found' % pdgid)
+        cls = self._data_classes.get(baseid)
+        if cls is None:
+            # The row is shared through the row cache with the data object created below
+            rows = self.get_rows(('pdgid', 'pdgid', baseid), self.statement('pdgid'), {'pdgid': baseid})
+            if not rows:
+                raise PdgInvalidPdgIdError('PDG Identifier %s not found' % pdgid)
+            try:
+                cls = DATA_TYPE_MAP[rows[0]['data_type']]
+            except KeyError:
+                cls = PdgProperty
+            if self.identity_map is not None:
+                self._data_classes[baseid] = cls
+        return self.get_data_object(cls, baseid, edition)
+
+    def get_from_row(self, row: dict, edition: Optional[str]=None,
+                     summaries: Optional[list[dict]]=None) -> PdgData:
+        """Get `PdgData` object for a row of table `pdgid` that has already been loaded.
+
+        This is equivalent to :meth:`get`, but the returned object uses the
+        given row (and summary values) instead of loading them again.
+
+        Note:
+            This method is intended for internal API use.
+
+        Args:
+            row: Row of table `pdgid`.
+            edition: Edition from which the data should later be retrieved.
+            summaries: Rows of the summary values for the edition, as returned
+                by the `summary_values` statement (see :mod:`pdg.statements`).
+
+        Returns:
+            Object of the same class as returned by :meth:`get`.
+        """
         try:
-            cls = DATA_TYPE_MAP[data_type]
+            cls = DATA_TYPE_MAP[row['data_type']]
         except KeyError:
             cls = PdgProperty
-        return cls(self, baseid, edition)
+        obj = self.get_data_object(cls, row['pdgid'], edition)
+        obj.cache.setdefault('pdgid', row)
+        if summaries is not None:
+            obj.cache.setdefault('summary', [PdgSummaryValue(summary) for summary in summaries])
+        return obj
+
+    def get_data_object(self, cls: type[PdgData], pdgid: str, edition: Optional[str]=None,
+                        set_mcid: Optional[int]=None, set_name: Optional[str]=None,
+                        rows: Optional[list[dict]]=None) -> Any:
+        """Get a data object of a given class, using the identity map if enabled.
+
+        By default, every lookup (e.g. with :meth:`get`, :attr:`PdgItem.particle
+        <pdg.particle.PdgItem.particle>` or :attr:`PdgParticle.antiparticle
+        <pdg.particle.PdgParticle.antiparticle>`) creates a new data object,
+        which loads its data from the database again. If the identity map is
+        enabled (see parameter `identity_map` of :class:`PdgApi`), equal lookups
+        instead return the same object, together with all data it has already
+        loaded, as long as the object has not been evicted from the identity
+        map. The identity map is an :class:`~pdg.cache.LruCache` available as
+        attribute :attr:`identity_map`, whose
+        :meth:`~pdg.cache.LruCache.stats` method gives the number of hits and
+        misses. Since the returned objects are shared, their edition should
+        not be changed when the identity map is enabled.
+
+        Note:
+            This method is intended for internal API use.
+
+        Args:
+            cls: :class:`~pdg.data.PdgData` subclass.
+            pdgid: PDG Identifier.
+            edition: Edition, if not specified as part of `pdgid`.
+            set_mcid: MC ID (only for :class:`~pdg.particle.PdgParticle`).
+            set_name: Particle name (only for :class:`~pdg.particle.PdgParticle`).
+            rows: Rows of table `pdgparticle` already loaded for the PDG
+                Identifier (only for :class:`~pdg.particle.PdgParticleList`).
+
+        Returns:
+            Object of class `cls`.
+        """
+        kwargs: dict[str, Any] = {}
+        if set_mcid is not None or set_name is not None:
+            kwargs = {'set_mcid': set_mcid, 'set_name': set_name}
+        if rows is not None:
+            kwargs = {'rows': rows}
+        if self.identity_map is None:
+            return cls(self, pdgid, edition, **kwargs)
+        baseid, pdgid_edition = parse_id(pdgid)
+        key = (cls, baseid, pdgid_edition or edition or self.default_edition, set_mcid, set_name)
+        obj = self.identity_map.get(key)
+        if obj is None:
+            obj = cls(self, pdgid, edition, **kwargs)
+            self.identity_map.put(key, obj)
+        return obj
 
     def get_all(self, data_type_key=None, edition=None) -> Iterator[PdgData]:
         """Get iterator over all PDG Identifiers / quantities.
@@ -168,18 +589,144 @@ class PdgApi:
             Iterator over objects of class :class:`~pdg.data.PdgProperty` or
             derived classes.
         """
-        pdgid_table = self.db.tables['pdgid']
-        query = select(pdgid_table.c.pdgid, pdgid_table.c.data_type)
-        if data_type_key is not None:
-            query = query.where(pdgid_table.c.data_type == bindparam('data_type_key'))
-        query = query.order_by(pdgid_table.c.sort)
-        with self.engine.connect() as conn:
+        query = self.statement('all_pdgids', data_type_key is not None)
+        with self.connection() as conn:
             for item in conn.execute(query, {'data_type_key': data_type_key}):
                 try:
                     cls = DATA_TYPE_MAP[item.data_type]
                 except KeyError:
                     cls = PdgProperty
-                yield cls(self, item.pdgid, edition)
+                yield self.get_data_object(cls, item.pdgid, edition)
+
+    @property
+    def name_index(self) -> NameIndex:
+        """In-memory index of all particle names (built on first use).
+
+        The index is used for looking up particles by name (see
+        :meth:`get_particle_by_name`), and can be used directly for prefix
+        and fuzzy searches of particle names, e.g.::
+
+            api.name_index.prefix_search('K_1')     # ['K_1(1270)', 'K_1(1270)+', ...]
+            api.name_index.fuzzy_search('Lambda_c')
+
+        See :class:`~pdg.names.NameIndex`.
+        """
+        with self._lock:
+            if self._name_index is None:
+                self._name_index = NameIndex(self)
+                self.logger.debug('Built %s', self._name_index)
+            return self._name_index
+
+    @property
+    def conjugation_index(self) -> ConjugationIndex:
+        """In-memory index of the charge conjugates of all particles, items and decays (built on first use).
+
+        The index is used by :attr:`PdgParticle.antiparticle
+        <pdg.particle.PdgParticle.antiparticle>` and
+        :meth:`PdgBranchingFraction.conjugates
+        <pdg.decay.PdgBranchingFraction.conjugates>`, and can be used
+        directly for conjugating MC IDs, items and lists of decay products,
+        e.g.::
+
+            api.conjugation_index.conjugate_mcid(-521)     # 521
+
+        See :class:`~pdg.conjugation.ConjugationIndex`.
+        """
+        with self._lock:
+            if self._conjugation_index is None:
+                self._conjugation_index = ConjugationIndex(self)
+                self.logger.debug('Built %s', self._conjugation_index)
+            return self._conjugation_index
+
+    @property
+    def product_index(self) -> ProductIndex:
+        """In-memory index of the decay products of all decays (built on first use).
+
+        The index is used for finding decays by their products without
+        queries, e.g.::
+
+            api.product_index.find(['K(S)0', 'pi+'])        # all decays to K(S)0 pi+ (anything)
+            api.product_index.find(['K-', 'pi+', 'pi+'], exact=True)
+            api.product_index.parents(['J/psi(1S)'])        # ['psi(2S)', ...]
+
+        See :class:`~pdg.products.ProductIndex`.
+        """
+        with self._lock:
+            if self._product_index is None:
+                self._product_index = ProductIndex(self)
+                self.logger.debug('Built %s', self._product_index)
+            return self._product_index
+
+    def find_decays(self, decays: Iterable[str], charge_conjugates: bool=False) -> list[Optional[list[str]]]:
+        """Find the PDG Identifiers of decays given as text.
+
+        All names in the decays are resolved once (with aliases resolved to
+        their particles), and the decays are looked up by their canonical
+        signature in the :attr:`product_index`, without queries, e.g.::
+
+            api.find_decays(['D+ --> K- 2pi+', 'B+ -> J/psi K+', '411 -> -321 211 211'])
+            # [['S031.1'], ['S041.3'], ['S031.1']]
+
+        See :meth:`ProductIndex.find_decays <pdg.products.ProductIndex.find_decays>`
+        for the syntax of the decays.
+
+        Args:
+            decays: Decays, each given by the parent and the decay products
+                (names or MC IDs) separated by an arrow.
+            charge_conjugates: Can be set to `True` to also find the charge
+                conjugate decays.
+
+        Returns:
+            For each decay, the PDG Identifiers of the branching fractions of
+            all matching decays in the database (empty if there are none), or
+            `None` if the text is not a decay or contains an unknown name or
+            MC ID.
+        """
+        return self.product_index.find_decays(decays, charge_conjugates)
+
+    def get_decay_graph(self, edition: Optional[str]=None) -> DecayGraph:
+        """Get the in-memory graph of all decays (built on first use for each edition).
+
+        The graph is used for exploring decay chains without queries, e.g.::
+
+            graph = api.get_decay_graph()
+            for chain in graph.chains('B0', 2, min_branching_fraction=1e-3):
+                print(chain.branching_fraction, [mode.description for mode in chain.modes])
+
+        See :class:`~pdg.graph.DecayGraph`.
+
+        Args:
+            edition: Can be set to a specific edition, from which the
+                branching fractions are taken.
+
+        Returns:
+            :class:`~pdg.graph.DecayGraph` object.
+        """
+        key = (edition or self.default_edition, self.pedantic)
+        with self._lock:
+            if key not in self._decay_graphs:
+                self._decay_graphs[key] = DecayGraph(self, key[0])
+                self.logger.debug('Built %s', self._decay_graphs[key])
+            return self._decay_graphs[key]
+
+    def get_particle_from_row(self, row: dict, edition: Optional[str]=None) -> PdgParticle:
+        """Get `PdgParticle` object for a row of table `pdgparticle` that has already been loaded.
+
+        Note:
+            This method is intended for internal API use.
+
+        Args:
+            row: Row of table `pdgparticle`.
+            edition: Edition from which the data should later be retrieved.
+
+        Returns:
+            :class:`~pdg.particle.PdgParticle` object for the particle state
+            given by the row.
+        """
+        particle = self.get_data_object(PdgParticle, row['pdgid'], edition, set_mcid=row['mcid'],
+                                        set_name=row['name'])
+        particle.cache.setdefault('pdgparticle', row)
+        return particle
 
     def _get_particles_by_name(self, name: str, case_sensitive: bool=True,
                                edition: Optional[str]=None, unique: bool=True) \
@@ -203,22 +750,23 @@ class PdgApi:
                 if `unique` is `True` and the :class:`~pdg.particle.PdgItem`
                 refers to more than one particle.
         """
-        pdgitem_table = self.db.tables['pdgitem']
-        query = select(pdgitem_table.c.id)
-        if case_sensitive:
-            query = query.where(pdgitem_table.c.name == bindparam('name'))
-        else:
+        name_index = self.name_index
+        item_ids = name_index.item_ids(name, case_sensitive)
+        if not case_sensitive:
             name = name.lower()
-            query = query.where(func.lower(pdgitem_table.c.name) == bindparam('name'))
-        with self.engine.connect() as conn:
-            matches = conn.execute(query, {'name': name}).fetchall()
-        if len(matches) == 0:
+        if len(item_ids) == 0:
             raise ValueError('No particle found with name %s' % name)
-        elif len(matches) == 1:
-            item = PdgItem(self, matches[0].id, edition=edition)
-            return item.particle if unique else item.particles
-        else:
-            raise PdgAmbiguousValueError('More than one PDGITEM named %s', name)
+        elif len(item_ids) > 1:
+            raise PdgAmbiguousValueError('More than one PDGITEM named %s' % name)
+        # Same as PdgItem(self, item_ids[0], edition).particle(s), but without queries
+        if not unique:
+            return [self.get_particle_from_row(row, edition) for row in name_index.particles(item_ids[0])]
+        row = name_index.particle(item_ids[0])
+        if row is None:
+            if name_index.particles(item_ids[0]):
+                raise PdgAmbiguousValueError('No unique PDGPARTICLE for PDGITEM %s' % item_ids[0])
+            raise PdgNoDataError('No PDGPARTICLE for PDGITEM %s' % item_ids[0])
+        return self.get_particle_from_row(row, edition)
 
     def get_particle_by_name(self, name: str, case_sensitive: bool=True,
                              edition: Optional[str]=None) -> PdgParticle:
@@ -280,18 +828,119 @@ class PdgApi:
         Returns:
             :class:`~pdg.particle.PdgParticle` object.
         """
-        pdgparticle_table = self.db.tables['pdgparticle']
-        query = select(distinct(pdgparticle_table.c.pdgid))
-        query = query.where(pdgparticle_table.c.mcid == bindparam('mcid'))
-        with self.engine.connect() as conn:
+        query = self.statement('particle_pdgids_by_mcid')
+        with self.connection() as conn:
             matches = [p.pdgid for p in conn.execute(query, {'mcid': mcid})]
         if len(matches) == 0:
             raise ValueError('No particle found with MC ID %s' % mcid)
         elif len(matches) == 1:
-            return PdgParticle(self, matches[0], edition, set_mcid=mcid)
+            return self.get_data_object(PdgParticle, matches[0], edition, set_mcid=mcid)
         else:
             raise ValueError('MC number %s matches %i particles with PDG Identifiers %s' % (mcid, len(matches), matches))
 
+    def get_particle_properties(self, mcids: Iterable[int], fields: Optional[Iterable[str]]=None,
+                                units: Optional[str | dict[str, str]]=None, edition: Optional[str]=None) \
+            -> dict[str, Any]:
+        """Get mass, width, lifetime, charge and errors of many particles as columns.
+
+        The values are the same as those of the properties of the same name of
+        :class:`~pdg.particle.PdgParticle` for the particles returned by
+        :meth:`get_particle_by_mcid`, but are loaded with three queries
+        independent of the number of particles (see :mod:`pdg.columnar`).
+        Requires NumPy.
+
+        Args:
+            mcids: Monte Carlo IDs, e.g. a list or NumPy array.
+            fields: Names of the fields to get, from `'mass'`, `'mass_error'`,
+                `'width'`, `'width_error'`, `'lifetime'`, `'lifetime_error'`
+                and `'charge'` (default: all).
+            units: Units of the fields, by default GeV for masses and widths,
+                seconds for lifetimes, and `e` for the charge. A string (e.g.
+                `'MeV'`) is used for the masses and widths and their errors,
+                a dictionary gives the units by field name.
+            edition: Can be set to a specific edition, from which the summary
+                values are taken.
+
+        Returns:
+            Dictionary with a NumPy masked array of floats for each field, with
+            one element for each MC ID. Values are masked if the corresponding
+            property of the :class:`~pdg.particle.PdgParticle` would be `None`
+            or raise an exception (e.g. for limits), and for MC IDs not found.
+
+        Raises:
+            :exc:`~pdg.errors.PdgApiError`: If NumPy is not installed, or if a
+                field or unit conversion is not supported.
+        """
+        return get_particle_properties(self, mcids, fields, units, edition)
+
+    def get_mcid_table(self, fields: Optional[Iterable[str]]=None, units: Optional[str | dict[str, str]]=None,
+                       edition: Optional[str]=None) -> McidTable:
+        """Get a lookup table from MC IDs to particle properties for vectorized lookups.
+
+        The table is computed once (like :meth:`get_particle_properties` for
+        all MC IDs) and can then be used to look up the properties for arrays
+        of MC IDs without any database queries, e.g.::
+
+            table = api.get_mcid_table(fields=['mass', 'charge'])
+            columns = table.lookup(numpy.array([211, -321, 0]))
+
+        Requires NumPy.
+
+        Args:
+            fields: Fields as for :meth:`get_particle_properties` (default:
+                all). The PDG Identifiers and names of the particles are always
+                included as fields `'pdgid'` and `'name'`.
+            units: Units as for :meth:`get_particle_properties`.
+            edition: Can be set to a specific edition, from which the summary
+                values are taken.
+
+        Returns:
+            :class:`~pdg.columnar.McidTable` object.
+
+        Raises:
+            :exc:`~pdg.errors.PdgApiError`: If NumPy is not installed, or if a
+                field or unit conversion is not supported.
+        """
+        return McidTable(self, fields, units, edition)
+
+    def particle_table(self, edition: Optional[str]=None, units: Optional[str | dict[str, str]]='GeV') \
+            -> dict[str, Any]:
+        """Get all particles with their properties as columns.
+
+        The table has one row for every particle returned by
+        :meth:`get_particles` (in the same order), including particles without
+        MC ID, and is loaded with three queries independent of the number of
+        particles (see :mod:`pdg.columnar`), e.g.::
+
+            table = api.particle_table(units='MeV')
+            heavy = table['name'][table['mass'] > 5000]
+
+        Requires NumPy.
+
+        Args:
+            edition: Can be set to a specific edition, from which the summary
+                values are taken.
+            units: Units as for :meth:`get_particle_properties`. A string (by
+                default `'GeV'`) is used for the masses and widths and their
+                errors.
+
+        Returns:
+            Dictionary with a NumPy masked array for each column, with the
+            same values as the properties of the same name of
+            :class:`~pdg.particle.PdgParticle`: `'pdgid'`, `'name'`, `'mcid'`,
+            the fields of :meth:`get_particle_properties`, `'quantum_I'`,
+            `'quantum_G'`, `'quantum_J'`, `'quantum_P'`, `'quantum_C'`,
+            `'is_boson'`, `'is_quark'`, `'is_lepton'`, `'is_meson'`,
+            `'is_baryon'`, `'has_mass_entry'`, `'has_width_entry'` and
+            `'has_lifetime_entry'`. Values are masked if the property would be
+            `None` or raise an exception (e.g. for limits).
+
+        Raises:
+            :exc:`~pdg.errors.PdgApiError`: If NumPy is not installed, or if a
+                unit conversion is not supported.
+        """
+        return get_particle_table(self, units, edition)
+
     def get_particles(self, edition: Optional[str]=None) -> Iterator[PdgParticleList]:
         """Get iterator over all particles.
 
@@ -302,14 +951,48 @@ class PdgApi:
         Returns:
             Iterator over :class:`~pdg.particle.PdgParticleList` objects.
         """
-        pdgid_table = self.db.tables['pdgid']
-        pdgparticle_table = self.db.tables['pdgparticle']
-        query = select(distinct(pdgid_table.c.pdgid)).join(pdgparticle_table)
-        query = query.where(pdgid_table.c.data_type == 'PART')
-        query = query.order_by(pdgid_table.c.sort)
-        with self.engine.connect() as conn:
-            for item in conn.execute(query):
-                yield PdgParticleList(self, item.pdgid, edition)
+        # The rows of all particles are loaded in a single query and passed to the lists
+        query = self.statement('all_particles')
+        with self.connection() as conn:
+            rows = [dict(row._mapping) for row in conn.execute(query)]
+        for pdgid, particle_rows in itertools.groupby(rows, key=lambda row: row['pdgid']):
+            yield self.get_data_object(PdgParticleList, pdgid, edition, rows=list(particle_rows))
+
+    def map(self, fn: Callable[[Any], Any], iterable: Iterable, processes: Optional[int]=None,
+            chunksize: Optional[int]=None) -> list:
+        """Apply a function to all items of an iterable using a pool of worker processes.
+
+        The items, typically the data objects returned by :meth:`get_all` or
+        :meth:`get_particles`, are pickled and sent to the worker processes,
+        where they are bound to the worker's API object for the same database.
+        For example, the masses of all particles can be retrieved by::
+
+            def mass(plist):
+                return [(p.name, p.mass if p.has_mass_entry else None) for p in plist]
+
+            masses = api.map(mass, api.get_particles(), processes=4)
+
+        Args:
+            fn: Function to apply to each item. Must be picklable, i.e. defined
+                at module level.
+            iterable: Items to process. They are all retrieved before any work
+                is submitted to the workers.
+            processes: Number of worker processes (default: number of CPUs).
+                With `processes=1`, the items are processed in the current
+                process.
+            chunksize: Number of items sent to a worker at a time. By default,
+                the items are split into about four chunks per worker.
+
+        Returns:
+            List of the results of `fn` for all items, in the order of the items.
+        """
+        items = list(iterable)
+        if processes == 1:
+            return [fn(item) for item in items]
+        if chunksize is None:
+            chunksize = max(1, len(items) // (4*(processes or os.cpu_count() or 1)))
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            return list(executor.map(fn, items, chunksize=chunksize))
 
     def get_canonical_name(self, name: str) -> str:
         """Get the canonical name of a particle.
@@ -347,21 +1030,12 @@ class PdgApi:
             `comment`) describing the meaning of the value or flag.
 
         Raises:
-            :exc:`~pdg.errors.AttributeError`: If no documentation is found.
-        """
-        pdgdoc_table = self.db.tables['pdgdoc']
-        query = select(pdgdoc_table)
-        query = query.where(pdgdoc_table.c.table_name == bindparam('table_name'))
-        query = query.where(pdgdoc_table.c.column_name == bindparam('column_name'))
-        query = query.where(pdgdoc_table.c.value == bindparam('value'))
-        with self.engine.connect() as conn:
-            try:
-                row = conn.execute(query, {'table_name': table_name, 'column_name': column_name, 'value': key}).\
-                    fetchone()
-                assert row is not None
-                return dict(row._mapping)
-            except AttributeError:
-                raise PdgNoDataError('No documentation for value %s in table %s.%s' % (key, table_name, column_name))
+            :exc:`~pdg.errors.PdgNoDataError`: If no documentation is found.
+        """
+        for row in self._get_pdgdoc():
+            if row['table_name'] == table_name and row['column_name'] == column_name and row['value'] == key:
+                return dict(row)
+        raise PdgNoDataError('No documentation for value %s in table %s.%s' % (key, table_name, column_name))
 
     def _doc_keys(self, table_name: str, column_name: str, as_text: bool) \
             -> str | list[dict]:
@@ -377,12 +1051,6 @@ class PdgApi:
             possible values for the column and table in question. Otherwise,
             a list of mappings, one per possible value.
         """
-        pdgdoc_table = self.db.tables['pdgdoc']
-        query = select(pdgdoc_table)
-        query = query.where(pdgdoc_table.c.table_name == table_name)
-        query = query.where(pdgdoc_table.c.column_name == column_name)
-        query.order_by(pdgdoc_table.c.indicator, pdgdoc_table.c.value)
-
         lines: list[str] = []
         mappings: list[dict] = []
 
@@ -390,12 +1058,13 @@ class PdgApi:
             lines.append('Key value     Description')
             lines.append('-'*60)
 
-        with self.engine.connect() as conn:
-            for item in conn.execute(query):
-                if as_text:
-                    lines.append('  %-8s    %s' % (item.value, item.description))
-                else:
-                    mappings.append(dict(item._mapping))
+        for item in self._get_pdgdoc():
+            if item['table_name'] != table_name or item['column_name'] != column_name:
+                continue
+            if as_text:
+                lines.append('  %-8s    %s' % (item['value'], item['description']))
+            else:
+                mappings.append(dict(item))
         if as_text:
             return '\n'.join(lines)
         else:
@@ -463,12 +1132,6 @@ class PdgApi:
         Returns:
             Documentation of all possible `value_type` values for a summary value.
         """
-        pdgdoc_table = self.db.tables['pdgdoc']
-        query = select(pdgdoc_table)
-        query = query.where(pdgdoc_table.c.table_name == 'PDGDATA')
-        query = query.where(pdgdoc_table.c.column_name == 'VALUE_TYPE')
-        query.order_by(pdgdoc_table.c.indicator, pdgdoc_table.c.value)
-
         lines: list[str] = []
         mappings: list[dict] = []
 
@@ -476,13 +1139,56 @@ class PdgApi:
             lines.append('Key value   Indicator            Description')
             lines.append('-'*60)
 
-        with self.engine.connect() as conn:
-            for item in conn.execute(query):
-                if as_text:
-                    lines.append('  %-8s  %-20s  %s' % (item.value, item.indicator, item.description))
-                else:
-                    mappings.append(dict(item._mapping))
+        for item in self._get_pdgdoc():
+            if item['table_name'] != 'PDGDATA' or item['column_name'] != 'VALUE_TYPE':
+                continue
+            if as_text:
+                lines.append('  %-8s  %-20s  %s' % (item['value'], item['indicator'], item['description']))
+            else:
+                mappings.append(dict(item))
         if as_text:
             return '\n'.join(lines)
         else:
             return mappings
+
+
+# All API objects of the current process, and the API objects created for
+# unpickling, which are kept alive for subsequent unpickling
+_apis: 'weakref.WeakSet[PdgApi]' = weakref.WeakSet()
+_process_apis: list[PdgApi] = []
+
+
+def get_process_api(database_url: str, pedantic: bool=False, options: Optional[dict[str, Any]]=None) -> PdgApi:
+    """Get the API object of the current process for a database and options.
+
+    This is used when unpickling API objects (and data objects referencing
+    them), so that all objects unpickled in a process share the first API
+    object created for the same database and options, including the caches of
+    this API object. If no API object exists yet in the current process, a new
+    one is created and kept for the lifetime of the process.
+
+    Args:
+        database_url: URL of the PDG database.
+        pedantic: Whether to use pedantic mode.
+        options: Other keyword arguments of :class:`PdgApi`.
+
+    Returns:
+        Existing or newly created API object.
+    """
+    options = options or {}
+    for api in list(_apis):
+        if api.database_url == database_url and api.pedantic == pedantic and api._options == options:
+            return api
+    api = PdgApi(database_url, pedantic, **options)
+    _process_apis.append(api)
+    return api
+
+
+def _after_fork_in_child() -> None:
+    "Reset the database connections of all API objects in a forked child process."
+    for api in list(_apis):
+        api._reset_after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
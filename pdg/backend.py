@@ -0,0 +1,340 @@
+"""
+Database engine setup for the PDG API.
+
+All database access of the API goes through a SQLAlchemy engine created by
+:func:`create_engine`. For SQLite database files that do not change while the
+API is in use (such as the file bundled with package `pdg`), the connections
+are opened in read-only, immutable mode and tuned for read-only access.
+Alternatively, a SQLite database file can be copied into memory (see
+:class:`InMemoryDatabase`).
+
+Engines for SQLite databases use a `QueuePool` of connections that can be
+used from any thread, so that a single engine (and thus a single
+:class:`~pdg.api.PdgApi` object) can be shared by all threads of a program.
+
+For SQLite databases, queries can also be executed directly with the `sqlite3`
+module of the Python standard library instead of SQLAlchemy's `Connection`
+(see :class:`Sqlite3Connection`). The statements are still built with
+SQLAlchemy, but compiled only once, and connections are still taken from the
+engine's connection pool.
+"""
+
+import os
+import sqlite3
+import time
+import uuid
+import weakref
+from collections import namedtuple
+from urllib.parse import quote
+
+import sqlalchemy
+from sqlalchemy.engine import Dialect, Engine, URL, make_url
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql import ClauseElement
+from typing import Any, Callable, Iterator, Optional
+
+from pdg.errors import PdgApiError
+
+
+# SQLite pragmas applied to every connection to a read-only SQLite file
+READ_ONLY_PRAGMAS = {
+    'query_only': 1,
+    'mmap_size': 256*1024*1024,     # memory-map up to 256 MB of the database file
+    'cache_size': -64*1024,         # use a page cache of up to 64 MB (negative value is in kB)
+    'temp_store': 2,                # keep temporary tables and indices in memory
+}
+
+
+def is_sqlite_file(database_url: str | URL) -> bool:
+    """Check whether a database URL refers to a SQLite database file.
+
+    Args:
+        database_url: SQLAlchemy-style database URL.
+
+    Returns:
+        `True` for SQLite URLs with a file name, `False` for in-memory SQLite
+        databases and other database systems.
+    """
+    url = make_url(database_url)
+    return url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:')
+
+
+def read_only_url(database_url: str | URL) -> URL:
+    """Get URL for opening a SQLite database file in read-only, immutable mode.
+
+    Args:
+        database_url: SQLAlchemy-style URL of a SQLite database file.
+
+    Returns:
+        SQLAlchemy URL using a SQLite URI filename with `mode=ro` and
+        `immutable=1`.
+    """
+    url = make_url(database_url)
+    if url.database.startswith('file:'):
+        uri = url.database
+    else:
+        uri = 'file:%s' % quote(os.path.abspath(url.database))
+    query = dict(url.query)
+    query.update({'uri': 'true', 'mode': 'ro', 'immutable': '1'})
+    return URL.create(url.drivername, database=uri, query=query)
+
+
+# SQLite pragmas applied to every connection to an in-memory copy of the database
+IN_MEMORY_PRAGMAS = {
+    'query_only': 1,
+    'read_uncommitted': 1,          # no table locks needed for reading from the shared cache
+}
+
+
+def _pragma_handler(pragmas: dict[str, int]) -> Callable:
+    """Get an event handler applying SQLite pragmas to new connections.
+
+    Args:
+        pragmas: Mapping of pragma names to values.
+
+    Returns:
+        Handler for the engine's `connect` event.
+    """
+    def set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas.items():
+            cursor.execute('PRAGMA %s = %s' % (pragma, value))
+        cursor.close()
+    return set_pragmas
+
+
+class InMemoryDatabase:
+    """An in-memory copy of a SQLite database file.
+
+    The database file is copied using the SQLite backup API into a named
+    in-memory database in shared-cache mode. All connections created by
+    :meth:`connect` share this single copy, so the database can be used safely
+    from a pool of connections (and from multiple threads) without keeping more
+    than one copy in memory. The copy is kept alive by a connection held by this
+    object until :meth:`close` is called or the object is deleted.
+    """
+    def __init__(self, database_url: str):
+        """
+        Args:
+            database_url: SQLAlchemy-style URL of the SQLite database file to
+                be copied.
+
+        Raises:
+            :exc:`~pdg.errors.PdgApiError`: If `database_url` does not refer to a
+                SQLite database file.
+        """
+        if not is_sqlite_file(database_url):
+            raise PdgApiError('in-memory mode requires a SQLite database file, not %s' % database_url)
+        self.uri = 'file:pdg-%s?mode=memory&cache=shared' % uuid.uuid4().hex
+        t0 = time.perf_counter()
+        self._connection: Optional[sqlite3.Connection] = self.connect()
+        url = make_url(database_url)
+        if url.database.startswith('file:'):
+            source = sqlite3.connect(url.database, uri=True)
+        else:
+            source = sqlite3.connect('file:%s?mode=ro' % quote(os.path.abspath(url.database)), uri=True)
+        try:
+            source.backup(self._connection)
+        finally:
+            source.close()
+        self.copy_time = time.perf_counter() - t0
+        page_count = self._connection.execute('PRAGMA page_count').fetchone()[0]
+        page_size = self._connection.execute('PRAGMA page_size').fetchone()[0]
+        self.size = page_count * page_size
+
+    def __repr__(self) -> str:
+        "Get a concise representation including size and copy time."
+        return 'InMemoryDatabase(size=%.1f MB, copy_time=%.3f s)' % (self.size/1024**2, self.copy_time)
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a new connection to the in-memory database.
+
+        Returns:
+            A `sqlite3` connection that can be used from any thread.
+        """
+        return sqlite3.connect(self.uri, uri=True, check_same_thread=False)
+
+    def close(self) -> None:
+        "Release the in-memory database once all other connections are closed."
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def create_engine(database_url: str, read_only: bool=False,
+                  in_memory: Optional[InMemoryDatabase]=None) -> Engine:
+    """Create the SQLAlchemy engine used by the PDG API.
+
+    Args:
+        database_url: SQLAlchemy-style URL of the PDG database.
+        read_only: If `True` and the database is a SQLite file, the file is
+            opened in read-only, immutable mode and all connections use the
+            pragmas given by `READ_ONLY_PRAGMAS`. This must only be used for
+            files that are not modified while the API is in use.
+        in_memory: If set, the engine connects to this in-memory copy of the
+            database instead of `database_url`.
+
+    Returns:
+        SQLAlchemy engine.
+    """
+    if in_memory is not None:
+        engine = sqlalchemy.create_engine('sqlite://', creator=in_memory.connect, poolclass=QueuePool)
+        sqlalchemy.event.listen(engine, 'connect', _pragma_handler(IN_MEMORY_PRAGMAS))
+        return engine
+    if is_sqlite_file(database_url):
+        # Pooled SQLite connections may be used by a different thread each time
+        # they are checked out, so SQLite's same-thread check must be disabled.
+        # (SQLAlchemy 1.4 would otherwise use a NullPool for SQLite files.)
+        url = read_only_url(database_url) if read_only else database_url
+        engine = sqlalchemy.create_engine(url, poolclass=QueuePool, connect_args={'check_same_thread': False})
+        if read_only:
+            sqlalchemy.event.listen(engine, 'connect', _pragma_handler(READ_ONLY_PRAGMAS))
+        return engine
+    return sqlalchemy.create_engine(database_url)
+
+
+# Supported backends for executing queries (see PdgApi)
+BACKENDS = ('sqlalchemy', 'sqlite3')
+
+
+class CompiledStatement:
+    """A SQLAlchemy statement compiled for execution with `sqlite3`.
+
+    Holds the SQL string with positional parameters, the names and default
+    values of its parameters, and the processors converting the values of its
+    result columns in the same way as SQLAlchemy (e.g. integers to `bool` for
+    `Boolean` columns).
+    """
+    def __init__(self, statement: ClauseElement, dialect: Dialect):
+        """
+        Args:
+            statement: SQLAlchemy statement, e.g. a `select()` construct or `text()`.
+            dialect: SQLite dialect of the engine.
+        """
+        compiled = statement.compile(dialect=dialect)
+        self.sql = compiled.string
+        self.param_names = list(compiled.positiontup or [])
+        self.defaults = {name: bind.effective_value for name, bind in compiled.binds.items()}
+        self.result_processors: Optional[list[Optional[Callable]]] = None
+        columns = getattr(statement, 'selected_columns', None)
+        if columns is not None:
+            processors = [column.type.dialect_impl(dialect).result_processor(dialect, None) for column in columns]
+            if any(processors):
+                self.result_processors = processors
+        self._row_classes: dict[tuple, type] = {}
+
+    def params(self, parameters: Optional[dict]) -> list:
+        "Get the list of positional parameter values, using the defaults for parameters not in `parameters`."
+        if not parameters:
+            return [self.defaults[name] for name in self.param_names]
+        return [parameters.get(name, self.defaults[name]) for name in self.param_names]
+
+    def row_class(self, description: tuple) -> type:
+        "Get the row class for a cursor description (created on first use)."
+        keys = tuple(d[0] for d in description)
+        try:
+            return self._row_classes[keys]
+        except KeyError:
+            row_class = self._row_classes[keys] = _make_row_class(keys)
+            return row_class
+
+
+def _make_row_class(keys: tuple[str, ...]) -> type:
+    "Make a tuple subclass for rows with the given column names, mimicking SQLAlchemy's `Row`."
+    class Row(namedtuple('Row', keys, rename=True)):   # type: ignore[misc]
+        __slots__ = ()
+
+        @property
+        def _mapping(self) -> dict[str, Any]:
+            return dict(zip(keys, self))
+    return Row
+
+
+class Sqlite3Result:
+    """Result of :meth:`Sqlite3Connection.execute`.
+
+    Supports the subset of SQLAlchemy's `Result` interface used by the API:
+    iteration, :meth:`fetchone`, :meth:`fetchall` and :meth:`scalar`. Rows
+    support access by index, by attribute and through `_mapping`, like
+    SQLAlchemy's `Row`.
+    """
+    def __init__(self, cursor: sqlite3.Cursor, compiled: CompiledStatement):
+        self._cursor = cursor
+        self._compiled = compiled
+        self._row_class = compiled.row_class(cursor.description) if cursor.description else None
+
+    def _make_row(self, values: tuple) -> tuple:
+        processors = self._compiled.result_processors
+        if processors is not None:
+            values = tuple(p(v) if p is not None else v for p, v in zip(processors, values))
+        assert self._row_class is not None
+        return self._row_class._make(values)
+
+    def __iter__(self) -> Iterator[tuple]:
+        for values in self._cursor:
+            yield self._make_row(values)
+
+    def fetchone(self) -> Optional[tuple]:
+        "Get the next row, or `None` if there are no more rows."
+        values = self._cursor.fetchone()
+        return None if values is None else self._make_row(values)
+
+    def fetchall(self) -> list[tuple]:
+        "Get all remaining rows."
+        return [self._make_row(values) for values in self._cursor.fetchall()]
+
+    def scalar(self) -> Any:
+        "Get the first column of the first row, or `None` if there is no row."
+        row = self.fetchone()
+        self._cursor.close()
+        return None if row is None else row[0]
+
+
+class Sqlite3Connection:
+    """A database connection executing SQLAlchemy statements directly with `sqlite3`.
+
+    This provides the subset of the interface of SQLAlchemy's `Connection` used
+    by the API. The underlying `sqlite3` connection is checked out from the
+    engine's connection pool and returned to it by :meth:`close`. Compiled
+    statements are kept in `compiled_cache`, which can be shared by all
+    connections of an engine.
+    """
+    def __init__(self, engine: Engine, compiled_cache: 'weakref.WeakKeyDictionary[ClauseElement, CompiledStatement]'):
+        """
+        Args:
+            engine: SQLAlchemy engine for a SQLite database.
+            compiled_cache: Cache of compiled statements.
+        """
+        self.engine = engine
+        self.compiled_cache = compiled_cache
+        self.dbapi_connection = engine.raw_connection()
+
+    def __enter__(self) -> 'Sqlite3Connection':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def execute(self, statement: ClauseElement, parameters: Optional[dict]=None) -> Sqlite3Result:
+        """Execute a statement.
+
+        Args:
+            statement: SQLAlchemy statement with bound parameters.
+            parameters: Values of the bound parameters.
+
+        Returns:
+            Result of the query.
+        """
+        try:
+            compiled = self.compiled_cache[statement]
+        except KeyError:
+            compiled = self.compiled_cache[statement] = CompiledStatement(statement, self.engine.dialect)
+        cursor = self.dbapi_connection.cursor()
+        cursor.execute(compiled.sql, compiled.params(parameters))
+        return Sqlite3Result(cursor, compiled)
+
+    def close(self) -> None:
+        "Return the underlying connection to the engine's connection pool."
+        if self.dbapi_connection is not None:
+            self.dbapi_connection.close()
+            self.dbapi_connection = None
@@ -0,0 +1,96 @@
+"""
+Bounded caches shared by all objects of an API object.
+
+The data objects of the API cache the data they have loaded in their own
+`cache` dictionaries. The caches in this module are instead shared by all
+objects of a :class:`~pdg.api.PdgApi` object, and are bounded in size by
+evicting the least recently used entries.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional
+
+
+class CacheStats(NamedTuple):
+    "Statistics of an :class:`LruCache`."
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class LruCache:
+    """A thread-safe mapping with a size bound and least recently used (LRU) eviction.
+
+    Lookups with :meth:`get` count as hits or misses, which together with the
+    number of evicted entries are available from :meth:`stats`.
+    """
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize: Maximum number of entries. When a new entry is added to a
+                full cache, the least recently used entry is evicted.
+        """
+        if maxsize <= 0:
+            raise ValueError('maxsize must be positive, not %s' % maxsize)
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self) -> str:
+        "Get a concise representation including the statistics."
+        return 'LruCache(%s)' % ', '.join('%s=%s' % item for item in self.stats()._asdict().items())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Optional[Any]=None) -> Any:
+        """Get an entry and mark it as most recently used.
+
+        Args:
+            key: Key of the entry.
+            default: Value returned if there is no entry for `key`.
+
+        Returns:
+            The cached value, or `default`.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Add or replace an entry, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: Key of the entry.
+            value: Value to be cached.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        "Remove all entries (the statistics are kept)."
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> CacheStats:
+        "Get the number of hits, misses and evictions, and the current and maximum size."
+        return CacheStats(self._hits, self._misses, self._evictions, len(self._data), self.maxsize)
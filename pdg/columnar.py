@@ -0,0 +1,409 @@
+"""
+Columnar lookup of particle properties for many particles at once.
+
+Looking up e.g. the masses of many particles with
+:meth:`PdgApi.get_particle_by_mcid <pdg.api.PdgApi.get_particle_by_mcid>` and
+:attr:`PdgParticle.mass <pdg.particle.PdgParticle.mass>` runs several queries
+for every particle. :func:`get_particle_properties` instead loads the
+particles, their mass, width and lifetime properties with all summary values,
+and the number of measurements of these properties in three queries
+independent of the number of particles, and then selects the best values in
+memory using the same rules as :class:`~pdg.particle.PdgParticle` (see
+:func:`pdg.particle.select_best` and :func:`pdg.data.select_best_summary`). The
+results are returned as NumPy masked arrays. For repeated lookups, e.g. when
+annotating many events, :class:`McidTable` holds these properties for all MC
+IDs and looks up whole arrays of MC IDs at once. :func:`get_particle_table`
+returns all particles (also those without MC ID) in the same way, together
+with their quantum numbers and flags.
+
+This module requires NumPy, which can be installed together with the API using
+`pip install 'pdg[numpy]'`.
+"""
+
+from pdg.data import PdgSummaryValue, get_cp_charge_flag, select_best_summary
+from pdg.errors import PdgApiError, PdgAmbiguousValueError, PdgNoDataError
+from pdg.particle import select_best
+from pdg.units import HBAR_IN_GEV_S, convert
+from pdg.utils import find_prefixed
+from typing import TYPE_CHECKING, Any, Iterable, Optional, cast
+
+if TYPE_CHECKING:
+    from pdg.api import PdgApi
+
+
+# Fields of get_particle_properties() and the units in which they are given by default
+FIELDS = ('mass', 'mass_error', 'width', 'width_error', 'lifetime', 'lifetime_error', 'charge')
+DEFAULT_UNITS = {'mass': 'GeV', 'mass_error': 'GeV', 'width': 'GeV', 'width_error': 'GeV',
+                 'lifetime': 's', 'lifetime_error': 's', 'charge': None}
+
+# Flags of get_particle_table() and the characters of column pdgid.flags they are given by
+TABLE_FLAGS = {'is_boson': 'G', 'is_quark': 'Q', 'is_lepton': 'L', 'is_meson': 'M', 'is_baryon': 'B'}
+
+# Data types of the properties needed for the fields
+_DATA_TYPES = ('M', 'G', 'T')
+
+
+def _import_numpy() -> Any:
+    "Import NumPy, which is an optional dependency."
+    try:
+        import numpy
+    except ImportError:
+        raise PdgApiError("NumPy is required for columnar lookups - install it with pip install 'pdg[numpy]'")
+    return numpy
+
+
+class _Property:
+    "A property with the attributes used by select_best(), loaded by get_particle_properties()."
+    __slots__ = ('pdgid', 'parent_pdgid', 'data_type', 'data_flags', 'sort', 'num_measurements', 'summaries')
+
+    def __init__(self, row: dict, num_measurements: int):
+        self.pdgid = row['pdgid']
+        self.parent_pdgid = row['parent_pdgid']
+        self.data_type = row['data_type']
+        self.data_flags = row['flags']
+        self.sort = row['pdgid_sort']
+        self.num_measurements = num_measurements
+        self.summaries: list[PdgSummaryValue] = []
+
+    @property
+    def cp_charge_flag(self) -> Optional[int]:
+        return get_cp_charge_flag(self.data_flags)
+
+
+class _Particle:
+    """A particle with the properties loaded by get_particle_properties().
+
+    The methods for the fields (in GeV and seconds) follow the properties of
+    the same name of :class:`~pdg.particle.PdgParticle`, and raise
+    :exc:`~pdg.errors.PdgNoDataError` where these would raise an exception.
+    """
+    def __init__(self, row: dict, properties: dict[str, list[_Property]], pedantic: bool):
+        self.row = row
+        self.charge = row['charge']
+        self.pedantic = pedantic
+        self._properties = properties
+        self._resolving: set[str] = set()
+
+    @property
+    def cp_charge(self) -> int:
+        sign = -1 if self.row['cc_type'] == 'A' else 1
+        return sign * int(self.charge)
+
+    def _has_entry(self, data_type: str) -> bool:
+        return bool(self._properties[data_type])
+
+    def _best(self, data_type: str, units: str, error: bool=False) -> Optional[float]:
+        "Best value or error, or `None` for a limit (see PdgParticle._if_not_limit)."
+        prop = select_best(self._properties[data_type], self, self.pedantic)
+        summary = select_best_summary(prop.summaries, False, self.pedantic, lambda: prop.pdgid)
+        if summary is None:
+            raise PdgNoDataError('No best summary value for %s' % prop.pdgid)
+        if summary.is_limit:
+            return None
+        if error:
+            return summary.get_error(units)
+        return summary.get_value(units)
+
+    def _fallback(self, name: str) -> None:
+        "Check whether a value derived from another quantity can be used (not in pedantic mode, no cycles)."
+        if self.pedantic or name in self._resolving:
+            raise PdgNoDataError('No %s' % name)
+
+    def mass(self) -> Optional[float]:
+        return self._best('M', 'GeV')
+
+    def mass_error(self) -> Optional[float]:
+        return self._best('M', 'GeV', error=True)
+
+    def width(self) -> Optional[float]:
+        try:
+            return self._best('G', 'GeV')
+        except PdgNoDataError:
+            self._fallback('width')
+            self._resolving.add('width')
+            try:
+                if not self._has_entry('T') or self.lifetime() is None:
+                    return 0.
+                return HBAR_IN_GEV_S / self.lifetime()
+            finally:
+                self._resolving.discard('width')
+
+    def width_error(self) -> Optional[float]:
+        try:
+            return self._best('G', 'GeV', error=True)
+        except PdgNoDataError:
+            self._fallback('width')
+            self._resolving.add('width')
+            try:
+                lifetime = self.lifetime() if self._has_entry('T') else None
+                if lifetime is None:
+                    return 0.
+                err = self.lifetime_error()
+                if err is None:
+                    return None
+                return err * HBAR_IN_GEV_S / lifetime**2
+            finally:
+                self._resolving.discard('width')
+
+    def lifetime(self) -> Optional[float]:
+        try:
+            return self._best('T', 's')
+        except PdgNoDataError:
+            self._fallback('lifetime')
+            self._resolving.add('lifetime')
+            try:
+                width = self.width()
+                if not width:
+                    return float('inf')
+                return HBAR_IN_GEV_S / width
+            finally:
+                self._resolving.discard('lifetime')
+
+    def lifetime_error(self) -> Optional[float]:
+        try:
+            err = self._best('T', 's', error=True)
+            return 0. if err is None else err
+        except PdgNoDataError:
+            self._fallback('lifetime')
+            self._resolving.add('lifetime')
+            try:
+                if not self._has_entry('G'):
+                    return 0.
+                width, err = self.width(), self.width_error()
+                if width is None or err is None:
+                    return None
+                return err * HBAR_IN_GEV_S / width**2
+            finally:
+                self._resolving.discard('lifetime')
+
+    def get(self, field: str) -> Optional[float]:
+        "Get the value of a field, or `None` if it is missing."
+        if field == 'charge':
+            return self.charge
+        try:
+            return getattr(self, field)()
+        except (PdgNoDataError, PdgAmbiguousValueError, ZeroDivisionError):
+            return None
+
+
+def _charge_specific_match(data_flags: str, charge: Optional[float]) -> bool:
+    "Whether a mass, width or lifetime property applies to a particle (see PdgParticle.properties)."
+    if not any(flag in data_flags for flag in '012'):
+        return True
+    return charge is None or str(int(abs(charge))) in data_flags
+
+
+def _check_fields(fields: Optional[Iterable[str]], units: Optional[str | dict[str, str]]) \
+        -> tuple[tuple[str, ...], dict[str, Optional[str]]]:
+    "Check the fields and get the units for each field."
+    fields = tuple(FIELDS if fields is None else fields)
+    for field in fields:
+        if field not in FIELDS:
+            raise PdgApiError('unknown field %s - must be one of %s' % (field, ', '.join(FIELDS)))
+    field_units = dict(DEFAULT_UNITS)
+    if isinstance(units, str):
+        field_units.update((field, units) for field in ('mass', 'mass_error', 'width', 'width_error'))
+    elif units is not None:
+        field_units.update(units)
+    if field_units['charge'] is not None:
+        raise PdgApiError('charge cannot be converted to other units')
+    return fields, field_units
+
+
+def _load_properties(api: 'PdgApi', conn: Any, edition: Optional[str]) -> dict[str, list[_Property]]:
+    "Load the mass, width and lifetime properties with their summary values, grouped by parent PDG Identifier."
+    if edition is None:
+        edition = api.default_edition
+    num_measurements = {row.pdgid: row.num_measurements
+                        for row in conn.execute(api.statement('measurement_counts', _DATA_TYPES))}
+    properties: dict[str, _Property] = {}
+    summary_rows = conn.execute(api.statement('property_summaries', _DATA_TYPES), {'edition': edition})
+    for row in summary_rows:
+        row = dict(row._mapping)
+        if row['pdgid'] not in properties:
+            properties[row['pdgid']] = _Property(row, num_measurements.get(row['pdgid'], 0))
+        properties[row['pdgid']].summaries.append(PdgSummaryValue(row))
+    by_parent: dict[str, list[_Property]] = {}
+    for prop in properties.values():
+        by_parent.setdefault(prop.parent_pdgid.upper(), []).append(prop)
+    return by_parent
+
+
+def _make_particle(row: dict, by_parent: dict[str, list[_Property]], parents: list[str],
+                   pedantic: bool) -> _Particle:
+    "Create a particle with its properties, found by prefix of the parent like in PdgParticle.properties()."
+    candidates = sorted((prop for parent in find_prefixed(parents, row['pdgid'].upper())
+                         for prop in by_parent[parent]), key=lambda prop: prop.sort)
+    by_data_type: dict[str, list[_Property]] = {data_type: [] for data_type in _DATA_TYPES}
+    for prop in candidates:
+        if _charge_specific_match(prop.data_flags, row['charge']):
+            by_data_type[prop.data_type].append(prop)
+    return _Particle(row, by_data_type, pedantic)
+
+
+def _load_particles(api: 'PdgApi', edition: Optional[str], mcids: Optional[Iterable[int]]=None) \
+        -> dict[int, _Particle]:
+    "Load the particles with the given MC IDs (default: all MC IDs) with their properties."
+    with api.connection() as conn:
+        particle_rows = {row.mcid: dict(row._mapping) for row in conn.execute(api.statement('particles_with_mcid'))}
+        by_parent = _load_properties(api, conn, edition)
+    parents = sorted(by_parent)
+
+    particles = {}
+    for mcid in (particle_rows if mcids is None else mcids):
+        row = particle_rows.get(mcid)
+        if row is None or mcid in particles:
+            continue
+        particles[mcid] = _make_particle(row, by_parent, parents, api.pedantic)
+    return particles
+
+
+def _column(numpy: Any, particles: list[Optional[_Particle]], field: str, units: Optional[str]) -> Any:
+    "Get the values of a field of a list of particles (`None` for missing particles) as a masked array."
+    values = []
+    for particle in particles:
+        value = particle.get(field) if particle is not None else None
+        if value is not None and units != DEFAULT_UNITS[field]:
+            value = convert(value, DEFAULT_UNITS[field], units)
+        values.append(value)
+    mask = [value is None for value in values]
+    data = numpy.array([numpy.nan if value is None else value for value in values], dtype=float)
+    return numpy.ma.masked_array(data, mask=mask)
+
+
+def get_particle_properties(api: 'PdgApi', mcids: Iterable[int], fields: Optional[Iterable[str]]=None,
+                            units: Optional[str | dict[str, str]]=None, edition: Optional[str]=None) \
+        -> dict[str, Any]:
+    """Get properties of many particles given by their MC IDs as columns.
+
+    See :meth:`PdgApi.get_particle_properties <pdg.api.PdgApi.get_particle_properties>`.
+    """
+    numpy = _import_numpy()
+    fields, field_units = _check_fields(fields, units)
+    mcids = [int(mcid) for mcid in mcids]
+    particles = _load_particles(api, edition, mcids)
+    selected = [particles.get(mcid) for mcid in mcids]
+    return {field: _column(numpy, selected, field, field_units[field]) for field in fields}
+
+
+def _masked(numpy: Any, values: list[Any], dtype: Any) -> Any:
+    "Get a list of values (`None` for missing values) as a masked array."
+    fill = {bool: False, int: 0, float: numpy.nan, str: ''}[dtype]
+    return numpy.ma.masked_array([fill if value is None else value for value in values], dtype=dtype,
+                                 mask=[value is None for value in values])
+
+
+def get_particle_table(api: 'PdgApi', units: Optional[str | dict[str, str]]=None, edition: Optional[str]=None) \
+        -> dict[str, Any]:
+    """Get all particles with their properties as columns.
+
+    See :meth:`PdgApi.particle_table <pdg.api.PdgApi.particle_table>`.
+    """
+    numpy = _import_numpy()
+    fields, field_units = _check_fields(None, units)
+    with api.connection() as conn:
+        rows = [dict(row._mapping) for row in conn.execute(api.statement('particle_table'))]
+        by_parent = _load_properties(api, conn, edition)
+    parents = sorted(by_parent)
+    particles: list[Optional[_Particle]] = [_make_particle(row, by_parent, parents, api.pedantic) for row in rows]
+
+    columns = {}
+    for field in ('pdgid', 'name'):
+        columns[field] = _masked(numpy, [row[field] for row in rows], str)
+    columns['mcid'] = _masked(numpy, [row['mcid'] for row in rows], int)
+    for field in fields:
+        columns[field] = _column(numpy, particles, field, field_units[field])
+    for quantum_number in 'IGJPC':
+        columns['quantum_' + quantum_number] = _masked(numpy, [row['quantum_' + quantum_number.lower()]
+                                                               for row in rows], str)
+    for field, flag in TABLE_FLAGS.items():
+        columns[field] = _masked(numpy, [flag in (row['pdgid_flags'] or '') for row in rows], bool)
+    for field, data_type in (('has_mass_entry', 'M'), ('has_width_entry', 'G'), ('has_lifetime_entry', 'T')):
+        columns[field] = _masked(numpy, [cast(_Particle, p)._has_entry(data_type) for p in particles], bool)
+    return columns
+
+
+class McidTable:
+    """Lookup table from MC IDs to particle properties for vectorized lookups.
+
+    The table holds the MC IDs of all particles in the database as a sorted
+    array, and the properties of these particles as columns in the same
+    order. Lookups of arrays of MC IDs find the rows of the table by binary
+    search (`numpy.searchsorted`) and gather the values from the columns,
+    without any database queries or Python loops over the MC IDs. The tables
+    are created with :meth:`PdgApi.get_mcid_table <pdg.api.PdgApi.get_mcid_table>`.
+    """
+    def __init__(self, api: 'PdgApi', fields: Optional[Iterable[str]]=None,
+                 units: Optional[str | dict[str, str]]=None, edition: Optional[str]=None):
+        """
+        Note:
+            The constructor is intended for internal API use.
+
+        Args:
+            api: API object for loading the particles.
+            fields: Fields as for :func:`get_particle_properties` (default:
+                all). The PDG Identifier and the name of the particles are
+                always included as fields `'pdgid'` and `'name'`.
+            units: Units as for :func:`get_particle_properties`.
+            edition: Edition from which the summary values are taken.
+        """
+        numpy = _import_numpy()
+        fields, field_units = _check_fields(fields, units)
+        particles = _load_particles(api, edition)
+        self.mcids = numpy.array(sorted(particles), dtype=numpy.int64)
+        rows: list[Optional[_Particle]] = [particles[mcid] for mcid in self.mcids.tolist()]
+        self.columns = {field: _column(numpy, rows, field, field_units[field]) for field in fields}
+        for field in ('pdgid', 'name'):
+            self.columns[field] = numpy.ma.masked_array([cast(_Particle, p).row[field] for p in rows],
+                                                        mask=numpy.zeros(len(rows), dtype=bool))
+        self.fields = tuple(self.columns)
+
+    def __repr__(self) -> str:
+        "Get a concise representation including the number of MC IDs and the fields."
+        return 'McidTable(%d MC IDs, fields=%s)' % (len(self.mcids), ','.join(self.fields))
+
+    def __len__(self) -> int:
+        return len(self.mcids)
+
+    def index(self, mcids: Any) -> Any:
+        """Get the rows of the table for an array of MC IDs.
+
+        Args:
+            mcids: Array (or anything convertible to an array) of MC IDs.
+
+        Returns:
+            Integer array with the row for each MC ID, or -1 for unknown MC IDs.
+        """
+        numpy = _import_numpy()
+        mcids = numpy.asarray(mcids, dtype=numpy.int64)
+        if len(self.mcids) == 0:
+            return numpy.full(mcids.shape, -1, dtype=numpy.intp)
+        rows = numpy.minimum(numpy.searchsorted(self.mcids, mcids), len(self.mcids) - 1)
+        return numpy.where(self.mcids[rows] == mcids, rows, -1)
+
+    def lookup(self, mcids: Any, fields: Optional[Iterable[str]]=None) -> dict[str, Any]:
+        """Get the values of fields for an array of MC IDs.
+
+        Args:
+            mcids: Array (or anything convertible to an array) of MC IDs, which
+                may contain unknown MC IDs.
+            fields: Fields to get (default: all fields of the table).
+
+        Returns:
+            Dictionary with a NumPy masked array for each field, with the same
+            shape as `mcids`. Values for unknown MC IDs are masked.
+
+        Raises:
+            :exc:`~pdg.errors.PdgApiError`: If a field is not in the table.
+        """
+        numpy = _import_numpy()
+        rows = self.index(mcids)
+        unknown = rows < 0
+        columns = {}
+        for field in (self.fields if fields is None else fields):
+            if field not in self.columns:
+                raise PdgApiError('field %s not in table - must be one of %s' % (field, ', '.join(self.fields)))
+            column = self.columns[field]
+            columns[field] = numpy.ma.masked_array(column.data[rows],
+                                                   mask=numpy.ma.getmaskarray(column)[rows] | unknown)
+        return columns
@@ -0,0 +1,269 @@
+"""
+In-memory index of the charge conjugates of particles, items and decays.
+
+The :class:`ConjugationIndex` of an API object (see
+:attr:`PdgApi.conjugation_index <pdg.api.PdgApi.conjugation_index>`) reads
+tables `pdgparticle`, `pdgitem` and `pdgdecay` once and precomputes the charge
+conjugate of every particle, item and decay mode, so that e.g.
+:attr:`PdgParticle.antiparticle <pdg.particle.PdgParticle.antiparticle>` and
+:meth:`PdgBranchingFraction.conjugates
+<pdg.decay.PdgBranchingFraction.conjugates>` need no SQL queries, and lists of
+decay products can be conjugated in bulk when matching decays in both charge
+states.
+
+Particles are conjugated using their MC IDs where available (the conjugate of
+MC ID `n` is `-n`, and particles whose negated MC ID does not exist are their
+own conjugates), and otherwise using column `cc_type`: self-conjugate states
+(type `S`) are their own conjugates, and particles (type `P`) are paired with
+the antiparticle (type `A`) of opposite charge of the same PDG Identifier.
+Items referring to a unique particle are conjugated to the item of the
+conjugate particle, and items referring to several particles (e.g. the "both
+charges" item `pi+-`) to the item referring to the conjugate particles
+(preferring items of the same type, or of types `B` and `C`, which are
+conjugates of each other). Items without particles, e.g. text, are conjugated
+by swapping a trailing charge (`lepton+` to `lepton-`, `e+-` to `e-+`), and
+are otherwise their own conjugates.
+"""
+
+import time
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from pdg.products import ItemMultiset, decay_multisets
+
+if TYPE_CHECKING:
+    from pdg.api import PdgApi
+    from pdg.names import NameIndex
+
+
+# Decay key: sorted (item ID, multiplicity) pairs of the incoming and of the outgoing items
+DecayKey = tuple[ItemMultiset, ItemMultiset]
+
+# Trailing charges of item names and their conjugates
+_CHARGE_SUFFIXES = (('+-', '-+'), ('-+', '+-'), ('++', '--'), ('--', '++'), ('+', '-'), ('-', '+'))
+
+# Item types that are conjugates of each other ("both charges" and "both charges, conjugate")
+_CONJUGATE_ITEM_TYPES = {'B': 'C', 'C': 'B'}
+
+
+def conjugate_particle_row(row: dict, rows: list[dict]) -> Optional[dict]:
+    """Get the charge conjugate of a particle from the particles of its PDG Identifier.
+
+    Args:
+        row: Row of table `pdgparticle` of the particle.
+        rows: Rows of table `pdgparticle` of all particles with the same PDG
+            Identifier, e.g. from statement `particle` (see
+            :mod:`pdg.statements`).
+
+    Returns:
+        Row of the conjugate particle (`row` itself for self-conjugate
+        particles), or `None` if it is not in `rows`.
+    """
+    if row['mcid'] is not None:
+        return next((other for other in rows if other['mcid'] == -row['mcid']), row)
+    if row['cc_type'] == 'S':
+        return row
+    candidates = [other for other in rows
+                  if (other['cc_type'] == 'A') != (row['cc_type'] == 'A') and other['charge'] == -row['charge']]
+    return candidates[0] if len(candidates) == 1 else None
+
+
+class ConjugationIndex:
+    """Index of the charge conjugates of all particles, items and decays.
+
+    See :mod:`pdg.conjugation` for how conjugates are determined. Items are
+    resolved to their particles with the :attr:`PdgApi.name_index
+    <pdg.api.PdgApi.name_index>`.
+    """
+    def __init__(self, api: 'PdgApi'):
+        """
+        Note:
+            The constructor is intended for internal API use. Use
+            :attr:`PdgApi.conjugation_index <pdg.api.PdgApi.conjugation_index>`
+            instead.
+
+        Args:
+            api: API object for reading the tables.
+        """
+        names = self._names = api.name_index
+        t0 = time.perf_counter()
+        with api.connection() as conn:
+            particles = [dict(row._mapping) for row in conn.execute(api.statement('all_particles'))]
+            items = conn.execute(api.statement('all_items')).fetchall()
+            decays = conn.execute(api.statement('all_decays')).fetchall()
+
+        # Particles
+        by_pdgid: dict[str, list[dict]] = defaultdict(list)
+        for row in particles:
+            by_pdgid[row['pdgid']].append(row)
+        self._particles: dict[int, Optional[dict]] = {row['id']: conjugate_particle_row(row, by_pdgid[row['pdgid']])
+                                                      for row in particles}
+        self._mcids = {row['mcid']: conjugate['mcid'] for row, conjugate in
+                       ((row, self._particles[row['id']]) for row in particles if row['mcid'] is not None)
+                       if conjugate is not None}
+
+        # Items
+        item_types = {item.id: item.item_type for item in items}
+        by_particles: dict[frozenset[int], list[int]] = defaultdict(list)
+        for item in items:
+            if names.particle(item.id) is None and names.particles(item.id):
+                by_particles[frozenset(p['id'] for p in names.particles(item.id))].append(item.id)
+        self._items: dict[int, Optional[int]] = {}
+        for item in items:
+            particle = names.particle(item.id)
+            if particle is not None:
+                conjugate = self._particles.get(particle['id'])
+                self._items[item.id] = conjugate['pdgitem_id'] if conjugate is not None else None
+            elif names.particles(item.id):
+                self._items[item.id] = self._conjugate_particle_set(item.id, names.particles(item.id),
+                                                                    by_particles, item_types)
+            else:
+                self._items[item.id] = self._conjugate_text(item.id, item.name, names)
+
+        # Decays
+        self._decay_keys: dict[str, DecayKey] = decay_multisets(decays, names.canonical_item)
+        self._decays: dict[DecayKey, list[str]] = defaultdict(list)
+        for pdgid, key in self._decay_keys.items():
+            self._decays[key].append(pdgid)
+        self.load_time = time.perf_counter() - t0
+
+    def _conjugate_particle_set(self, item_id: int, particles: list[dict], by_particles: dict[frozenset[int], list[int]],
+                                item_types: dict[int, str]) -> Optional[int]:
+        "Get the conjugate of an item referring to several particles."
+        conjugates = [self._particles.get(p['id']) for p in particles]
+        if any(conjugate is None for conjugate in conjugates):
+            return None
+        key = frozenset(conjugate['id'] for conjugate in conjugates if conjugate is not None)
+        if key == frozenset(p['id'] for p in particles):
+            return item_id
+        candidates = by_particles.get(key, [])
+        item_type = item_types[item_id]
+        for preferred in (_CONJUGATE_ITEM_TYPES.get(item_type), item_type):
+            for candidate in candidates:
+                if item_types[candidate] == preferred:
+                    return candidate
+        return candidates[0] if candidates else None
+
+    @staticmethod
+    def _conjugate_text(item_id: int, name: str, names: 'NameIndex') -> Optional[int]:
+        "Get the conjugate of an item without particles by swapping its trailing charge."
+        for suffix, conjugate_suffix in _CHARGE_SUFFIXES:
+            if name.endswith(suffix):
+                item_ids = names.item_ids(name[:-len(suffix)] + conjugate_suffix)
+                return item_ids[0] if len(item_ids) == 1 else None
+        return item_id
+
+    def __repr__(self) -> str:
+        "Get a concise representation including the number of entries and the load time."
+        return 'ConjugationIndex(particles=%d, items=%d, decays=%d, load_time=%.3f)' % (
+            len(self._particles), len(self._items), len(self._decay_keys), self.load_time)
+
+    def conjugate_mcid(self, mcid: int) -> Optional[int]:
+        """Get the MC ID of the charge conjugate of a particle.
+
+        Args:
+            mcid: MC ID of the particle.
+
+        Returns:
+            MC ID of the conjugate particle (equal to `mcid` for self-conjugate
+            particles), or `None` if there is no particle with this MC ID or
+            its conjugate has no MC ID.
+        """
+        return self._mcids.get(mcid)
+
+    def conjugate_particle(self, particle_id: int) -> Optional[dict]:
+        """Get the charge conjugate of a particle.
+
+        Args:
+            particle_id: ID of the particle in table `pdgparticle`.
+
+        Returns:
+            Row of table `pdgparticle` of the conjugate particle, or `None` if
+            it is not in the database.
+        """
+        return self._particles.get(particle_id)
+
+    def conjugate_item(self, item_id: int) -> Optional[int]:
+        """Get the charge conjugate of an item.
+
+        Args:
+            item_id: Item ID.
+
+        Returns:
+            ID of the conjugate item (equal to `item_id` for self-conjugate
+            items), or `None` if it is not in the database.
+        """
+        return self._items.get(item_id)
+
+    def canonical_item(self, item_id: int) -> int:
+        """Get the canonical item of an item.
+
+        Args:
+            item_id: Item ID.
+
+        Returns:
+            ID of the item of the particle's row in table `pdgparticle` for
+            items referring to a unique particle (e.g. for aliases), and
+            otherwise `item_id`.
+        """
+        return self._names.canonical_item(item_id)
+
+    def conjugate_products(self, products: Iterable[tuple[int, int]]) -> Optional[list[tuple[int, int]]]:
+        """Get the charge conjugates of a list of decay products.
+
+        Args:
+            products: Pairs of item ID and multiplier, e.g. from the
+                :attr:`~pdg.decay.PdgDecayProduct.item` and
+                :attr:`~pdg.decay.PdgDecayProduct.multiplier` of decay products.
+
+        Returns:
+            Pairs of the IDs of the conjugate items and the multipliers, in the
+            same order, or `None` if any item has no conjugate.
+        """
+        conjugates = []
+        for item_id, multiplier in products:
+            conjugate = self._items.get(item_id)
+            if conjugate is None:
+                return None
+            conjugates.append((conjugate, multiplier))
+        return conjugates
+
+    def decay_key(self, pdgid: str) -> Optional[DecayKey]:
+        """Get the key of a decay mode, which is the same for all decays with the same incoming and outgoing items.
+
+        Args:
+            pdgid: PDG Identifier of the branching fraction.
+
+        Returns:
+            Sorted pairs of canonical item ID (see :meth:`canonical_item`) and
+            multiplicity of the incoming and of the outgoing items, or `None`
+            if there is no decay with this PDG Identifier.
+        """
+        return self._decay_keys.get(pdgid.upper())
+
+    def conjugate_decays(self, pdgid: str) -> list[str]:
+        """Get the charge conjugates of a decay mode.
+
+        Args:
+            pdgid: PDG Identifier of the branching fraction.
+
+        Returns:
+            PDG Identifiers of the branching fractions of all decay modes with
+            the conjugate incoming and outgoing items (including `pdgid` itself
+            for self-conjugate decays). The list is empty if the conjugate
+            decay is not in the database, which is the case for most decays,
+            since the Listings imply the charge conjugate modes.
+        """
+        key = self.decay_key(pdgid)
+        if key is None:
+            return []
+        conjugate_key = []
+        for items in key:
+            conjugates: Counter = Counter()
+            for item_id, multiplicity in items:
+                conjugate = self._items.get(item_id)
+                if conjugate is None:
+                    return []
+                conjugates[self.canonical_item(conjugate)] += multiplicity
+            conjugate_key.append(tuple(sorted(conjugates.items())))
+        return list(self._decays.get((conjugate_key[0], conjugate_key[1]), []))
@@ -11,12 +11,11 @@ particle physics properties such as branching fractions or particle masses.
 """
 
 import pprint
-from sqlalchemy import select, bindparam, func
-from pdg.utils import parse_id, make_id
+from pdg.utils import get_linked_ids, parse_id, make_id
 from pdg.units import UNIT_CONVERSION_FACTORS, convert
 from pdg.errors import PdgApiError, PdgInvalidPdgIdError, PdgAmbiguousValueError, PdgNoDataError
 from pdg.measurement import PdgMeasurement
-from typing import TYPE_CHECKING, Iterator, Optional, cast
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, cast
 
 if TYPE_CHECKING:
     from pdg.api import PdgApi
@@ -328,6 +327,58 @@ class PdgConvertedValue(PdgSummaryValue):
         self['unit_text'] = to_units
 
 
+def get_cp_charge_flag(data_flags: str) -> Optional[int]:
+    """Get the "CP charge" flag from the flags of a PDG Identifier.
+
+    See :attr:`PdgData.cp_charge_flag`.
+    """
+    digits = [c for c in data_flags if c.isdigit()]
+    if len(digits) == 0:
+        return None
+    assert len(digits) == 1
+    mag = int(digits[0])
+    if mag != 0:
+        assert ('+' in data_flags) ^ ('-' in data_flags)
+    sign = -1 if '-' in data_flags else 1
+    return sign * mag
+
+
+def select_best_summary(summaries: list[PdgSummaryValue], summary_table_only: bool, pedantic: bool,
+                        quantity: Callable[[], str]) -> Optional[PdgSummaryValue]:
+    """Select the PDG "best" summary value from the summary values of a quantity.
+
+    This implements :meth:`PdgProperty.best_summary`, and is also used for
+    selecting the best summary values of many quantities at once (see
+    :mod:`pdg.columnar`).
+
+    Args:
+        summaries: All summary values of the quantity.
+        summary_table_only: Whether the best value must be included in the
+            Summary Table.
+        pedantic: Whether multiple relevant summary values are an error.
+        quantity: Function returning a description of the quantity for the
+            error message.
+
+    Returns:
+        "Best" summary value, or `None`.
+
+    Raises:
+        :exc:`~pdg.errors.PdgAmbiguousValueError`: If `pedantic` is `True`
+            and there are multiple relevant summary values.
+    """
+    if not summary_table_only and len(summaries) == 1:
+        return summaries[0]
+    summaries = [v for v in summaries if v.in_summary_table]
+    if len(summaries) == 1:
+        return summaries[0]
+    elif len(summaries) == 0:
+        return None
+    elif pedantic:
+        raise PdgAmbiguousValueError('%s has multiple summary values' % quantity())
+    else:
+        return summaries[0]
+
+
 class PdgData(object):
     """Base class for PDG data containers.
 
@@ -365,7 +416,7 @@ class PdgData(object):
         if self._edition is None:
             self._edition = self.api.default_edition
         self.pdgid = make_id(self.baseid, self._edition)
-        self.cache: dict[str, dict | list[dict] | list[PdgSummaryValue]] = {}
+        self.cache: dict[str, int | dict | list[dict] | list[PdgSummaryValue]] = {}
 
     def __str__(self) -> str:
         """Get human-readable description of the data.
@@ -402,15 +453,11 @@ class PdgData(object):
             `pdgid` table. 
         """
         if 'pdgid' not in self.cache:
-            pdgid_table = self.api.db.tables['pdgid']
-            query = select(pdgid_table).where(pdgid_table.c.pdgid == bindparam('pdgid'))
-            with self.api.engine.connect() as conn:
-                try:
-                    row = conn.execute(query, {'pdgid': self.baseid}).fetchone()
-                    assert row is not None
-                    self.cache['pdgid'] = dict(row._mapping)
-                except AttributeError:
-                    raise PdgInvalidPdgIdError('PDG Identifier %s not found' % self.pdgid)
+            rows = self.api.get_rows(('pdgid', 'pdgid', self.baseid), self.api.statement('pdgid'),
+                                     {'pdgid': self.baseid})
+            if not rows:
+                raise PdgInvalidPdgIdError('PDG Identifier %s not found' % self.pdgid)
+            self.cache['pdgid'] = rows[0]
         assert isinstance(self.cache['pdgid'], dict)
         return self.cache['pdgid']
 
@@ -421,17 +468,10 @@ class PdgData(object):
             List of all :class:`PdgSummaryValue` objects for this data.
         """
         if 'summary' not in self.cache:
-            pdgid_table = self.api.db.tables['pdgid']
-            pdgdata_table = self.api.db.tables['pdgdata']
-            query = select(pdgdata_table, pdgid_table.c.description).join(pdgid_table)
-            query = query.where(pdgid_table.c.pdgid == bindparam('pdgid'))
-            query = query.where(pdgdata_table.c.edition == bindparam('edition'))
-            query = query.order_by(pdgdata_table.c.sort)
-            summary: list[PdgSummaryValue] = []
-            with self.api.engine.connect() as conn:
-                for entry in conn.execute(query, {'pdgid': self.baseid, 'edition': self.edition}):
-                    summary.append(PdgSummaryValue(entry._mapping))
-            self.cache['summary'] = summary
+            rows = self.api.get_rows(('pdgdata', self.edition, 'pdgid', self.baseid),
+                                     self.api.statement('summary_values'),
+                                     {'pdgid': self.baseid, 'edition': self.edition})
+            self.cache['summary'] = [PdgSummaryValue(row) for row in rows]
         return cast(list[PdgSummaryValue], self.cache['summary'])
 
     def _count_data_entries(self, pdgid: str, edition: str) -> int:
@@ -444,11 +484,8 @@ class PdgData(object):
         Returns:
             Number of data entries.
         """
-        pdgdata_table = self.api.db.tables['pdgdata']
-        query = select(func.count("*")).select_from(pdgdata_table)
-        query = query.where(pdgdata_table.c.pdgid == bindparam('pdgid'))
-        query = query.where(pdgdata_table.c.edition == bindparam('edition'))
-        with self.api.engine.connect() as conn:
+        query = self.api.statement('count_data_entries')
+        with self.api.connection() as conn:
             count = conn.execute(query, {'pdgid': pdgid.upper(), 'edition': edition}).scalar()
             assert count is not None
             return count
@@ -520,17 +557,13 @@ class PdgData(object):
         Returns:
             Iterator over descendent properties.
         """
-        pdgid_table = self.api.db.tables['pdgid']
         ## NOTE: Querying on IDs doesn't work because the `parent_id` seems off
         # query = select(pdgid_table.c.pdgid) \
         #     .where(pdgid_table.c.parent_id == bindparam('parent_id'))
         # params = {'parent_id': self._get_pdgid()['id']}
-        query = select(pdgid_table.c.pdgid) \
-            .where(pdgid_table.c.parent_pdgid == bindparam('parent_pdgid'))
-        params = {'parent_pdgid': self.baseid}
-        with self.api.engine.connect() as conn:
-            child_pdgids = [row.pdgid for row
-                            in conn.execute(query, params)]
+        rows = self.api.get_rows(('pdgid', 'pdgid', 'parent_pdgid', self.baseid), self.api.statement('children'),
+                                 {'parent_pdgid': self.baseid})
+        child_pdgids = [row['pdgid'] for row in rows]
         for child_pdgid in child_pdgids:
             child = self.api.get(child_pdgid)
             yield child
@@ -573,15 +606,7 @@ class PdgData(object):
         documentation for the meaning of the "CP charge". This flag will be `None`
         if the data applies to ALL particles listed under the PDG identifier.
         """
-        digits = [c for c in self.data_flags if c.isdigit()]
-        if len(digits) == 0:
-            return None
-        assert len(digits) == 1
-        mag = int(digits[0])
-        if mag != 0:
-            assert ('+' in self.data_flags) ^ ('-' in self.data_flags)
-        sign = -1 if '-' in self.data_flags else 1
-        return sign * mag
+        return get_cp_charge_flag(self.data_flags)
 
 
 class PdgProperty(PdgData):
@@ -637,23 +662,8 @@ class PdgProperty(PdgData):
             :exc:`~pdg.errors.PdgAmbiguousValueError`: If the API is in pedantic
                 mode and there are multiple relevant summary values.
         """
-        if not summary_table_only:
-            summaries = self.summary_values(summary_table_only=False)
-            if len(summaries) == 1:
-                return summaries[0]
-            else:
-                return self.best_summary(summary_table_only=True)
-        else:
-            summaries = self.summary_values(summary_table_only=True)
-            if len(summaries) == 1:
-                return summaries[0]
-            elif len(summaries) == 0:
-                return None
-            else:
-                if self.api.pedantic:
-                    raise PdgAmbiguousValueError('%s (%s) has multiple summary values' % (self.pdgid, self.description))
-                else:
-                    return summaries[0]
+        return select_best_summary(self._get_summary_values(), summary_table_only, self.api.pedantic,
+                                   lambda: '%s (%s)' % (self.pdgid, self.description))
 
     def has_best_summary(self, summary_table_only: bool=False) -> bool:
         """Query whether there is a single PDG "best" value for this property.
@@ -673,25 +683,29 @@ class PdgProperty(PdgData):
         except PdgAmbiguousValueError:
             return False
 
+    def _get_measurement_ids(self) -> list[int]:
+        "Get the IDs of all measurements associated with this property."
+        return list(get_linked_ids(self.api, 'pdgmeasurement', 'pdgid', self.baseid))
+
     def get_measurements(self) -> Iterator[PdgMeasurement]:
         "Get all of the measurements associated with this property."
-        pdgmsmt_table = self.api.db.tables['pdgmeasurement']
-        query = select(pdgmsmt_table.c.id)
-        query = query.where(pdgmsmt_table.c.pdgid == bindparam('pdgid'))
-        with self.api.engine.connect() as conn:
-            for entry in conn.execute(query, {'pdgid': self.baseid}):
-                yield PdgMeasurement(self.api, entry.id)
+        for msmt_id in self._get_measurement_ids():
+            yield PdgMeasurement(self.api, msmt_id)
 
     @property
     def num_measurements(self) -> int:
         "Get the number of measurements associated with this property."
-        pdgmsmt_table = self.api.db.tables['pdgmeasurement']
-        query = select(func.count('*'))
-        query = query.where(pdgmsmt_table.c.pdgid == bindparam('pdgid'))
-        with self.api.engine.connect() as conn:
-            row = conn.execute(query, {'pdgid': self.baseid}).fetchone()
-            assert row is not None
-            return row[0]
+        if 'num_measurements' not in self.cache:
+            # May have been set by PdgParticle.properties() already
+            preloaded = self.api.preloaded
+            ids = preloaded.get_rows(('pdgmeasurement', 'id', 'pdgid', self.baseid)) if preloaded is not None else None
+            if ids is not None:
+                self.cache['num_measurements'] = len(ids)
+            else:
+                rows = self.api.get_rows(('pdgmeasurement', 'count', 'pdgid', self.baseid),
+                                         self.api.statement('measurement_count'), {'pdgid': self.baseid})
+                self.cache['num_measurements'] = rows[0]['num_measurements']
+        return cast(int, self.cache['num_measurements'])
 
     @property
     def confidence_level(self) -> Optional[float]:
@@ -2,11 +2,11 @@
 Classes supporting decays and branching fractions/ratios.
 """
 
-from sqlalchemy import bindparam, select
-
 from pdg.data import PdgProperty
-from pdg.errors import PdgAmbiguousValueError, PdgInvalidPdgIdError, PdgNoDataError
+from pdg.errors import PdgAmbiguousValueError, PdgNoDataError
 from pdg.particle import PdgItem, PdgParticle
+from pdg.products import DecaySignature
+from pdg.utils import get_row_data
 from typing import Iterator, Optional, cast
 
 
@@ -47,14 +47,8 @@ class PdgBranchingFraction(PdgProperty):
     def _get_decay(self) -> list[dict]:
         """Get decay information from the database."""
         if 'pdgdecay' not in self.cache:
-            pdgdecay_table = self.api.db.tables['pdgdecay']
-            query = select(pdgdecay_table).where(pdgdecay_table.c.pdgid == bindparam('pdgid'))
-            with self.api.engine.connect() as conn:
-                try:
-                    result = conn.execute(query, {'pdgid': self.baseid}).fetchall()
-                    self.cache['pdgdecay'] = [dict(row._mapping) for row in result]
-                except AttributeError:
-                    raise PdgInvalidPdgIdError('No PDGDECAY entry for %s' % self.pdgid)
+            self.cache['pdgdecay'] = self.api.get_rows(('pdgdecay', 'pdgid', self.baseid),
+                                                       self.api.statement('pdgdecay'), {'pdgid': self.baseid})
         return cast(list[dict], self.cache['pdgdecay'])
 
     def _repr_extra(self) -> str:
@@ -63,18 +57,26 @@ class PdgBranchingFraction(PdgProperty):
 
     @property
     def decay_products(self) -> list[PdgDecayProduct]:
-        "A list of all `PdgDecayProduct` objects for the decay."
+        """A list of all `PdgDecayProduct` objects for the decay.
+
+        The items of the products are taken from the items loaded by
+        :meth:`PdgParticle.prefetch_decay_products
+        <pdg.particle.PdgParticle.prefetch_decay_products>`, if any.
+        """
+        items = cast(dict[int, PdgItem], self.cache.get('decay_items', {}))
         products = []
         for row in self._get_decay():
             if not row['is_outgoing']:
                 continue
 
-            product = PdgDecayProduct(
-                item=PdgItem(self.api, row['pdgitem_id']),
-                multiplier=row['multiplier'],
-                subdecay=(PdgBranchingFraction(self.api, row['subdecay'])
-                          if row['subdecay_id'] else None))
-            products.append(product)
+            item = items.get(row['pdgitem_id'])
+            if item is None:
+                item = PdgItem(self.api, row['pdgitem_id'])
+            subdecay = None
+            if row['subdecay_id']:
+                subdecay_pdgid = get_row_data(self.api, 'pdgid', row['subdecay_id'])['pdgid']
+                subdecay = self.api.get_data_object(PdgBranchingFraction, subdecay_pdgid, self.edition)
+            products.append(PdgDecayProduct(item=item, multiplier=row['multiplier'], subdecay=subdecay))
         return products
 
     @property
@@ -104,6 +106,18 @@ class PdgBranchingFraction(PdgProperty):
         else:
             return 0
 
+    @property
+    def signature(self) -> Optional[DecaySignature]:
+        """Canonical signature of the decay (the sorted names of its incoming and outgoing items, with aliases resolved).
+
+        The signature is the same for all decays with the same incoming and
+        outgoing particles, however they are encoded, and is taken from the
+        :attr:`PdgApi.product_index <pdg.api.PdgApi.product_index>` (see
+        :mod:`pdg.products`). It is `None` if the PDG Identifier is not a
+        decay.
+        """
+        return self.api.product_index.signature(self.baseid)
+
     def subdecays(self) -> Iterator['PdgBranchingFraction']:
         """Get iterator over all subdecays of this decay.
 
@@ -119,26 +133,33 @@ class PdgBranchingFraction(PdgProperty):
             self.api.logger.warning(warning)
             self.api._subdecay_warned = True
         child_dtype = self.data_type[:3] + str(self.subdecay_level + 1)
-        pdgid = self.api.db.tables['pdgid']
-        query = select(pdgid.c.pdgid)
-        query = query.where(pdgid.c.parent_pdgid == bindparam('parent_pdgid'))
-        query = query.where(pdgid.c.data_type == bindparam('data_type'))
-        with self.api.engine.connect() as conn:
-            matches = conn.execute(query, {'parent_pdgid': self.baseid,
-                                           'data_type': child_dtype}).fetchall()
-        for row in matches:
-            yield PdgBranchingFraction(self.api, row.pdgid, self.edition)
+        rows = self.api.get_rows(('pdgid', 'pdgid', 'parent_pdgid', self.baseid), self.api.statement('children'),
+                                 {'parent_pdgid': self.baseid})
+        for row in rows:
+            if row['data_type'] == child_dtype:
+                yield self.api.get_data_object(PdgBranchingFraction, row['pdgid'], self.edition)
+
+    def conjugates(self) -> list['PdgBranchingFraction']:
+        """Get the branching fractions of the charge-conjugate decay mode.
+
+        The conjugate mode is the decay with the charge conjugates of the
+        incoming and outgoing items, which is looked up in the
+        :attr:`PdgApi.conjugation_index
+        <pdg.api.PdgApi.conjugation_index>` (see :mod:`pdg.conjugation`).
+        Since the Particle Listings imply the charge-conjugate modes, the list
+        is usually empty, except for self-conjugate decays, for which it
+        includes this branching fraction itself.
+        """
+        return [self.api.get_data_object(PdgBranchingFraction, pdgid, self.edition)
+                for pdgid in self.api.conjugation_index.conjugate_decays(self.baseid)]
 
     def branching_ratios(self) -> Iterator['PdgBranchingRatio']:
         """Get iterator over all branching ratios associated with this
         branching fraction."""
-        pdgid_map = self.api.db.tables['pdgid_map']
-        query = select(pdgid_map.c.target) \
-            .where(pdgid_map.c.source == bindparam('source'))
-        with self.api.engine.connect() as conn:
-            matches = conn.execute(query, {'source': self.baseid}).fetchall()
-        for row in matches:
-            yield PdgBranchingRatio(self.api, row.target, self.edition)
+        rows = self.api.get_rows(('pdgid_map', 'target', 'source', self.baseid),
+                                 self.api.statement('pdgid_map_targets'), {'source': self.baseid})
+        for row in rows:
+            yield self.api.get_data_object(PdgBranchingRatio, row['target'], self.edition)
 
 
 class PdgBranchingRatio(PdgProperty):
@@ -146,13 +167,10 @@ class PdgBranchingRatio(PdgProperty):
     def branching_fractions(self) -> Iterator[PdgBranchingFraction]:
         """Get iterator over all branching fractions associated with this
         branching ratio."""
-        pdgid_map = self.api.db.tables['pdgid_map']
-        query = select(pdgid_map.c.source) \
-            .where(pdgid_map.c.target == bindparam('target'))
-        with self.api.engine.connect() as conn:
-            matches = conn.execute(query, {'target': self.baseid}).fetchall()
-        for row in matches:
-            yield PdgBranchingFraction(self.api, row.source, self.edition)
+        rows = self.api.get_rows(('pdgid_map', 'source', 'target', self.baseid),
+                                 self.api.statement('pdgid_map_sources'), {'target': self.baseid})
+        for row in rows:
+            yield self.api.get_data_object(PdgBranchingFraction, row['source'], self.edition)
 
     def _repr_extra(self) -> str:
         "Extra details for `__repr__`"
@@ -0,0 +1,293 @@
+"""
+In-memory graph of all decays, for exploring decay chains.
+
+Following a decay chain with the data objects of the API means getting the
+:meth:`~pdg.particle.PdgParticle.branching_fractions` of a particle, the
+:attr:`~pdg.decay.PdgBranchingFraction.decay_products` of each decay, their
+:attr:`~pdg.particle.PdgItem.particle`, and so on, with queries for every step.
+The :class:`DecayGraph` of an API object (see :meth:`PdgApi.get_decay_graph
+<pdg.api.PdgApi.get_decay_graph>`) instead loads all decays from table
+`pdgdecay`, the best summary values of all branching fractions, and the
+particles of all items (through the :attr:`PdgApi.name_index
+<pdg.api.PdgApi.name_index>`) in a few queries, and keeps them as a directed
+graph from particles through their decay modes to the particles they decay to.
+
+Since the Particle Listings give the decay modes of only one charge state
+(e.g. of `D+`, implying those of `D-`), each decay mode is also registered
+under the conjugate particle, with the conjugate products (see
+:mod:`pdg.conjugation`), unless the conjugate decay is listed itself.
+
+Decay trees (:meth:`DecayGraph.tree`) and decay chains (:meth:`DecayGraph.chains`)
+follow the exclusive decay modes (data type `BFX`) of the particles, and the
+decay products that refer to a unique particle. A particle is not expanded
+again below itself in a decay tree, so that cycles in the graph end there.
+The trees of the particles are memoized, so that e.g. the subtrees of the D
+mesons are shared by the trees of all B mesons.
+"""
+
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple, Optional
+
+from pdg.data import PdgSummaryValue, select_best_summary
+from pdg.errors import PdgAmbiguousValueError, PdgNoDataError
+from pdg.utils import prefix_range
+
+if TYPE_CHECKING:
+    from pdg.api import PdgApi
+
+
+# Data type of the decay modes followed by decay trees and chains
+EXCLUSIVE_DATA_TYPE = 'BFX'
+
+
+class DecayProduct(NamedTuple):
+    "A product of a :class:`DecayMode`."
+    item_id: int
+    name: str
+    multiplier: int
+    particle: Optional[dict]    # row of table pdgparticle, if the item refers to a unique particle
+
+
+class DecayMode(NamedTuple):
+    "A decay mode in a :class:`DecayGraph`."
+    pdgid: str
+    description: str
+    data_type: str
+    parent: dict                # row of table pdgparticle
+    products: tuple[DecayProduct, ...]
+    branching_fraction: Optional[float]     # best summary value, or None for limits or without summary value
+    conjugate: bool = False     # whether this is the charge conjugate of the decay mode of the Listings
+
+
+class DecayBranch(NamedTuple):
+    "A decay mode in a :class:`DecayNode`, with the nodes of the product particles."
+    mode: DecayMode
+    children: tuple['DecayNode', ...]
+
+
+class DecayNode(NamedTuple):
+    "A particle in a decay tree, with its decay modes (empty for leaves)."
+    particle: dict              # row of table pdgparticle
+    branches: tuple[DecayBranch, ...]
+
+
+class DecayChain(NamedTuple):
+    "A decay chain, given by a decay mode of a particle, a decay mode of one of its products, and so on."
+    modes: tuple[DecayMode, ...]
+    branching_fraction: Optional[float]     # product of the branching fractions, or None if any is unknown
+
+
+class DecayGraph:
+    """Directed graph of all decays of an edition.
+
+    See :mod:`pdg.graph`. Particles are given as :class:`~pdg.particle.PdgParticle`
+    objects or by name.
+    """
+    def __init__(self, api: 'PdgApi', edition: Optional[str]=None):
+        """
+        Note:
+            The constructor is intended for internal API use. Use
+            :meth:`PdgApi.get_decay_graph <pdg.api.PdgApi.get_decay_graph>`
+            instead.
+
+        Args:
+            api: API object for reading the tables.
+            edition: Edition from which the branching fractions are taken
+                (default: the default edition of the API).
+        """
+        self.api = api
+        self.edition = edition or api.default_edition
+        names = api.name_index
+        conjugation = api.conjugation_index
+        t0 = time.perf_counter()
+        data_type_from, data_type_to = prefix_range('BF')
+        with api.connection() as conn:
+            decay_rows = conn.execute(api.statement('all_decays')).fetchall()
+            item_names = {item.id: item.name for item in conn.execute(api.statement('all_items'))}
+            summaries: dict[str, list[PdgSummaryValue]] = defaultdict(list)
+            for row in conn.execute(api.statement('decay_summaries'),
+                                    {'edition': self.edition, 'data_type_from': data_type_from,
+                                     'data_type_to': data_type_to}):
+                summaries[row.pdgid].append(PdgSummaryValue(row._mapping))
+
+        # Decay modes by parent particle, in the order of the Particle Listings
+        incoming: dict[str, list[Any]] = defaultdict(list)
+        outgoing: dict[str, list[Any]] = defaultdict(list)
+        for row in decay_rows:
+            (outgoing if row.is_outgoing else incoming)[row.pdgid].append(row)
+        self._modes: dict[int, list[DecayMode]] = defaultdict(list)
+        listed = []
+        for pdgid, rows in incoming.items():
+            # Only decays of a single unique particle (e.g. not of charge-averaged states or of two nucleons)
+            if len(rows) != 1 or rows[0].multiplier != 1:
+                continue
+            parent = names.particle(rows[0].pdgitem_id)
+            if parent is None:
+                continue
+            products = tuple(DecayProduct(row.pdgitem_id, row.name, row.multiplier, names.particle(row.pdgitem_id))
+                             for row in outgoing[pdgid])
+            mode = DecayMode(pdgid, rows[0].description, rows[0].data_type, parent, products,
+                             self._branching_fraction(pdgid, summaries[pdgid]))
+            self._modes[parent['id']].append(mode)
+            listed.append(mode)
+
+        # Charge conjugate modes, unless listed themselves (e.g. for self-conjugate decays)
+        for mode in listed:
+            parent = conjugation.conjugate_particle(mode.parent['id'])
+            if parent is None or parent['id'] == mode.parent['id'] or conjugation.conjugate_decays(mode.pdgid):
+                continue
+            products = []
+            for product in mode.products:
+                item_id = conjugation.conjugate_item(product.item_id)
+                if item_id is None:
+                    # Conjugate not in the database, e.g. for some exotic states
+                    products.append(product)
+                else:
+                    products.append(DecayProduct(item_id, item_names[item_id], product.multiplier,
+                                                 names.particle(item_id)))
+            self._modes[parent['id']].append(mode._replace(parent=parent, products=tuple(products), conjugate=True))
+        self.num_modes = sum(len(modes) for modes in self._modes.values())
+        self._trees: dict[tuple[int, int], tuple[DecayNode, frozenset[int]]] = {}    # see _tree()
+        self.load_time = time.perf_counter() - t0
+
+    def _branching_fraction(self, pdgid: str, summaries: list[PdgSummaryValue]) -> Optional[float]:
+        "Get the value of the best summary value (see PdgProperty.best_summary()), or `None` for a limit."
+        try:
+            best = select_best_summary(summaries, False, self.api.pedantic, lambda: pdgid)
+        except PdgAmbiguousValueError:
+            return None
+        if best is None or best.is_limit:
+            return None
+        return best.value
+
+    def __repr__(self) -> str:
+        "Get a concise representation including the numbers of particles and decay modes and the load time."
+        return 'DecayGraph(edition=%s, particles=%d, modes=%d, load_time=%.3f)' % (
+            self.edition, len(self._modes), self.num_modes, self.load_time)
+
+    def _particle_row(self, particle: Any) -> dict:
+        "Get the row of table `pdgparticle` of a particle given as `PdgParticle` or by name."
+        if isinstance(particle, str):
+            row = self.api.name_index.particle(self.api.name_index.item_id(particle))
+            if row is None:
+                raise PdgNoDataError('No unique particle named %s' % particle)
+            return row
+        return particle._get_particle_data()
+
+    def modes(self, particle: Any) -> list[DecayMode]:
+        """Get all decay modes of a particle.
+
+        Args:
+            particle: :class:`~pdg.particle.PdgParticle` object or particle
+                name.
+
+        Returns:
+            Decay modes of all data types (including inclusive modes and
+            subdecay modes), in the order of the Particle Listings.
+
+        Raises:
+            :exc:`~pdg.errors.PdgNoDataError`: If a name does not refer to a
+                unique particle.
+        """
+        return list(self._modes.get(self._particle_row(particle)['id'], []))
+
+    def tree(self, particle: Any, depth: int) -> DecayNode:
+        """Get the decay tree of a particle.
+
+        Args:
+            particle: :class:`~pdg.particle.PdgParticle` object or particle
+                name.
+            depth: Number of decay levels, e.g. 1 for the decay modes of the
+                particle only.
+
+        Returns:
+            Root node of the tree, whose branches are the exclusive decay modes
+            of the particle, each with the nodes of its product particles to
+            depth `depth` - 1. Nodes are shared between trees.
+
+        Raises:
+            :exc:`~pdg.errors.PdgNoDataError`: If a name does not refer to a
+                unique particle.
+        """
+        return self._tree(self._particle_row(particle), depth, set())[0]
+
+    def _tree(self, particle: dict, depth: int, ancestors: set[int]) -> tuple[DecayNode, frozenset[int], bool]:
+        """Get the tree of a particle below the given ancestors.
+
+        Returns the root node, the IDs of all particles expanded in the tree,
+        and whether the tree was cut short because of a cycle.
+        """
+        if depth <= 0:
+            return DecayNode(particle, ()), frozenset(), False
+        if particle['id'] in ancestors:
+            return DecayNode(particle, ()), frozenset(), True
+        key = (particle['id'], depth)
+        memoized = self._trees.get(key)
+        if memoized is not None and not memoized[1] & ancestors:
+            return memoized[0], memoized[1], False
+        ancestors.add(particle['id'])
+        expanded = {particle['id']}
+        cut = False
+        branches = []
+        for mode in self._modes.get(particle['id'], []):
+            if mode.data_type != EXCLUSIVE_DATA_TYPE:
+                continue
+            children = []
+            for product in mode.products:
+                if product.particle is not None:
+                    child, child_expanded, child_cut = self._tree(product.particle, depth - 1, ancestors)
+                    children.append(child)
+                    expanded |= child_expanded
+                    cut = cut or child_cut
+            branches.append(DecayBranch(mode, tuple(children)))
+        ancestors.discard(particle['id'])
+        node = DecayNode(particle, tuple(branches))
+        # Trees cut short depend on the ancestors, and are therefore not memoized
+        if not cut:
+            self._trees[key] = (node, frozenset(expanded))
+        return node, frozenset(expanded), cut
+
+    def chains(self, particle: Any, depth: int, min_branching_fraction: Optional[float]=None) \
+            -> Iterator[DecayChain]:
+        """Get iterator over all decay chains of a particle.
+
+        A chain is given by an exclusive decay mode of the particle, followed
+        by an exclusive decay mode of one of its products, and so on. Chains
+        are returned in depth-first order, each followed by its extensions.
+
+        Args:
+            particle: :class:`~pdg.particle.PdgParticle` object or particle
+                name.
+            depth: Maximum number of decay modes in a chain.
+            min_branching_fraction: If set, only chains whose product of
+                branching fractions is known and at least this value are
+                returned (and extended).
+
+        Returns:
+            Iterator over :class:`DecayChain` tuples.
+
+        Raises:
+            :exc:`~pdg.errors.PdgNoDataError`: If a name does not refer to a
+                unique particle.
+        """
+        yield from self._chains(self.tree(particle, depth), (), 1., min_branching_fraction)
+
+    def _chains(self, node: DecayNode, modes: tuple[DecayMode, ...], fraction: Optional[float],
+                min_fraction: Optional[float]) -> Iterator[DecayChain]:
+        "Get iterator over the chains starting with the given modes, followed by a decay of the node's particle."
+        for branch in node.branches:
+            mode = branch.mode
+            chain_fraction = None
+            if fraction is not None and mode.branching_fraction is not None:
+                chain_fraction = fraction * mode.branching_fraction
+            if min_fraction is not None and (chain_fraction is None or chain_fraction < min_fraction):
+                continue
+            chain = modes + (mode,)
+            yield DecayChain(chain, chain_fraction)
+            seen = set()
+            for child in branch.children:
+                # Identical products are followed only once
+                if child.particle['id'] not in seen:
+                    seen.add(child.particle['id'])
+                    yield from self._chains(child, chain, chain_fraction, min_fraction)
@@ -26,9 +26,9 @@ class PdgMeasurement(object):
 
     def _get_measurement_data(self) -> dict:
         "Helper for retrieving SQLite data for this measurement."
-        return self.cache.get(
-            'pdgmeasurement',
-            get_row_data(self.api, 'pdgmeasurement', self.id))
+        if 'pdgmeasurement' not in self.cache:
+            self.cache['pdgmeasurement'] = get_row_data(self.api, 'pdgmeasurement', self.id)
+        return self.cache['pdgmeasurement']
 
     def values(self) -> Iterator['PdgValue']:
         """Get an iterator of :class:`PdgValue` objects for all of the
@@ -129,9 +129,9 @@ class PdgValue(object):
 
     def _get_value_data(self) -> dict:
         "Helper for retrieving SQLite data for this value."
-        return self.cache.get(
-            'pdgmeasurement_values',
-            get_row_data(self.api, 'pdgmeasurement_values', self.id))
+        if 'pdgmeasurement_values' not in self.cache:
+            self.cache['pdgmeasurement_values'] = get_row_data(self.api, 'pdgmeasurement_values', self.id)
+        return self.cache['pdgmeasurement_values']
 
     @property
     def measurement(self) -> PdgMeasurement:
@@ -346,9 +346,9 @@ class PdgReference(object):
 
     def _get_reference_data(self) -> dict:
         "Helper for retrieving SQLite data for this refernce."
-        return self.cache.get(
-            'pdgreference',
-            get_row_data(self.api, 'pdgreference', self.id))
+        if 'pdgreference' not in self.cache:
+            self.cache['pdgreference'] = get_row_data(self.api, 'pdgreference', self.id)
+        return self.cache['pdgreference']
 
     @property
     def publication_name(self) -> str:
@@ -401,9 +401,9 @@ class PdgFootnote(object):
 
     def _get_footnote_data(self) -> dict:
         "Helper for retrieving SQLite data for this footnote."
-        return self.cache.get(
-            'pdgfootnote',
-            get_row_data(self.api, 'pdgfootnote', self.id))
+        if 'pdgfootnote' not in self.cache:
+            self.cache['pdgfootnote'] = get_row_data(self.api, 'pdgfootnote', self.id)
+        return self.cache['pdgfootnote']
 
     @deprecated('Use "measurements" instead')
     def references(self) -> Iterator[PdgMeasurement]:
@@ -0,0 +1,237 @@
+"""
+In-memory index of particle names.
+
+Particles are looked up by name through the items of table `pdgitem`, which
+include the names of specific particle states as well as aliases, former
+("was") names, shortcuts and generic names, which refer to other items through
+table `pdgitem_map`. The :class:`NameIndex` of an API object (see
+:attr:`PdgApi.name_index <pdg.api.PdgApi.name_index>`) reads these tables once,
+and resolves all names to the rows of table `pdgparticle` of the particle(s)
+they refer to, so that :meth:`PdgApi.get_particle_by_name
+<pdg.api.PdgApi.get_particle_by_name>`, :meth:`PdgApi.get_particles_by_name
+<pdg.api.PdgApi.get_particles_by_name>` and :meth:`PdgApi.get_canonical_name
+<pdg.api.PdgApi.get_canonical_name>` run without any SQL queries. The index
+also supports prefix and fuzzy searches, e.g. for completing particle names in
+interactive tools.
+"""
+
+import difflib
+import itertools
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+from pdg.errors import PdgAmbiguousValueError, PdgNoDataError
+from pdg.utils import find_prefixed
+
+if TYPE_CHECKING:
+    from pdg.api import PdgApi
+
+
+def resolve_item(item_id: int, get_targets: Callable[[int], list[int]],
+                 get_particle_rows: Callable[[int], list[dict]],
+                 resolved: dict[int, tuple[Optional[dict], list[dict]]]) -> tuple[Optional[dict], list[dict]]:
+    """Resolve the particle(s) an item refers to.
+
+    An item refers to a unique particle if it has a row in table
+    `pdgparticle`, or if it maps to exactly one item referring to a unique
+    particle. Otherwise, it refers to the particles of all items it maps to
+    (through table `pdgitem_map`).
+
+    Args:
+        item_id: Item ID.
+        get_targets: Function returning the IDs of the items an item maps
+            to. It is only called for items without a row in table
+            `pdgparticle`.
+        get_particle_rows: Function returning the rows of table `pdgparticle`
+            of an item.
+        resolved: Results for the items resolved so far, which is updated
+            with the results for this item and all items it maps to.
+
+    Returns:
+        Tuple of the row of the unique particle (or `None`) and the rows of
+        all particles.
+    """
+    if item_id in resolved:
+        return resolved[item_id]
+    resolved[item_id] = (None, [])      # guards against cycles in table pdgitem_map
+    rows = get_particle_rows(item_id)
+    particle = rows[0] if rows else None
+    if particle is None:
+        targets = get_targets(item_id)
+        if len(targets) == 1:
+            particle = resolve_item(targets[0], get_targets, get_particle_rows, resolved)[0]
+        if particle is None:
+            resolved[item_id] = (None, [p for target_id in targets
+                                        for p in resolve_item(target_id, get_targets, get_particle_rows, resolved)[1]])
+            return resolved[item_id]
+    resolved[item_id] = (particle, [particle])
+    return resolved[item_id]
+
+
+class NameIndex:
+    """Index of the names of all items, resolved to the particles they refer to.
+
+    Names are resolved with :func:`resolve_item`, in the same way as by
+    :attr:`PdgItem.particle <pdg.particle.PdgItem.particle>` and
+    :attr:`PdgItem.particles <pdg.particle.PdgItem.particles>`.
+    """
+    def __init__(self, api: 'PdgApi'):
+        """
+        Note:
+            The constructor is intended for internal API use. Use
+            :attr:`PdgApi.name_index <pdg.api.PdgApi.name_index>` instead.
+
+        Args:
+            api: API object for reading the tables.
+        """
+        t0 = time.perf_counter()
+        # Rows are ordered by ID, as returned by the statements used by PdgItem
+        with api.connection() as conn:
+            items = conn.execute(api.statement('all_items')).fetchall()
+            item_map = conn.execute(api.statement('all_item_maps')).fetchall()
+            particles = [dict(row._mapping) for row in conn.execute(api.statement('all_item_particles'))]
+        self._names: dict[str, list[int]] = defaultdict(list)
+        self._folded_names: dict[str, list[int]] = defaultdict(list)
+        for item in items:
+            self._names[item.name].append(item.id)
+            self._folded_names[item.name.lower()].append(item.id)
+        self._targets: dict[int, list[int]] = defaultdict(list)
+        for row in item_map:
+            self._targets[row.pdgitem_id].append(row.target_id)
+        item_particles: dict[int, list[dict]] = defaultdict(list)
+        for particle in particles:
+            item_particles[particle['pdgitem_id']].append(particle)
+
+        # Resolve the particles of all items
+        self._resolved: dict[int, tuple[Optional[dict], list[dict]]] = {}
+        for item in items:
+            resolve_item(item.id, lambda i: self._targets.get(i, []), lambda i: item_particles.get(i, []),
+                         self._resolved)
+
+        # Names referring to at least one particle, for prefix and fuzzy searches
+        self.particle_names = sorted(item.name for item in items if self._resolved[item.id][1])
+        self._by_folded: dict[str, list[str]] = defaultdict(list)
+        for name in self.particle_names:
+            self._by_folded[name.lower()].append(name)
+        self._folded_keys = sorted(self._by_folded)
+        self.load_time = time.perf_counter() - t0
+
+    def __repr__(self) -> str:
+        "Get a concise representation including the number of names and the load time."
+        return 'NameIndex(names=%d, particle_names=%d, load_time=%.3f)' % (
+            len(self._names), len(self.particle_names), self.load_time)
+
+    def item_ids(self, name: str, case_sensitive: bool=True) -> list[int]:
+        """Get the IDs of the items with a given name.
+
+        Args:
+            name: Name to look up.
+            case_sensitive: Can be set to `False` to compare names
+                case-insensitively, in which case more than one item can match.
+
+        Returns:
+            List of item IDs (empty if there is no such item).
+        """
+        if case_sensitive:
+            return list(self._names.get(name, ()))
+        return list(self._folded_names.get(name.lower(), ()))
+
+    def item_id(self, name: str) -> int:
+        """Get the ID of the unique item with a given name.
+
+        Args:
+            name: Name to look up (case-sensitively).
+
+        Returns:
+            Item ID.
+
+        Raises:
+            :exc:`~pdg.errors.PdgNoDataError`: If there is no item with this
+                name.
+            :exc:`~pdg.errors.PdgAmbiguousValueError`: If there is more than
+                one item with this name.
+        """
+        item_ids = self._names.get(name, ())
+        if not item_ids:
+            raise PdgNoDataError('No item named %s' % name)
+        if len(item_ids) > 1:
+            raise PdgAmbiguousValueError('More than one PDGITEM named %s' % name)
+        return item_ids[0]
+
+    def particle(self, item_id: int) -> Optional[dict]:
+        """Get the unique particle of an item.
+
+        Args:
+            item_id: Item ID.
+
+        Returns:
+            Row of table `pdgparticle`, or `None` if the item does not refer to
+            exactly one particle.
+        """
+        return self._resolved.get(item_id, (None, []))[0]
+
+    def canonical_item(self, item_id: int) -> int:
+        """Get the canonical item of an item.
+
+        Args:
+            item_id: Item ID.
+
+        Returns:
+            ID of the item of the particle's row in table `pdgparticle` for
+            items referring to a unique particle (e.g. for aliases), and
+            otherwise `item_id`.
+        """
+        particle = self.particle(item_id)
+        return particle['pdgitem_id'] if particle is not None else item_id
+
+    def particles(self, item_id: int) -> list[dict]:
+        """Get all particles of an item.
+
+        Args:
+            item_id: Item ID.
+
+        Returns:
+            List of rows of table `pdgparticle`.
+        """
+        return self._resolved.get(item_id, (None, []))[1]
+
+    def prefix_search(self, prefix: str, case_sensitive: bool=True, limit: Optional[int]=None) -> list[str]:
+        """Get the names starting with a prefix that refer to at least one particle.
+
+        Args:
+            prefix: Prefix of the names, e.g. `'K_1'`.
+            case_sensitive: Can be set to `False` to compare the prefix
+                case-insensitively.
+            limit: Maximum number of names returned.
+
+        Returns:
+            Matching names in sorted (case-folded, if not `case_sensitive`) order.
+        """
+        if case_sensitive:
+            matches = find_prefixed(self.particle_names, prefix)
+        else:
+            matches = self._folded_prefixed(prefix.lower())
+        return list(itertools.islice(matches, limit))
+
+    def fuzzy_search(self, name: str, n: int=5, cutoff: float=0.6) -> list[str]:
+        """Get the names most similar to a (possibly misspelled) name that refer to at least one particle.
+
+        Similarity is computed case-insensitively with
+        :func:`difflib.get_close_matches`.
+
+        Args:
+            name: Name to look up.
+            n: Maximum number of names returned.
+            cutoff: Minimum similarity (between 0 and 1).
+
+        Returns:
+            Matching names, most similar first.
+        """
+        matches = difflib.get_close_matches(name.lower(), self._folded_keys, n, cutoff)
+        return [match for folded in matches for match in self._by_folded[folded]][:n]
+
+    def _folded_prefixed(self, folded_prefix: str) -> Iterator[str]:
+        "Get an iterator over the names whose case-folded form starts with a (case-folded) prefix."
+        for folded in find_prefixed(self._folded_keys, folded_prefix):
+            yield from self._by_folded[folded]
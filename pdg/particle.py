@@ -2,20 +2,111 @@
 Definition of top-level particle container class.
 """
 
-from sqlalchemy import select, bindparam, distinct, func
 from sqlalchemy import and_, or_
 from pdg.errors import PdgApiError, PdgNoDataError, PdgAmbiguousValueError
+from pdg.conjugation import conjugate_particle_row
 from pdg.measurement import PdgMeasurement
-from pdg.utils import make_id
+from pdg.names import resolve_item
+from pdg.utils import make_id, prefix_range
 from pdg.data import PdgLifetime, PdgMass, PdgWidth, PdgData, PdgProperty
 from pdg.units import HBAR_IN_GEV_S
-from typing import TYPE_CHECKING, Iterator, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, cast
 
 if TYPE_CHECKING:
     from pdg.api import PdgApi
     from pdg.decay import PdgBranchingFraction
 
 
+def select_best(properties: list[Any], particle: Any, pedantic: bool, quantity: Optional[str]=None) -> Any:
+    """Select the "best" property from a list of properties of a particle.
+
+    This implements the heuristics of :meth:`PdgParticle.best`, and is also
+    used for selecting the best properties of many particles at once (see
+    :mod:`pdg.columnar`).
+
+    Args:
+        properties: Candidate properties, which can be
+            :class:`~pdg.data.PdgProperty` objects or any other objects with
+            attributes `data_flags`, `num_measurements` and `cp_charge_flag`.
+            The number of measurements is only used if there is more than one
+            candidate.
+        particle: Particle whose property is selected, with attributes `charge`
+            and `cp_charge` (which are only used if needed).
+        pedantic: Whether multiple remaining candidates are an error.
+        quantity: Optional string that describes what was being sought in
+            case of error.
+
+    Returns:
+        "Best" property.
+
+    Raises:
+        :exc:`PdgNoDataError`: If no property qualifies.
+        :exc:`PdgAmbiguousValueError`: If `pedantic` is `True` and multiple
+            candidates remain after filtering.
+    """
+    # filter out "alternative" properties
+    props = [p for p in properties if 'A' not in p.data_flags]
+    # in non-pedantic mode, filter out "special" values
+    if not pedantic:
+        props = [p for p in props if 's' not in p.data_flags]
+    # filter out properties that don't have measurements
+    # (unless there are no other options; see pi0)
+    if len(props) > 1:
+        props = [p for p in props if p.num_measurements > 0]
+
+    # if we have any default properties, filter out all the others
+    default_props = [p for p in props if 'D' in p.data_flags]
+    if default_props:
+        props = default_props
+    if len(props) == 1:
+        return props[0]
+
+    # filter out properties that have the wrong charge magnitude
+    props = [p for p in props
+             if (p.cp_charge_flag is None)
+             or (abs(p.cp_charge_flag) == abs(particle.charge))]
+    if len(props) == 1:
+        return props[0]
+
+    # filter out properties that have the wrong "CP charge"
+    props = [p for p in props
+             if (p.cp_charge_flag is None)
+             or (p.cp_charge_flag == particle.cp_charge)]
+    if len(props) == 1:
+        return props[0]
+
+    for_what = ' for %s' % quantity if quantity else ''
+    if len(props) == 0:
+        raise PdgNoDataError('No best property found%s' % for_what)
+    else:
+        if pedantic:
+            err = 'Ambiguous best property%s' % for_what
+            raise PdgAmbiguousValueError(err)
+        else:
+            return props[0]
+
+
+def _closure_tables(rows: list[dict]) -> tuple[dict[int, dict[int, int]], dict[int, dict[int, dict]]]:
+    """Get the targets and particles of all items from rows of statement `item_closure` or `decay_item_closure`.
+
+    Returns:
+        Dictionaries from item ID to the target item IDs by ID in table
+        `pdgitem_map`, and to the rows of table `pdgparticle` by particle ID.
+    """
+    # Items with several targets and particles are returned with all their combinations
+    target_rows: dict[int, dict[int, int]] = {}
+    particle_rows: dict[int, dict[int, dict]] = {}
+    for row in rows:
+        item_id = row['closure_item_id']
+        item_targets = target_rows.setdefault(item_id, {})
+        item_particles = particle_rows.setdefault(item_id, {})
+        if row['closure_map_id'] is not None:
+            item_targets.setdefault(row['closure_map_id'], row['closure_target_id'])
+        if row['id'] is not None and row['id'] not in item_particles:
+            item_particles[row['id']] = {k: v for k, v in row.items() if not k.startswith('closure_')}
+    return target_rows, particle_rows
+
+
 class PdgItem:
     """A class to represent an "item" encountered in e.g. a description of a
     decay's products.
@@ -37,7 +128,7 @@ class PdgItem:
         """
         self.api = api
         self.pdgitem_id = pdgitem_id
-        self.cache: dict[str, bool | dict] = {}
+        self.cache: dict[str, bool | dict | list] = {}
         self.edition = edition
 
     def __repr__(self) -> str:
@@ -48,23 +139,53 @@ class PdgItem:
     def _get_pdgitem(self) -> dict:
         "Load the `PdgItem`'s data from the database."
         if 'pdgitem' not in self.cache:
-            pdgitem_table = self.api.db.tables['pdgitem']
-            query = select(pdgitem_table).where(pdgitem_table.c.id == bindparam('pdgitem_id'))
-            with self.api.engine.connect() as conn:
-                result = conn.execute(query, {'pdgitem_id': self.pdgitem_id}).fetchone()
-                if result is None:
-                    raise PdgNoDataError('No PDGITEM entry for %s' % self.pdgitem_id)
-                self.cache['pdgitem'] = dict(result._mapping)
+            rows = self.api.get_rows(('pdgitem', 'id', self.pdgitem_id), self.api.statement('pdgitem'),
+                                     {'pdgitem_id': self.pdgitem_id})
+            if not rows:
+                raise PdgNoDataError('No PDGITEM entry for %s' % self.pdgitem_id)
+            self.cache['pdgitem'] = rows[0]
         return cast(dict, self.cache['pdgitem'])
 
-    def _get_targets(self) -> Iterator['PdgItem']:
-        "Get all `PdgItem`s that this one maps directly to. Does not recurse."
-        pdgitem_map_table = self.api.db.tables['pdgitem_map']
-        query = select(pdgitem_map_table).where(pdgitem_map_table.c.pdgitem_id == bindparam('pdgitem_id'))
-        with self.api.engine.connect() as conn:
-            rows = conn.execute(query, {'pdgitem_id': self.pdgitem_id}).fetchall()
-            for row in rows:
-                yield PdgItem(self.api, row.target_id)
+    def _resolve(self) -> None:
+        """Resolve the particle(s) associated with the `PdgItem`.
+
+        The rows of table `pdgparticle` of the item and of all items it maps
+        to (recursively) are loaded with a single query (statement
+        `item_closure`), or taken from memory if tables `pdgitem_map` and
+        `pdgparticle` have been preloaded, and resolved with
+        :func:`~pdg.names.resolve_item`. The results are cached on the item.
+        """
+        if 'particles' in self.cache:
+            return
+        api = self.api
+        preloaded = api.preloaded
+        if preloaded is not None and 'pdgitem_map' in preloaded.tables and 'pdgparticle' in preloaded.tables:
+            def get_targets(item_id: int) -> list[int]:
+                return [row['target_id'] for row in api.get_rows(('pdgitem_map', 'pdgitem_id', item_id),
+                                                                 api.statement('pdgitem_map'),
+                                                                 {'pdgitem_id': item_id})]
+
+            def get_particle_rows(item_id: int) -> list[dict]:
+                return api.get_rows(('pdgparticle', 'pdgitem_id', item_id), api.statement('item_particles'),
+                                    {'pdgitem_id': item_id})
+        else:
+            rows = api.get_rows(('pdgitem', 'closure', self.pdgitem_id), api.statement('item_closure'),
+                                {'pdgitem_id': self.pdgitem_id})
+            target_rows, particle_rows = _closure_tables(rows)
+
+            def get_targets(item_id: int) -> list[int]:
+                return list(target_rows[item_id].values())
+
+            def get_particle_rows(item_id: int) -> list[dict]:
+                return list(particle_rows[item_id].values())
+        self._set_resolved(*resolve_item(self.pdgitem_id, get_targets, get_particle_rows, {}))
+
+    def _set_resolved(self, particle: Optional[dict], particles: list[dict]) -> None:
+        "Cache the particle(s) associated with the `PdgItem` (see :func:`~pdg.names.resolve_item`)."
+        if particle is not None:
+            self.cache['pdgparticle'] = particle
+        self.cache['has_particle'] = particle is not None
+        self.cache['particles'] = particles
 
     @property
     def has_particle(self) -> bool:
@@ -73,21 +194,7 @@ class PdgItem:
         The property :attr:`has_particles` indicates whether it is associated
         with one or more particles, rather than exactly one.
         """
-        if 'has_particle' not in self.cache:
-            pdgparticle_table = self.api.db.tables['pdgparticle']
-            query = select(pdgparticle_table).where(pdgparticle_table.c.pdgitem_id == bindparam('pdgitem_id'))
-            with self.api.engine.connect() as conn:
-                result = conn.execute(query, {'pdgitem_id': self.pdgitem_id}).fetchone()
-                if result:
-                    self.cache['pdgparticle'] = dict(result._mapping)
-                    self.cache['has_particle'] = True
-                else:
-                    targets = list(self._get_targets())
-                    if len(targets) == 1 and targets[0].has_particle:
-                        self.cache['pdgparticle'] = targets[0].cache['pdgparticle']
-                        self.cache['has_particle'] = True
-                    else:
-                        self.cache['has_particle'] = False
+        self._resolve()
         return cast(bool, self.cache['has_particle'])
 
     @property
@@ -103,9 +210,7 @@ class PdgItem:
             if self.has_particles:
                 raise PdgAmbiguousValueError('No unique PDGPARTICLE for PDGITEM %s' % self.pdgitem_id)
             raise PdgNoDataError('No PDGPARTICLE for PDGITEM %s' % self.pdgitem_id)
-        p = cast(dict, self.cache['pdgparticle'])
-        return PdgParticle(self.api, p['pdgid'], edition=self.edition, set_mcid=p['mcid'],
-                           set_name=p['name'])
+        return self.api.get_particle_from_row(cast(dict, self.cache['pdgparticle']), self.edition)
 
     @property
     def particles(self) -> list['PdgParticle']:
@@ -114,14 +219,8 @@ class PdgItem:
         The property :attr:`particles` can be used when one expects exactly one
         associated particle.
         """
-        if self.has_particle:
-            return [self.particle]
-        else:
-            result = []
-            for target in self._get_targets():
-                for p in target.particles:
-                    result.append(p)
-            return result
+        self._resolve()
+        return [self.api.get_particle_from_row(row, self.edition) for row in cast(list, self.cache['particles'])]
 
     @property
     def has_particles(self) -> bool:
@@ -130,7 +229,8 @@ class PdgItem:
         The property :attr:`has_particle` indicates whether it is associated
         with exactly one particle.
         """
-        return len(list(self.particles)) > 0
+        self._resolve()
+        return len(cast(list, self.cache['particles'])) > 0
 
     @property
     def name(self) -> str:
@@ -235,81 +335,35 @@ class PdgParticle(PdgData):
             :exc:`PdgAmbiguousValueError`: If the API is in pedantic mode and
                 multiple candidates remain after filtering.
         """
-        # filter out "alternative" properties
-        props = [p for p in properties if 'A' not in p.data_flags]
-        # in non-pedantic mode, filter out "special" values
-        if not self.api.pedantic:
-            props = [p for p in props if 's' not in p.data_flags]
-        # filter out properties that don't have measurements
-        # (unless there are no other options; see pi0)
-        if len(props) > 1:
-            props = [p for p in props if p.num_measurements > 0]
-
-        # if we have any default properties, filter out all the others
-        default_props = [p for p in props if 'D' in p.data_flags]
-        if default_props:
-            props = default_props
-        if len(props) == 1:
-            return props[0]
-
-        # filter out properties that have the wrong charge magnitude
-        props = [p for p in props
-                 if (p.cp_charge_flag is None)
-                 or (abs(p.cp_charge_flag) == abs(self.charge))]
-        if len(props) == 1:
-            return props[0]
-
-        # filter out properties that have the wrong "CP charge"
-        props = [p for p in props
-                 if (p.cp_charge_flag is None)
-                 or (p.cp_charge_flag == self.cp_charge)]
-        if len(props) == 1:
-            return props[0]
-
-        for_what = ' for %s' % quantity if quantity else ''
-        if len(props) == 0:
-            raise PdgNoDataError('No best property found%s' % for_what)
-        else:
-            if self.api.pedantic:
-                err = 'Ambiguous best property%s' % for_what
-                raise PdgAmbiguousValueError(err)
-            else:
-                return props[0]
+        return select_best(list(properties), self, self.api.pedantic, quantity)
 
     def _get_particle_data(self) -> dict:
         "Get particle data."
         if 'pdgparticle' not in self.cache:
-            pdgparticle_table = self.api.db.tables['pdgparticle']
-            query = select(pdgparticle_table)
-            query = query.where(pdgparticle_table.c.pdgid == bindparam('pdgid'))
+            # All states of the particle are loaded (and shared through the row cache),
+            # and the one(s) matching the MC ID and name are selected here
+            rows = self.api.get_rows(('pdgparticle', 'pdgid', self.baseid), self.api.statement('particle'),
+                                     {'pdgid': self.baseid})
             if self.set_mcid is not None:
-                query = query.where(pdgparticle_table.c.mcid == bindparam('mcid'))
+                rows = [row for row in rows if row['mcid'] == self.set_mcid]
+            matches = rows
             if self.set_name is not None:
-                query = query.where(pdgparticle_table.c.name == bindparam('name'))
-            with self.api.engine.connect() as conn:
-                params = {'pdgid': self.baseid, 'mcid': self.set_mcid, 'name': self.set_name}
-                matches = conn.execute(query, params).fetchall()
+                matches = [row for row in rows if row['name'] == self.set_name]
             if len(matches) == 1:
-                self.cache['pdgparticle'] = dict(matches[0]._mapping)
+                self.cache['pdgparticle'] = matches[0]
             else:
                 # Charge-specific state either not found or ambiguous
-                query = select(pdgparticle_table)
-                query = query.where(pdgparticle_table.c.pdgid == bindparam('pdgid'))
-                if self.set_mcid is not None:
-                    query = query.where(pdgparticle_table.c.mcid == bindparam('mcid'))
-                query = query.where(pdgparticle_table.c.cc_type == 'S')
-                query = query.where(pdgparticle_table.c.name.notlike('%bar%'))   # Exclude generic "*bar" states
-                with self.api.engine.connect() as conn:
-                    params = {'pdgid': self.baseid, 'mcid': self.set_mcid}
-                    matches_g = conn.execute(query, params).fetchall()
+                # (names are compared case-insensitively, like SQL LIKE in SQLite)
+                matches_g = [row for row in rows
+                             if row['cc_type'] == 'S' and 'bar' not in row['name'].lower()]   # Exclude generic "*bar" states
                 if len(matches_g) == 0:
                     mcid_string = ', MC ID = %s' % self.set_mcid if self.set_mcid else ''
                     raise PdgNoDataError('Particle data for %s%s not found' % (self.pdgid, mcid_string))
                 elif len(matches_g) == 1:
-                    self.cache['pdgparticle'] = dict(matches_g[0]._mapping)
+                    self.cache['pdgparticle'] = matches_g[0]
                 else:
-                    names = [p.name for p in matches_g]
-                    mcids = list(set([p.mcid for p in matches]))
+                    names = [p['name'] for p in matches_g]
+                    mcids = list(set([p['mcid'] for p in matches]))
                     raise PdgAmbiguousValueError('Multiple particles for %s: MCID %s, names %s' % (self.baseid, mcids, names))
         return cast(dict, self.cache['pdgparticle'])
 
@@ -347,58 +401,70 @@ class PdgParticle(PdgData):
         Returns:
             Iterator over particle property data.
         """
-        pdgid_table = self.api.db.tables['pdgid']
-        query = select(distinct(pdgid_table.c.pdgid))
-        if require_summary_data or in_summary_table is not None:
-            pdgdata_table = self.api.db.tables['pdgdata']
-            query = query.join(pdgdata_table)
-            query = query.where(pdgdata_table.c.edition == bindparam('edition'))
-            if in_summary_table is not None:
-                query = query.where(pdgdata_table.c.in_summary_table == bindparam('in_summary_table'))
-        query = query.where(pdgid_table.c.parent_pdgid.like(bindparam('parent_id')))
         if data_type_key is None:
-            # NOTE: like/notlike SQL operators never match null values
-            query = query.where((pdgid_table.c.data_type.notlike('BF%')) | (pdgid_table.c.data_type.is_(None)))
-            query = query.where((pdgid_table.c.data_type.notlike('BR%')) | (pdgid_table.c.data_type.is_(None)))
+            data_type_filter = 'default'
+        # NOTE: like may or may not be case-sensitive, depending on database, so use it only for BR* and BF*
+        # NOTE: like will not match null values, so data_type='%' must be treated separately
+        elif '%' in data_type_key:
+            data_type_filter = 'all' if data_type_key == '%' else 'like'
         else:
-            # NOTE: like may or may not be case-sensitive, depending on database, so use it only for BR* and BF*
-            # NOTE: like will not match null values, so data_type='%' must be treated separately
-            if '%' in data_type_key:
-                if data_type_key != '%':
-                    query = query.where(pdgid_table.c.data_type.like(bindparam('data_type_key')))
-            else:
-                query = query.where(pdgid_table.c.data_type == bindparam('data_type_key'))
-            if omit_branching_ratios:
-                query = query.where((pdgid_table.c.data_type.notlike('BR%')) | (pdgid_table.c.data_type.is_(None)))
-        query = query.order_by(pdgid_table.c.sort)
-        with self.api.engine.connect() as conn:
-            for entry in conn.execute(query, {'parent_id': self.baseid+'%',
-                                              'edition': self.edition,
-                                              'data_type_key': data_type_key,
-                                              'in_summary_table': in_summary_table}):
-                prop = self.api.get(make_id(entry.pdgid, self.edition))
-
-                # For masses, widths, and lifetimes, we must take care to choose
-                # the appropriate entry according to the particle's charge.
-                # Other types of properties don't require further checks.
-                if prop.data_type not in 'MGT':
-                    yield prop
-
-                # NOTE: Now that 's' properties are sorted last, we can safely
-                # include them without breaking best() etc.
-
-                # If this property is not charge-specific, yield it.
-                elif not any(flag in prop.data_flags for flag in '012'):
-                    yield prop
-
-                # If this particle isn't a specific charge state, yield
-                # everything.
-                elif self.charge is None:
-                    yield prop
-
-                # Finally check whether the charges match
-                elif str(int(abs(self.charge))) in prop.data_flags:
-                    yield prop
+            data_type_filter = 'equal'
+        join_data = require_summary_data or in_summary_table is not None
+        props: list[PdgData] = []
+        pdgids = None
+        if self.api.preloaded is not None:
+            pdgids = self.api.preloaded.property_pdgids(self.baseid, self.edition, join_data, in_summary_table,
+                                                        data_type_filter, data_type_key, omit_branching_ratios)
+        if pdgids is not None:
+            props = [self.api.get(make_id(pdgid, self.edition)) for pdgid in pdgids]
+        else:
+            # One row per property and summary value, including everything best() needs,
+            # so that the properties are returned with all their data already loaded
+            query = self.api.statement('properties', join_data, in_summary_table is not None, data_type_filter,
+                                       omit_branching_ratios)
+            parent_from, parent_to = prefix_range(self.baseid)
+            with self.api.connection() as conn:
+                rows = [dict(row._mapping) for row in conn.execute(query, {'parent_from': parent_from,
+                                                                           'parent_to': parent_to,
+                                                                           'edition': self.edition,
+                                                                           'data_type_key': data_type_key,
+                                                                           'in_summary_table': in_summary_table})]
+            entries: list[tuple[dict, int, list[dict]]] = []
+            for row in rows:
+                if not entries or entries[-1][0]['pdgid'] != row['pdgid']:
+                    pdgid_row = {k: v for k, v in row.items() if not k.startswith('summary_')}
+                    entries.append((pdgid_row, pdgid_row.pop('num_measurements'), []))
+                if row['summary_id'] is not None:
+                    summary = {k[len('summary_'):]: v for k, v in row.items() if k.startswith('summary_')}
+                    summary['description'] = row['description']
+                    entries[-1][2].append(summary)
+            for pdgid_row, num_measurements, summaries in entries:
+                prop = self.api.get_from_row(pdgid_row, self.edition, summaries)
+                prop.cache.setdefault('num_measurements', num_measurements)
+                props.append(prop)
+        for prop in props:
+
+            # For masses, widths, and lifetimes, we must take care to choose
+            # the appropriate entry according to the particle's charge.
+            # Other types of properties don't require further checks.
+            if prop.data_type not in 'MGT':
+                yield prop
+
+            # NOTE: Now that 's' properties are sorted last, we can safely
+            # include them without breaking best() etc.
+
+            # If this property is not charge-specific, yield it.
+            elif not any(flag in prop.data_flags for flag in '012'):
+                yield prop
+
+            # If this particle isn't a specific charge state, yield
+            # everything.
+            elif self.charge is None:
+                yield prop
+
+            # Finally check whether the charges match
+            elif str(int(abs(self.charge))) in prop.data_flags:
+                yield prop
 
 
     def masses(self, require_summary_data: bool=True) -> Iterator[PdgMass]:
@@ -446,8 +512,8 @@ class PdgParticle(PdgData):
         return cast(Iterator[PdgLifetime],
                     self.properties('T', require_summary_data))
 
-    def branching_fractions(self, data_type_key: str='BF%', require_summary_data: bool=True) \
-            -> Iterator['PdgBranchingFraction']:
+    def branching_fractions(self, data_type_key: str='BF%', require_summary_data: bool=True,
+                            prefetch_products: bool=False) -> Iterator['PdgBranchingFraction']:
         """Get iterator over given type(s) of branching fraction data.
 
         Args:
@@ -459,14 +525,73 @@ class PdgParticle(PdgData):
             require_summary_data: Can be set `False` to include branching
                 fractions where the current edition has no summary value(s) in
                 the Particle Listings or Summary Table.
+            prefetch_products: Can be set to `True` to load the decay products
+                of all branching fractions, including their items and the
+                particles these refer to, with two additional queries (see
+                :meth:`prefetch_decay_products`), so that e.g.
+                :attr:`~pdg.decay.PdgBranchingFraction.decay_products` and the
+                :attr:`~PdgItem.particle` of each product need no further
+                queries.
         """
         if data_type_key[0:2] != 'BF':
             raise PdgApiError('illegal branching fraction data type key %s' % data_type_key)
-        return cast(Iterator['PdgBranchingFraction'],
-                    self.properties(data_type_key, require_summary_data))
+        branching_fractions = cast(Iterator['PdgBranchingFraction'],
+                                   self.properties(data_type_key, require_summary_data))
+        if prefetch_products:
+            branching_fractions = list(branching_fractions)
+            self.prefetch_decay_products(branching_fractions)
+            return iter(branching_fractions)
+        return branching_fractions
+
+    def prefetch_decay_products(self, branching_fractions: list['PdgBranchingFraction']) -> None:
+        """Load the decay products of branching fractions of this particle in bulk.
+
+        The rows of table `pdgdecay` of all decays of the particle are loaded
+        with one query, and their items, together with the particles they refer
+        to (resolved as by :attr:`PdgItem.particle` and
+        :attr:`PdgItem.particles`), with another one. The rows are cached on the
+        branching fractions, which share a single :class:`PdgItem` object per
+        item. Nothing is loaded if the tables of the decays have been preloaded
+        (see :meth:`PdgApi.preload <pdg.api.PdgApi.preload>`).
 
-    def exclusive_branching_fractions(self, include_subdecays: bool=False, require_summary_data: bool=True) \
-            -> Iterator['PdgBranchingFraction']:
+        Args:
+            branching_fractions: Branching fractions of this particle, e.g.
+                from :meth:`branching_fractions`.
+        """
+        api = self.api
+        preloaded = api.preloaded
+        if preloaded is not None and all(table in preloaded.tables
+                                         for table in ('pdgdecay', 'pdgitem', 'pdgitem_map', 'pdgparticle')):
+            return
+        if all('decay_items' in bf.cache for bf in branching_fractions):
+            return
+        parent_from, parent_to = prefix_range(self.baseid)
+        params = {'parent_from': parent_from, 'parent_to': parent_to}
+        with api.connection() as conn:
+            decay_rows = [dict(row._mapping) for row in conn.execute(api.statement('particle_decays'), params)]
+            closure_rows = [dict(row._mapping) for row in conn.execute(api.statement('decay_item_closure'), params)]
+        decays: dict[str, list[dict]] = {}
+        for row in decay_rows:
+            decays.setdefault(row['pdgid'], []).append(row)
+        target_rows, particle_rows = _closure_tables(closure_rows)
+        item_rows = {row['closure_item_id']: {k[len('closure_pdgitem_'):]: v for k, v in row.items()
+                                              if k.startswith('closure_pdgitem_')} for row in closure_rows}
+        resolved: dict[int, tuple[Optional[dict], list[dict]]] = {}
+        items: dict[int, PdgItem] = {}
+        for row in decay_rows:
+            item_id = row['pdgitem_id']
+            if item_id not in items:
+                item = PdgItem(api, item_id)
+                item.cache['pdgitem'] = item_rows[item_id]
+                item._set_resolved(*resolve_item(item_id, lambda i: list(target_rows[i].values()),
+                                                 lambda i: list(particle_rows[i].values()), resolved))
+                items[item_id] = item
+        for bf in branching_fractions:
+            bf.cache.setdefault('pdgdecay', decays.get(bf.baseid, []))
+            bf.cache['decay_items'] = items
+
+    def exclusive_branching_fractions(self, include_subdecays: bool=False, require_summary_data: bool=True,
+                                      prefetch_products: bool=False) -> Iterator['PdgBranchingFraction']:
         """Get iterator over exclusive branching fraction data.
 
         Args:
@@ -476,14 +601,16 @@ class PdgParticle(PdgData):
             require_summary_data: Can be set to `False` to include branching
                 fractions where the current edition has no summary value(s) in
                 the Particle Listings or Summary Table.
+            prefetch_products: Can be set to `True` to load all decay products
+                in bulk (see :meth:`branching_fractions`).
         """
         if include_subdecays:
-            return self.branching_fractions('BFX%', require_summary_data)
+            return self.branching_fractions('BFX%', require_summary_data, prefetch_products)
         else:
-            return self.branching_fractions('BFX', require_summary_data)
+            return self.branching_fractions('BFX', require_summary_data, prefetch_products)
 
-    def inclusive_branching_fractions(self, include_subdecays: bool=False, require_summary_data: bool=True) \
-            -> Iterator['PdgBranchingFraction']:
+    def inclusive_branching_fractions(self, include_subdecays: bool=False, require_summary_data: bool=True,
+                                      prefetch_products: bool=False) -> Iterator['PdgBranchingFraction']:
         """Get iterator over inclusive branching fraction data.
 
         Args:
@@ -493,11 +620,13 @@ class PdgParticle(PdgData):
             require_summary_data: Can be set to `False` to include branching
                 fractions where the current edition has no summary value(s) in
                 the Particle Listings or Summary Table.
+            prefetch_products: Can be set to `True` to load all decay products
+                in bulk (see :meth:`branching_fractions`).
         """
         if include_subdecays:
-            return self.branching_fractions('BFI%', require_summary_data)
+            return self.branching_fractions('BFI%', require_summary_data, prefetch_products)
         else:
-            return self.branching_fractions('BFI', require_summary_data)
+            return self.branching_fractions('BFI', require_summary_data, prefetch_products)
 
     @property
     def name(self) -> str:
@@ -586,26 +715,64 @@ class PdgParticle(PdgData):
             return summary.get_error(units)
         return summary.get_value(units)
 
+    def _resolve(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Get a quantity such as the mass or its error, computing it only once.
+
+        The result of `compute`, or the :exc:`~pdg.errors.PdgNoDataError` or
+        :exc:`~pdg.errors.PdgAmbiguousValueError` it raises, is cached for the
+        edition and the API's `pedantic` setting, so that e.g. the fallbacks
+        between width and lifetime and the corresponding errors share the
+        properties and best properties that have already been looked up.
+
+        Args:
+            name: Name of the quantity.
+            compute: Function computing the quantity.
+
+        Returns:
+            The quantity.
+        """
+        resolved = cast(dict, self.cache.setdefault('resolved', {}))
+        key = (name, self.api.pedantic)
+        if key not in resolved:
+            try:
+                resolved[key] = compute()
+            except (PdgNoDataError, PdgAmbiguousValueError) as exc:
+                resolved[key] = exc
+        result = resolved[key]
+        if isinstance(result, (PdgNoDataError, PdgAmbiguousValueError)):
+            raise result.with_traceback(None)
+        return result
+
+    def _typed_properties(self, data_type: str) -> list[PdgProperty]:
+        "Get the (cached) list of mass ('M'), width ('G') or lifetime ('T') properties."
+        # Unlike the quantities, the properties do not depend on the pedantic setting
+        resolved = cast(dict, self.cache.setdefault('resolved', {}))
+        if data_type not in resolved:
+            resolved[data_type] = list(self.properties(data_type))
+        return resolved[data_type]
+
+    def _best_property(self, data_type: str, quantity: str) -> PdgProperty:
+        "Get the (cached) best mass ('M'), width ('G') or lifetime ('T') property."
+        return self._resolve('best ' + data_type, lambda: self.best(iter(self._typed_properties(data_type)),
+                                                                    '%s %s (%s)' % (self.name, quantity, self.pdgid)))
+
     @property
     def mass(self) -> Optional[float]:
         "Mass of the particle in GeV."
-        best_mass_property = self.best(self.masses(), '%s mass (%s)' % (self.name, self.pdgid))
-        return self._if_not_limit(best_mass_property, 'GeV')
+        return self._resolve('mass', lambda: self._if_not_limit(self._best_property('M', 'mass'), 'GeV'))
 
     @property
     def mass_error(self) -> Optional[float]:
         """Symmetric error on mass of particle in GeV, or `None` if mass error are
         asymmetric or mass is a limit.
         """
-        best_mass_property = self.best(self.masses(), '%s (%s)' % (self.pdgid, self.description))
-        return self._if_not_limit(best_mass_property, 'GeV', error=True)
+        return self._resolve('mass_error',
+                             lambda: self._if_not_limit(self._best_property('M', 'mass'), 'GeV', error=True))
 
-    @property
-    def width(self) -> Optional[float]:
-        "Width of the particle in GeV."
+    def _get_width(self) -> Optional[float]:
+        "Compute :attr:`width`."
         try:
-            best_width_property = self.best(self.widths(), '%s width (%s)' % (self.name, self.pdgid))
-            return self._if_not_limit(best_width_property, 'GeV')
+            return self._if_not_limit(self._best_property('G', 'width'), 'GeV')
         except PdgNoDataError:
             if self.api.pedantic:
                 raise
@@ -615,13 +782,14 @@ class PdgParticle(PdgData):
             return HBAR_IN_GEV_S / self.lifetime
 
     @property
-    def width_error(self) -> Optional[float]:
-        """Symmetric error on width of particle in GeV, or `None` if width error
-        are asymmetric or width is a limit.
-        """
+    def width(self) -> Optional[float]:
+        "Width of the particle in GeV."
+        return self._resolve('width', self._get_width)
+
+    def _get_width_error(self) -> Optional[float]:
+        "Compute :attr:`width_error`."
         try:
-            best_width_property = self.best(self.widths(), '%s (%s)' % (self.pdgid, self.description))
-            return self._if_not_limit(best_width_property, 'GeV', error=True)
+            return self._if_not_limit(self._best_property('G', 'width'), 'GeV', error=True)
         except PdgNoDataError:
             if self.api.pedantic:
                 raise
@@ -633,6 +801,25 @@ class PdgParticle(PdgData):
                 return None
             return err * HBAR_IN_GEV_S / self.lifetime**2
 
+    @property
+    def width_error(self) -> Optional[float]:
+        """Symmetric error on width of particle in GeV, or `None` if width error
+        are asymmetric or width is a limit.
+        """
+        return self._resolve('width_error', self._get_width_error)
+
+    def _get_lifetime(self) -> Optional[float]:
+        "Compute :attr:`lifetime`."
+        try:
+            return self._if_not_limit(self._best_property('T', 'lifetime'), 's')
+        except PdgNoDataError:
+            if self.api.pedantic:
+                raise
+            width = self.width
+            if not width:   # no width data either (a width of 0 is returned in this case)
+                return float('inf')
+            return HBAR_IN_GEV_S / width
+
     @property
     def lifetime(self) -> Optional[float]:
         """Lifetime of the particle in seconds.
@@ -648,16 +835,24 @@ class PdgParticle(PdgData):
             :exc:`~pdg.errors.PdgNoDataError`: If there is no best lifetime
                 and the API is in pedantic mode.
         """
+        return self._resolve('lifetime', self._get_lifetime)
+
+    def _get_lifetime_error(self) -> Optional[float]:
+        "Compute :attr:`lifetime_error`."
         try:
-            best_lifetime_property = self.best(self.lifetimes(), '%s lifetime (%s)' % (self.name, self.pdgid))
-            return self._if_not_limit(best_lifetime_property, 's')
+            err = self._if_not_limit(self._best_property('T', 'lifetime'), 's', error=True)
+            if err is None:
+                err = 0.
+            return err
         except PdgNoDataError:
             if self.api.pedantic:
                 raise
-            width = self.width
-            if width is None:
-                return float('inf')
-            return HBAR_IN_GEV_S / width
+            if not self.has_width_entry:
+                return 0.
+            width, err = self.width, self.width_error
+            if width is None or err is None:
+                return None
+            return err * HBAR_IN_GEV_S / width**2
 
     @property
     def lifetime_error(self) -> Optional[float]:
@@ -671,36 +866,22 @@ class PdgParticle(PdgData):
             :exc:`~pdg.errors.PdgNoDataError`: If there is no best lifetime
                 and the API is in pedantic mode.
         """
-        try:
-            best_lifetime_property = self.best(self.lifetimes(), '%s (%s)' % (self.pdgid, self.description))
-            err = self._if_not_limit(best_lifetime_property, 's', error=True)
-            if err is None:
-                err = 0.
-            return err
-        except PdgNoDataError:
-            if self.api.pedantic:
-                raise
-            if not self.has_width_entry:
-                return 0.
-            width, err = self.width, self.width_error
-            if width is None or err is None:
-                return None
-            return err * HBAR_IN_GEV_S / width**2
+        return self._resolve('lifetime_error', self._get_lifetime_error)
 
     @property
     def has_mass_entry(self) -> bool:
         "Whether the particle has at least one defined mass."
-        return next(self.masses(), None) is not None
+        return len(self._typed_properties('M')) > 0
 
     @property
     def has_width_entry(self) -> bool:
         "Whether the particle has at least one defined decay width."
-        return next(self.widths(), None) is not None
+        return len(self._typed_properties('G')) > 0
 
     @property
     def has_lifetime_entry(self) -> bool:
         "Whether the particle has at least one defined lifetime."
-        return next(self.lifetimes(), None) is not None
+        return len(self._typed_properties('T')) > 0
 
     @property
     def cp_charge(self) -> int:
@@ -745,11 +926,32 @@ class PdgParticle(PdgData):
 
     @property
     def antiparticle(self) -> 'PdgParticle':
-        "This particle's antiparticle (or itself, if self-conjugate)"
+        """This particle's antiparticle (or itself, if self-conjugate).
+
+        The antiparticle is found among the states of the same PDG Identifier
+        with :func:`~pdg.conjugation.conjugate_particle_row`, and is thus also
+        found for particles without MC ID. If the :attr:`PdgApi.conjugation_index
+        <pdg.api.PdgApi.conjugation_index>` has been built (e.g. by accessing
+        it before looking up many antiparticles), it is used instead.
+        """
         if self.self_conjugate:
             return self
-        return PdgParticle(self.api, self.pdgid, edition=self.edition,
-                           set_mcid=-self.mcid)
+        particle = self._get_particle_data()
+        if self.api._conjugation_index is not None:
+            row = self.api._conjugation_index.conjugate_particle(particle['id'])
+        else:
+            rows = self.api.get_rows(('pdgparticle', 'pdgid', self.baseid), self.api.statement('particle'),
+                                     {'pdgid': self.baseid})
+            row = conjugate_particle_row(particle, rows)
+        if row is None:
+            raise PdgNoDataError('No antiparticle of %s' % self.name)
+        # Created like by get_particle_by_mcid(), so that the identity map returns the same object
+        if row['mcid'] is not None:
+            antiparticle = self.api.get_data_object(PdgParticle, self.pdgid, self.edition, set_mcid=row['mcid'])
+        else:
+            antiparticle = self.api.get_data_object(PdgParticle, self.pdgid, self.edition, set_name=row['name'])
+        antiparticle.cache.setdefault('pdgparticle', row)
+        return antiparticle
 
 
 class PdgParticleList(PdgData, list):
@@ -757,24 +959,57 @@ class PdgParticleList(PdgData, list):
 
     A `PdgParticleList` is returned when :meth:`PdgApi.get <pdg.api.PdgApi.get>`
     is called with the PDG Identifier of a (group of) particles.
+
+    The members are created on first access (e.g. by iterating over the list
+    or by calling `len()`), each with its row of table `pdgparticle`.
     """
-    def __init__(self, api: 'PdgApi', pdgid: str, edition: Optional[str]=None):
+    def __init__(self, api: 'PdgApi', pdgid: str, edition: Optional[str]=None,
+                 rows: Optional[list[dict]]=None):
         """
         Note:
             The constructor is intended for internal API use.
 
         Args:
             api: API object for retrieving data.
-            pdgitem_id: Primary key of the item in the SQLite file.
+            pdgid: PDG Identifier of the particle(s).
             edition: If set, specifies the edition of the RPP
+            rows: Rows of table `pdgparticle` for the PDG Identifier, if
+                already loaded.
         """
         super(PdgParticleList, self).__init__(api, pdgid, edition)
-
-        pdgparticle_table = self.api.db.tables['pdgparticle']
-        query = select(pdgparticle_table)
-        query = query.where(func.lower(pdgparticle_table.c.pdgid) == bindparam('pdgid'))
-        with self.api.engine.connect() as conn:
-            result = conn.execute(query, {'pdgid': pdgid.lower()}).fetchall()
-            for row in result:
-                self.append(PdgParticle(api, pdgid, edition=edition, set_mcid=row.mcid,
-                                        set_name=row.name))
+        self._rows = rows
+        self._pending = True        # members not created yet (see _build())
+
+    def _build(self) -> None:
+        "Create the members of the list, unless already done."
+        # Unpickling adds the members before restoring the attributes
+        if not getattr(self, '_pending', False):
+            return
+        rows = self._rows
+        if rows is None:
+            # Same rows as loaded by PdgParticle._get_particle_data()
+            rows = self.api.get_rows(('pdgparticle', 'pdgid', self.baseid), self.api.statement('particle'),
+                                     {'pdgid': self.baseid})
+        # The members are created with their row, i.e. without any further queries
+        list.extend(self, [self.api.get_particle_from_row(row, self.edition) for row in rows])
+        self._rows = None
+        self._pending = False
+
+
+def _build_first(name: str) -> Callable:
+    "Wrap a method of `list` to create the members of a `PdgParticleList` before it is called."
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._build()
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ('__iter__', '__reversed__', '__len__', '__getitem__', '__contains__', '__eq__', '__ne__', '__lt__',
+              '__le__', '__gt__', '__ge__', '__add__', '__mul__', '__rmul__', '__iadd__', '__imul__', '__setitem__',
+              '__delitem__', 'append', 'extend', 'insert', 'remove', 'pop', 'clear', 'index', 'count', 'copy',
+              'reverse', 'sort'):
+    setattr(PdgParticleList, _name, _build_first(_name))
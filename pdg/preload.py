@@ -0,0 +1,208 @@
+"""
+In-memory indexes of the database tables used for loading data.
+
+Data objects load their data lazily with many small queries (see
+:meth:`PdgApi.get_rows <pdg.api.PdgApi.get_rows>`). For long-running
+applications, :meth:`PdgApi.preload <pdg.api.PdgApi.preload>` can instead read
+the tables used for particles, their properties, summary values and decays in a
+few full-table scans, and keep them in memory indexed in the same way as the
+row cache. Data objects then get their rows from these indexes, so that e.g.
+:attr:`PdgParticle.mass <pdg.particle.PdgParticle.mass>`,
+:meth:`PdgParticle.branching_fractions <pdg.particle.PdgParticle.branching_fractions>`,
+:attr:`PdgBranchingFraction.decay_products <pdg.decay.PdgBranchingFraction.decay_products>`
+and :meth:`PdgProperty.best_summary <pdg.data.PdgProperty.best_summary>` run
+without any SQL queries.
+"""
+
+import re
+import time
+from collections import defaultdict
+from sqlalchemy import MetaData, bindparam, select
+from sqlalchemy.sql import Select
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from pdg.errors import PdgApiError
+from pdg.utils import find_prefixed
+
+if TYPE_CHECKING:
+    from pdg.api import PdgApi
+
+
+# Tables that can be preloaded, in the order in which they are read
+PRELOAD_TABLES = ('pdgid', 'pdgdata', 'pdgparticle', 'pdgitem', 'pdgitem_map', 'pdgdecay', 'pdgid_map',
+                  'pdgmeasurement')
+
+
+def _like(pattern: str) -> re.Pattern:
+    "Compile a SQL `LIKE` pattern into a regular expression (case-insensitive, as in SQLite)."
+    regex = ''.join('.*' if c == '%' else '.' if c == '_' else re.escape(c) for c in pattern)
+    return re.compile(regex, re.IGNORECASE | re.DOTALL)
+
+
+class PreloadedData:
+    """In-memory copy of database tables, indexed like the rows in the row cache.
+
+    The rows of each preloaded table are grouped by the value(s) of the
+    column(s) used for selecting them, under the same keys as used for the row
+    cache (see :meth:`PdgApi.get_rows <pdg.api.PdgApi.get_rows>`). Table
+    `pdgdata` is only loaded for the selected editions, and for table
+    `pdgmeasurement` only the IDs of the measurements of each PDG Identifier
+    are loaded.
+    """
+    def __init__(self, api: 'PdgApi', tables: Optional[Iterable[str]]=None,
+                 editions: Optional[Iterable[str]]=None):
+        """
+        Note:
+            The constructor is intended for internal API use. Use
+            :meth:`PdgApi.preload <pdg.api.PdgApi.preload>` instead.
+
+        Args:
+            api: API object for reading the tables.
+            tables: Names of the tables to be loaded (default: all tables in
+                :data:`PRELOAD_TABLES`).
+            editions: Editions for which the summary values (table `pdgdata`)
+                are loaded (default: the default edition).
+
+        Raises:
+            :exc:`~pdg.errors.PdgApiError`: If a table cannot be preloaded.
+        """
+        self.tables = tuple(PRELOAD_TABLES if tables is None else tables)
+        for table_name in self.tables:
+            if table_name not in PRELOAD_TABLES:
+                raise PdgApiError('table %s cannot be preloaded - must be one of %s'
+                                  % (table_name, ', '.join(PRELOAD_TABLES)))
+        self.editions = tuple(str(e) for e in ((api.default_edition,) if editions is None else editions))
+        self.indexes: dict[tuple, dict[Any, list[dict]]] = {}
+        self.num_rows: dict[str, int] = {}
+        self._properties: dict[str, list[dict]] = {}    # rows of table pdgid by upper-case parent_pdgid
+        self._parents: list[str] = []                   # sorted keys of _properties
+        self._patterns: dict[str, re.Pattern] = {}
+        t0 = time.perf_counter()
+        with api.connection() as conn:
+            for table_name in self.tables:
+                query = self._query(api.db, table_name)
+                if table_name == 'pdgdata':
+                    rows = [dict(row._mapping) for edition in self.editions
+                            for row in conn.execute(query, {'edition': edition})]
+                else:
+                    rows = [dict(row._mapping) for row in conn.execute(query)]
+                self.num_rows[table_name] = len(rows)
+                getattr(self, '_index_%s' % table_name)(rows)
+        self.load_time = time.perf_counter() - t0
+
+    def __repr__(self) -> str:
+        "Get a concise representation including the number of rows and the load time."
+        return 'PreloadedData(tables=%s, editions=%s, rows=%s, load_time=%.3f)' % (
+            ','.join(self.tables), ','.join(self.editions), sum(self.num_rows.values()), self.load_time)
+
+    def _query(self, db: MetaData, table_name: str) -> Select:
+        "Query reading all rows of a table needed for preloading (for table `pdgdata`, of one edition)."
+        table = db.tables[table_name]
+        if table_name == 'pdgid':
+            return select(table).order_by(table.c.sort)
+        if table_name == 'pdgdata':
+            pdgid_table = db.tables['pdgid']
+            query = select(table, pdgid_table.c.description).join(pdgid_table)
+            return query.where(table.c.edition == bindparam('edition')).order_by(table.c.sort)
+        if table_name == 'pdgmeasurement':
+            return select(table.c.id, table.c.pdgid)
+        return select(table)
+
+    def _add(self, family: tuple, rows: Iterable[dict], column: str,
+             columns: Optional[tuple[str, ...]]=None) -> None:
+        "Add an index grouping rows (or only the given columns) by the value of a column."
+        index: dict[Any, list[dict]] = defaultdict(list)
+        for row in rows:
+            index[row[column]].append(row if columns is None else {c: row[c] for c in columns})
+        self.indexes[family] = dict(index)
+
+    def _index_pdgid(self, rows: list[dict]) -> None:
+        self._add(('pdgid', 'pdgid'), rows, 'pdgid')
+        rows = [row for row in rows if row['parent_pdgid'] is not None]
+        self._add(('pdgid', 'pdgid', 'parent_pdgid'), rows, 'parent_pdgid', ('pdgid', 'data_type'))
+        properties = defaultdict(list)
+        for row in rows:
+            properties[row['parent_pdgid'].upper()].append(row)
+        self._properties = dict(properties)
+        self._parents = sorted(self._properties)
+
+    def _index_pdgdata(self, rows: list[dict]) -> None:
+        for edition in self.editions:
+            self._add(('pdgdata', edition, 'pdgid'), [row for row in rows if row['edition'] == edition], 'pdgid')
+
+    def _index_pdgparticle(self, rows: list[dict]) -> None:
+        self._add(('pdgparticle', 'pdgid'), rows, 'pdgid')
+        self._add(('pdgparticle', 'pdgitem_id'), rows, 'pdgitem_id')
+
+    def _index_pdgitem(self, rows: list[dict]) -> None:
+        self._add(('pdgitem', 'id'), rows, 'id')
+
+    def _index_pdgitem_map(self, rows: list[dict]) -> None:
+        self._add(('pdgitem_map', 'pdgitem_id'), rows, 'pdgitem_id')
+
+    def _index_pdgdecay(self, rows: list[dict]) -> None:
+        self._add(('pdgdecay', 'pdgid'), rows, 'pdgid')
+
+    def _index_pdgid_map(self, rows: list[dict]) -> None:
+        self._add(('pdgid_map', 'target', 'source'), rows, 'source', ('target',))
+        self._add(('pdgid_map', 'source', 'target'), rows, 'target', ('source',))
+
+    def _index_pdgmeasurement(self, rows: list[dict]) -> None:
+        self._add(('pdgmeasurement', 'id', 'pdgid'), rows, 'pdgid', ('id',))
+
+    def get_rows(self, key: tuple) -> Optional[list[dict]]:
+        """Get preloaded rows.
+
+        Args:
+            key: Key of the rows in the row cache (see :meth:`PdgApi.get_rows
+                <pdg.api.PdgApi.get_rows>`), whose last element is the value
+                used for selecting the rows.
+
+        Returns:
+            List of rows (empty if there are no matching rows), or `None` if
+            the rows have not been preloaded.
+        """
+        index = self.indexes.get(key[:-1])
+        if index is None:
+            return None
+        return index.get(key[-1], [])
+
+    def property_pdgids(self, parent_pdgid: str, edition: str, join_data: bool,
+                        in_summary_table: Optional[bool], data_type_filter: str,
+                        data_type_key: Optional[str], omit_branching_ratios: bool) -> Optional[list[str]]:
+        """Get the property PDG Identifiers of a particle from the preloaded data.
+
+        This is the in-memory equivalent of the `properties` statement (see
+        :mod:`pdg.statements`), with the same arguments and parameters.
+
+        Returns:
+            List of PDG Identifiers ordered by column `sort`, or `None` if the
+            required tables or editions have not been preloaded.
+        """
+        if 'pdgid' not in self.tables:
+            return None
+        if join_data and ('pdgdata' not in self.tables or edition not in self.editions):
+            return None
+        # parent_pdgid LIKE '<parent_pdgid>%'
+        rows = []
+        for parent in find_prefixed(self._parents, parent_pdgid.upper()):
+            rows.extend(self._properties[parent])
+        if join_data:
+            data = self.indexes[('pdgdata', edition, 'pdgid')]
+            rows = [row for row in rows
+                    if any(in_summary_table is None or bool(d['in_summary_table']) == in_summary_table
+                           for d in data.get(row['pdgid'], ()))]
+        if data_type_filter == 'default':
+            rows = [row for row in rows if row['data_type'] is None or not row['data_type'].upper().startswith('BF')]
+            omit_branching_ratios = True
+        elif data_type_filter == 'like':
+            assert data_type_key is not None
+            if data_type_key not in self._patterns:
+                self._patterns[data_type_key] = _like(data_type_key)
+            pattern = self._patterns[data_type_key]
+            rows = [row for row in rows if row['data_type'] is not None and pattern.fullmatch(row['data_type'])]
+        elif data_type_filter == 'equal':
+            rows = [row for row in rows if row['data_type'] is not None and row['data_type'] == data_type_key]
+        if omit_branching_ratios:
+            rows = [row for row in rows if row['data_type'] is None or not row['data_type'].upper().startswith('BR')]
+        return [row['pdgid'] for row in sorted(rows, key=lambda row: row['sort'])]
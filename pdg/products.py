@@ -0,0 +1,419 @@
+"""
+In-memory index of the decay products of all decays, for finding decays by their final state.
+
+Finding all decays with a given product, e.g. all decays to `J/psi(1S)`, with
+the data objects of the API means getting all branching fractions (e.g. with
+:meth:`PdgApi.get_all <pdg.api.PdgApi.get_all>`) and the
+:attr:`~pdg.decay.PdgBranchingFraction.decay_products` of each of them. The
+:class:`ProductIndex` of an API object (see :attr:`PdgApi.product_index
+<pdg.api.PdgApi.product_index>`) instead reads table `pdgdecay` once and keeps
+an inverted index from every outgoing item to the decays it appears in (with
+its multiplicity, from column `multiplier`), so that decays can be searched by
+their products, e.g. for all decays to `K(S)0` and `pi+` (and possibly more
+particles), or for all decays to exactly `K- pi+ pi+`, in a few milliseconds.
+
+Items referring to a unique particle are indexed under the item of the
+particle (its row in table `pdgparticle`), so that aliases such as `K0S` and
+`J/psi` find the same decays as `K(S)0` and `J/psi(1S)`. Other items, e.g.
+generic items like `pi+-` or text items like `anything`, are matched as they
+are, i.e. searching for `pi+` does not find decays to `pi+-`.
+
+The index also precomputes the :class:`DecaySignature` of every decay, i.e.
+the sorted names of its canonical incoming and outgoing items, which is the
+same for all encodings of a decay with different aliases, and keeps a hash
+index over the signatures, so that decays given as text, e.g.
+`'B0 -> J/psi K0S'`, can be looked up in bulk (see
+:meth:`ProductIndex.find_decays`).
+"""
+
+import re
+import time
+from collections import Counter, defaultdict
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Callable, Iterable, NamedTuple, Optional, Union
+
+from pdg.errors import PdgAmbiguousValueError, PdgNoDataError
+from pdg.utils import base_id
+
+if TYPE_CHECKING:
+    from pdg.api import PdgApi
+
+
+# Multiset of canonical item IDs: sorted pairs of item ID and multiplicity
+ItemMultiset = tuple[tuple[int, int], ...]
+
+# Arrows separating the parent from the decay products in decay strings
+_ARROW = re.compile(r'\s*(?:-->|->|\u2192)\s*')
+
+# Tokens of decay strings giving an MC ID, or an item name with a multiplicity (e.g. 2pi+)
+_MCID_TOKEN = re.compile(r'[+-]?\d+')
+_MULTIPLICITY_TOKEN = re.compile(r'(\d+)(\D.*)')
+
+
+def decay_multisets(rows: Iterable[Any], canonical_item: Callable[[int], int]) \
+        -> dict[str, tuple[ItemMultiset, ItemMultiset]]:
+    """Get the multisets of canonical incoming and outgoing items of decays.
+
+    Args:
+        rows: Rows with columns `pdgid`, `pdgitem_id`, `is_outgoing` and
+            `multiplier` of table `pdgdecay`, e.g. of statement `all_decays`
+            (see :mod:`pdg.statements`).
+        canonical_item: Function returning the canonical item of an item ID,
+            e.g. :meth:`NameIndex.canonical_item
+            <pdg.names.NameIndex.canonical_item>`.
+
+    Returns:
+        Dictionary from the PDG Identifiers of the decays, in the order of
+        `rows`, to the sorted pairs of canonical item ID and multiplicity of
+        their incoming and of their outgoing items.
+    """
+    decays: dict[str, tuple[Counter, Counter]] = defaultdict(lambda: (Counter(), Counter()))
+    for row in rows:
+        decays[row.pdgid][1 if row.is_outgoing else 0][canonical_item(row.pdgitem_id)] += row.multiplier
+    return {pdgid: (tuple(sorted(incoming.items())), tuple(sorted(outgoing.items())))
+            for pdgid, (incoming, outgoing) in decays.items()}
+
+
+class DecaySignature(NamedTuple):
+    "Canonical signature of a decay, which is the same for all encodings of the decay with different aliases."
+    parent: tuple[str, ...]         # sorted names of the canonical incoming items, repeated according to multiplicity
+    products: tuple[str, ...]       # sorted names of the canonical outgoing items, repeated according to multiplicity
+
+
+class ProductIndex:
+    """Inverted index from the decay products of all decays to their PDG Identifiers.
+
+    See :mod:`pdg.products`. Items can be given by name, by item ID, or as
+    :class:`~pdg.particle.PdgItem` or :class:`~pdg.particle.PdgParticle`
+    objects. Lists of products can repeat items, or map items to their
+    multiplicities, e.g. `['K-', 'pi+', 'pi+']` or `{'K-': 1, 'pi+': 2}`.
+    Results are in the order of the Particle Listings.
+    """
+    def __init__(self, api: 'PdgApi'):
+        """
+        Note:
+            The constructor is intended for internal API use. Use
+            :attr:`PdgApi.product_index <pdg.api.PdgApi.product_index>`
+            instead.
+
+        Args:
+            api: API object for reading the tables.
+        """
+        self.api = api
+        names = self._names = api.name_index
+        t0 = time.perf_counter()
+        with api.connection() as conn:
+            rows = conn.execute(api.statement('all_decays')).fetchall()
+            self._item_names = {item.id: item.name for item in conn.execute(api.statement('all_items'))}
+
+        self._mcid_items: dict[int, int] = {}
+        for item_id in self._item_names:
+            particle = names.particle(item_id)
+            if particle is not None and particle['mcid'] is not None:
+                self._mcid_items[particle['mcid']] = particle['pdgitem_id']
+        decays = decay_multisets(rows, names.canonical_item)
+
+        self._order = {pdgid: i for i, pdgid in enumerate(decays)}
+        self._incoming: dict[str, ItemMultiset] = {}
+        self._outgoing: dict[str, ItemMultiset] = {}
+        self._products: dict[int, dict[str, int]] = defaultdict(dict)
+        self._parents: dict[int, list[str]] = defaultdict(list)
+        self._final_states: dict[ItemMultiset, list[str]] = defaultdict(list)
+        self._signatures: dict[str, DecaySignature] = {}
+        self._by_signature: dict[DecaySignature, list[str]] = defaultdict(list)
+        for pdgid, (incoming, outgoing) in decays.items():
+            self._incoming[pdgid] = incoming
+            self._outgoing[pdgid] = outgoing
+            for item_id, multiplicity in outgoing:
+                self._products[item_id][pdgid] = multiplicity
+            for item_id, _ in incoming:
+                self._parents[item_id].append(pdgid)
+            self._final_states[self._outgoing[pdgid]].append(pdgid)
+            self._signatures[pdgid] = self._signature(self._incoming[pdgid], self._outgoing[pdgid])
+            self._by_signature[self._signatures[pdgid]].append(pdgid)
+        self.load_time = time.perf_counter() - t0
+
+    def __repr__(self) -> str:
+        "Get a concise representation including the numbers of decays and products and the load time."
+        return 'ProductIndex(decays=%d, products=%d, load_time=%.3f)' % (
+            len(self._outgoing), len(self._products), self.load_time)
+
+    def canonical_item(self, item: Any) -> int:
+        """Get the ID of the item under which an item is indexed.
+
+        Args:
+            item: Item name, item ID, or :class:`~pdg.particle.PdgItem` or
+                :class:`~pdg.particle.PdgParticle` object.
+
+        Returns:
+            ID of the item of the particle's row in table `pdgparticle` for
+            items referring to a unique particle, and otherwise the ID of the
+            item itself.
+
+        Raises:
+            :exc:`~pdg.errors.PdgNoDataError`: If there is no item with the
+                given name, or if a particle has no item.
+            :exc:`~pdg.errors.PdgAmbiguousValueError`: If there is more than
+                one item with the given name.
+        """
+        if isinstance(item, str):
+            item_id = self.api.name_index.item_id(item)
+        elif isinstance(item, int):
+            item_id = item
+        elif hasattr(item, 'pdgitem_id'):
+            item_id = item.pdgitem_id
+        else:
+            particle = item._get_particle_data()
+            if particle['pdgitem_id'] is None:
+                raise PdgNoDataError('No item for particle %s' % particle['name'])
+            return particle['pdgitem_id']
+        return self._names.canonical_item(item_id)
+
+    def multiset(self, items: Union[Iterable[Any], Mapping[Any, int]]) -> ItemMultiset:
+        """Get the multiset of canonical items of a list of items.
+
+        Args:
+            items: Items (see :class:`ProductIndex`), either repeated according
+                to their multiplicity, or mapped to their multiplicities.
+
+        Returns:
+            Sorted pairs of canonical item ID (see :meth:`canonical_item`) and
+            multiplicity.
+
+        Raises:
+            :exc:`~pdg.errors.PdgNoDataError`: If there is no item with one of
+                the given names.
+        """
+        counts: Counter = Counter()
+        if isinstance(items, Mapping):
+            for item, multiplicity in items.items():
+                counts[self.canonical_item(item)] += multiplicity
+        else:
+            for item in items:
+                counts[self.canonical_item(item)] += 1
+        return tuple(sorted((item_id, n) for item_id, n in counts.items() if n > 0))
+
+    def incoming(self, pdgid: str) -> Optional[ItemMultiset]:
+        """Get the incoming items of a decay.
+
+        Args:
+            pdgid: PDG Identifier of the branching fraction (with or without
+                edition).
+
+        Returns:
+            Multiset of canonical items (see :meth:`multiset`), or `None` if
+            there is no decay with this PDG Identifier.
+        """
+        return self._incoming.get(base_id(pdgid))
+
+    def outgoing(self, pdgid: str) -> Optional[ItemMultiset]:
+        """Get the outgoing items (decay products) of a decay.
+
+        Args:
+            pdgid: PDG Identifier of the branching fraction (with or without
+                edition).
+
+        Returns:
+            Multiset of canonical items (see :meth:`multiset`), or `None` if
+            there is no decay with this PDG Identifier.
+        """
+        return self._outgoing.get(base_id(pdgid))
+
+    def _signature(self, incoming: ItemMultiset, outgoing: ItemMultiset) -> DecaySignature:
+        "Get the signature of a decay with the given incoming and outgoing items."
+        item_names = self._item_names
+        return DecaySignature(tuple(sorted(item_names[item_id] for item_id, n in incoming for _ in range(n))),
+                              tuple(sorted(item_names[item_id] for item_id, n in outgoing for _ in range(n))))
+
+    def signature(self, pdgid: str) -> Optional[DecaySignature]:
+        """Get the canonical signature of a decay.
+
+        Args:
+            pdgid: PDG Identifier of the branching fraction (with or without
+                edition).
+
+        Returns:
+            Signature of the decay, or `None` if there is no decay with this
+            PDG Identifier.
+        """
+        return self._signatures.get(base_id(pdgid))
+
+    def parse_decay(self, decay: str) -> DecaySignature:
+        """Get the canonical signature of a decay given as text.
+
+        Args:
+            decay: Decay such as `'B0 -> J/psi K0S'` or `'D+ --> K- 2pi+'`,
+                see :meth:`find_decays`.
+
+        Returns:
+            Signature of the decay, whether or not the decay is in the
+            database.
+
+        Raises:
+            ValueError: If the text is not a decay.
+            :exc:`~pdg.errors.PdgNoDataError`: If there is no item with one of
+                the given names or MC IDs.
+        """
+        return self._signature(*self._parse_decay(decay, {}))
+
+    def _parse_decay(self, decay: str, tokens: dict[str, tuple[int, int]]) -> tuple[ItemMultiset, ItemMultiset]:
+        "Get the incoming and outgoing items of a decay given as text, resolving tokens not yet in `tokens`."
+        sides = _ARROW.split(decay.strip())
+        if len(sides) != 2 or not sides[0] or not sides[1]:
+            raise ValueError('Not a decay: %s' % decay)
+        multisets = []
+        for side in sides:
+            counts: Counter = Counter()
+            for token in side.split():
+                if token not in tokens:
+                    tokens[token] = self._resolve_token(token)
+                item_id, multiplicity = tokens[token]
+                counts[item_id] += multiplicity
+            multisets.append(tuple(sorted(counts.items())))
+        return multisets[0], multisets[1]
+
+    def _resolve_token(self, token: str) -> tuple[int, int]:
+        "Get the canonical item ID and multiplicity of a token of a decay string."
+        if self._names.item_ids(token):
+            return self._names.canonical_item(self._names.item_id(token)), 1
+        if _MCID_TOKEN.fullmatch(token):
+            item_id = self._mcid_items.get(int(token))
+            if item_id is None:
+                raise PdgNoDataError('No particle with MC ID %s' % token)
+            return item_id, 1
+        match = _MULTIPLICITY_TOKEN.fullmatch(token)
+        if match:
+            if self._names.item_ids(match.group(2)):
+                return self._names.canonical_item(self._names.item_id(match.group(2))), int(match.group(1))
+        raise PdgNoDataError('No item named %s' % token)
+
+    def find_decays(self, decays: Iterable[str], charge_conjugates: bool=False) -> list[Optional[list[str]]]:
+        """Find the decays given as text.
+
+        The parent and the decay products are separated by an arrow (`-->`,
+        `->` or `\u2192`). Both are lists of tokens separated by whitespace,
+        each of which is an item name (e.g. an alias such as `K0S`), an item
+        name preceded by its multiplicity (e.g. `2pi+`, as in the descriptions
+        of branching fractions), or the MC ID of a particle. The order of the
+        products does not matter. All tokens are resolved once per call, and
+        the decays are then looked up by their :class:`DecaySignature`. Texts
+        that cannot be parsed or resolved do not stop the other decays from
+        being looked up (use :meth:`parse_decay` to get the reason).
+
+        Args:
+            decays: Decays, e.g. `['B0 -> J/psi K0S', 'D+ --> K- 2pi+',
+                '411 -> -321 211 211']`.
+            charge_conjugates: Can be set to `True` to also find the charge
+                conjugate decays, using the :attr:`PdgApi.conjugation_index
+                <pdg.api.PdgApi.conjugation_index>`.
+
+        Returns:
+            For each decay, the PDG Identifiers of the branching fractions of
+            the decays with exactly these incoming and outgoing items (empty if
+            there are none), in the order of the Particle Listings, or `None`
+            if the text is not a decay, or if one of its names or MC IDs does
+            not refer to a unique item.
+        """
+        tokens: dict[str, tuple[int, int]] = {}
+        results: list[Optional[list[str]]] = []
+        for decay in decays:
+            try:
+                incoming, outgoing = self._parse_decay(decay, tokens)
+            except (ValueError, PdgAmbiguousValueError, PdgNoDataError):
+                results.append(None)
+                continue
+            found = list(self._by_signature.get(self._signature(incoming, outgoing), []))
+            if charge_conjugates:
+                conjugates = [self._conjugate(items) for items in (incoming, outgoing)]
+                if conjugates[0] is not None and conjugates[1] is not None:
+                    found.extend(pdgid for pdgid in self._by_signature.get(self._signature(*conjugates), [])
+                                 if pdgid not in found)
+                    found.sort(key=self._order.__getitem__)
+            results.append(found)
+        return results
+
+    def _conjugate(self, items: ItemMultiset) -> Optional[ItemMultiset]:
+        "Get the charge conjugates of canonical items, or None if any item has no conjugate."
+        conjugates = self.api.conjugation_index.conjugate_products(items)
+        if conjugates is None:
+            return None
+        counts: Counter = Counter()
+        for item_id, n in conjugates:
+            counts[self._names.canonical_item(item_id)] += n
+        return tuple(sorted(counts.items()))
+
+    def find(self, products: Union[Iterable[Any], Mapping[Any, int]], exact: bool=False, parent: Any=None,
+             charge_conjugates: bool=False) -> list[str]:
+        """Find the decays with the given decay products.
+
+        Args:
+            products: Decay products (see :class:`ProductIndex`), e.g.
+                `['K(S)0', 'pi+']`.
+            exact: If `False` (the default), decays with at least the given
+                products (with at least the given multiplicities) are found. If
+                `True`, only decays with exactly the given products are found.
+            parent: If set, only decays of this item are found.
+            charge_conjugates: Can be set to `True` to also find the decays
+                with the charge conjugate products (and parent), using the
+                :attr:`PdgApi.conjugation_index
+                <pdg.api.PdgApi.conjugation_index>`.
+
+        Returns:
+            PDG Identifiers of the branching fractions of all matching decays
+            (of all data types, including e.g. subdecay modes), in the order of
+            the Particle Listings.
+
+        Raises:
+            :exc:`~pdg.errors.PdgNoDataError`: If there is no item with one of
+                the given names.
+        """
+        query = self.multiset(products)
+        parent_id = self.canonical_item(parent) if parent is not None else None
+        found = set(self._find(query, exact, parent_id))
+        if charge_conjugates:
+            conjugate_query = self._conjugate(query)
+            conjugate_parent = self._conjugate(((parent_id, 1),)) if parent_id is not None else None
+            if conjugate_query is not None and (parent_id is None or conjugate_parent is not None):
+                found.update(self._find(conjugate_query, exact, conjugate_parent[0][0] if conjugate_parent else None))
+        return sorted(found, key=self._order.__getitem__)
+
+    def _find(self, query: ItemMultiset, exact: bool, parent_id: Optional[int]) -> Iterable[str]:
+        "Get the decays with (at least, if not exact) the given products and the given parent (if not None)."
+        if exact:
+            candidates: Iterable[str] = self._final_states.get(query, [])
+        elif query:
+            # Intersect the postings of the query items, starting with the rarest one
+            postings = sorted(((self._products.get(item_id, {}), n) for item_id, n in query),
+                              key=lambda posting: len(posting[0]))
+            candidates = [pdgid for pdgid, multiplicity in postings[0][0].items() if multiplicity >= postings[0][1]]
+            for posting, n in postings[1:]:
+                candidates = [pdgid for pdgid in candidates if posting.get(pdgid, 0) >= n]
+        else:
+            candidates = self._outgoing
+        if parent_id is not None:
+            parents = set(self._parents.get(parent_id, []))
+            candidates = [pdgid for pdgid in candidates if pdgid in parents]
+        return candidates
+
+    def parents(self, products: Union[Iterable[Any], Mapping[Any, int]], exact: bool=False) -> list[str]:
+        """Get the names of the parents of the decays with the given decay products.
+
+        Args:
+            products: Decay products (see :class:`ProductIndex`), e.g.
+                `['J/psi(1S)']`.
+            exact: If `True`, only decays with exactly the given products are
+                considered (see :meth:`find`).
+
+        Returns:
+            Names of the (canonical) incoming items of the matching decays, in
+            the order of the Particle Listings.
+
+        Raises:
+            :exc:`~pdg.errors.PdgNoDataError`: If there is no item with one of
+                the given names.
+        """
+        parents: dict[int, None] = {}
+        for pdgid in sorted(self._find(self.multiset(products), exact, None), key=self._order.__getitem__):
+            for item_id, _ in self._incoming[pdgid]:
+                parents[item_id] = None
+        return [self._item_names[item_id] for item_id in parents]
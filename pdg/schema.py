@@ -0,0 +1,200 @@
+"""
+Prebuilt table definitions for the PDG database schema.
+
+Reflecting the full database schema with :meth:`sqlalchemy.MetaData.reflect`
+requires a round trip per table and is the dominant cost of creating a
+:class:`~pdg.api.PdgApi` object. Since the layout of the PDG database is fixed
+for a given schema version (see `pdginfo.schema_version`), the table
+definitions for known schema versions are provided here instead and used by
+the API unless reflection is explicitly requested.
+"""
+
+from sqlalchemy import MetaData, Table, Column, ForeignKey, UniqueConstraint
+from sqlalchemy import Integer, String, Float, Boolean
+from typing import Callable
+
+
+def define_pdginfo(metadata: MetaData) -> Table:
+    """Define table `pdginfo`, which has the same layout in all schema versions.
+
+    Args:
+        metadata: `MetaData` object to which the table is added.
+
+    Returns:
+        The `pdginfo` table.
+    """
+    return Table('pdginfo', metadata,
+                 Column('id', Integer, primary_key=True),
+                 Column('name', String, nullable=False, unique=True),
+                 Column('value', String))
+
+
+def _define_tables_v0_3(metadata: MetaData) -> None:
+    "Define all tables (except `pdginfo`) of schema version 0.3."
+    Table('pdgid', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('pdgid', String, nullable=False, unique=True),
+          Column('parent_id', Integer, ForeignKey('pdgid.id'), index=True),
+          Column('parent_pdgid', String, index=True),
+          Column('description', String, nullable=False),
+          Column('mode_number', Integer),
+          Column('data_type', String(4), nullable=False),
+          Column('flags', String(8), nullable=False),
+          Column('year_added', Integer),
+          Column('sort', Integer, nullable=False))
+    Table('pdgitem', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('name', String, nullable=False, index=True, unique=True),
+          Column('item_type', String(1), nullable=False))
+    Table('pdgreference', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('document_id', String, nullable=False),
+          Column('publication_name', String),
+          Column('publication_year', Integer),
+          Column('doi', String(240)),
+          Column('inspire_id', String(16)),
+          Column('title', String))
+    Table('pdgfootnote', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('pdgid', String),
+          Column('text', String),
+          Column('footnote_index', Integer),
+          Column('changebar', Boolean))
+    Table('pdgdoc', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('table_name', String, nullable=False),
+          Column('column_name', String, nullable=False),
+          Column('value', String),
+          Column('indicator', String, nullable=False),
+          Column('description', String, nullable=False),
+          Column('comment', String),
+          UniqueConstraint('table_name', 'column_name', 'value'))
+    Table('pdgitem_map', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('pdgitem_id', Integer, ForeignKey('pdgitem.id'), nullable=False, index=True),
+          Column('name', String, nullable=False, index=True),
+          Column('target_id', Integer, ForeignKey('pdgitem.id'), nullable=False, index=True),
+          Column('sort', Integer, nullable=False))
+    Table('pdgparticle', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('pdgid_id', Integer, ForeignKey('pdgid.id'), nullable=False, index=True),
+          Column('pdgid', String, nullable=False, index=True),
+          Column('pdgitem_id', Integer, ForeignKey('pdgitem.id'), nullable=False, index=True),
+          Column('name', String, nullable=False, index=True),
+          Column('cc_type', String(1)),
+          Column('mcid', Integer, unique=True),
+          Column('charge', Float),
+          Column('quantum_i', String(40)),
+          Column('quantum_g', String(1)),
+          Column('quantum_j', String(40)),
+          Column('quantum_p', String(1)),
+          Column('quantum_c', String(1)))
+    Table('pdgdecay', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('pdgid_id', Integer, ForeignKey('pdgid.id'), nullable=False, index=True),
+          Column('pdgid', String, nullable=False, index=True),
+          Column('pdgitem_id', Integer, ForeignKey('pdgitem.id'), nullable=False, index=True),
+          Column('name', String, nullable=False, index=True),
+          Column('is_outgoing', Boolean, nullable=False),
+          Column('multiplier', Integer, nullable=False),
+          Column('subdecay_id', Integer, ForeignKey('pdgid.id')),
+          Column('sort', Integer, nullable=False))
+    Table('pdgdata', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('pdgid_id', Integer, ForeignKey('pdgid.id'), nullable=False, index=True),
+          Column('pdgid', String, nullable=False, index=True),
+          Column('edition', String, index=True),
+          Column('value_type', String(2), nullable=False),
+          Column('in_summary_table', Boolean, nullable=False),
+          Column('confidence_level', Float),
+          Column('limit_type', String(1)),
+          Column('comment', String),
+          Column('value', Float),
+          Column('value_text', String),
+          Column('error_positive', Float),
+          Column('error_negative', Float),
+          Column('scale_factor', Float),
+          Column('unit_text', String, nullable=False),
+          Column('display_value_text', String, nullable=False),
+          Column('display_power_of_ten', Integer, nullable=False),
+          Column('display_in_percent', Boolean, nullable=False),
+          Column('sort', Integer))
+    Table('pdgtext', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('pdgid_id', Integer, ForeignKey('pdgid.id'), nullable=False, index=True),
+          Column('pdgid', String, nullable=False),
+          Column('text', String),
+          Column('type', String(1), nullable=False),
+          Column('sort', Integer, nullable=False))
+    Table('pdgmeasurement', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('pdgid_id', Integer, ForeignKey('pdgid.id'), nullable=False, index=True),
+          Column('pdgid', String, nullable=False),
+          Column('pdgreference_id', Integer, ForeignKey('pdgreference.id'), nullable=False, index=True),
+          Column('event_count', String(20)),
+          Column('confidence_level', Float),
+          Column('place', String(1)),
+          Column('technique', String(4)),
+          Column('charge', String(3)),
+          Column('changebar', Boolean),
+          Column('comment', String),
+          Column('sort', Integer, nullable=False))
+    Table('pdgid_map', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('source_id', Integer, ForeignKey('pdgid.id'), nullable=False, index=True),
+          Column('source', String),
+          Column('target_id', Integer, ForeignKey('pdgid.id'), nullable=False, index=True),
+          Column('target', String),
+          Column('type', String(1)),
+          Column('sort', Integer))
+    Table('pdgmeasurement_values', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('pdgmeasurement_id', Integer, ForeignKey('pdgmeasurement.id'), nullable=False, index=True),
+          Column('column_name', String),
+          Column('value_text', String),
+          Column('unit_text', String),
+          Column('display_value_text', String),
+          Column('display_power_of_ten', Integer),
+          Column('display_in_percent', Boolean),
+          Column('limit_type', String(1)),
+          Column('used_in_average', Boolean),
+          Column('used_in_fit', Boolean),
+          Column('value', Float),
+          Column('error_positive', Float),
+          Column('error_negative', Float),
+          Column('stat_error_positive', Float),
+          Column('stat_error_negative', Float),
+          Column('syst_error_positive', Float),
+          Column('syst_error_negative', Float),
+          Column('sort', Integer, nullable=False))
+    Table('pdgmeasurement_footnote', metadata,
+          Column('id', Integer, primary_key=True),
+          Column('pdgmeasurement_id', Integer, ForeignKey('pdgmeasurement.id'), nullable=False, index=True),
+          Column('pdgfootnote_id', Integer, ForeignKey('pdgfootnote.id'), nullable=False, index=True))
+
+
+# Map schema versions (as given by `pdginfo.schema_version`) to functions
+# defining the corresponding tables
+SCHEMA_DEFINITIONS: dict[str, Callable[[MetaData], None]] = {
+    '0.3': _define_tables_v0_3,
+}
+
+
+def define_tables(metadata: MetaData, schema_version: str) -> bool:
+    """Add the prebuilt table definitions for a schema version to `metadata`.
+
+    Args:
+        metadata: `MetaData` object to which the tables are added. Must already
+            contain table `pdginfo` (see :func:`define_pdginfo`).
+        schema_version: Schema version as given by `pdginfo.schema_version`.
+
+    Returns:
+        `True` if prebuilt definitions exist for `schema_version`, `False` if
+        the schema version is unknown and no tables were added.
+    """
+    try:
+        define = SCHEMA_DEFINITIONS[schema_version]
+    except KeyError:
+        return False
+    define(metadata)
+    return True
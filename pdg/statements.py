@@ -0,0 +1,375 @@
+"""
+Prebuilt SQL statements for the queries used by the API.
+
+Building a SQLAlchemy `select()` construct and looking up its tables in the
+database metadata takes longer than executing a typical query of the API
+against the SQLite file, and with SQLAlchemy 2.x each new construct must also
+have its cache key generated before the compiled SQL can be reused. The
+statements used for loading data are therefore built only once per
+:class:`~pdg.api.PdgApi` object, by the functions in `STATEMENTS`, and
+retrieved with :meth:`PdgApi.statement <pdg.api.PdgApi.statement>`. All
+parameters are passed as bound parameters when the statement is executed. For
+queries that differ in their structure depending on the arguments of the
+calling method (e.g. an optional `WHERE` clause), the builder functions take
+additional arguments, and a separate statement is built for each combination.
+"""
+
+from sqlalchemy import Integer, MetaData, and_, bindparam, func, or_, select
+from sqlalchemy.sql import Select
+from typing import Callable
+
+
+def _all_pdgids(db: MetaData, by_data_type: bool) -> Select:
+    "All PDG Identifiers and their data types, optionally of a given data type (parameter `data_type_key`)."
+    pdgid_table = db.tables['pdgid']
+    query = select(pdgid_table.c.pdgid, pdgid_table.c.data_type)
+    if by_data_type:
+        query = query.where(pdgid_table.c.data_type == bindparam('data_type_key'))
+    return query.order_by(pdgid_table.c.sort)
+
+
+def _particle_pdgids_by_mcid(db: MetaData) -> Select:
+    "PDG Identifiers of the particles with a given MC ID (parameter `mcid`)."
+    pdgparticle_table = db.tables['pdgparticle']
+    query = select(pdgparticle_table.c.pdgid).distinct()
+    return query.where(pdgparticle_table.c.mcid == bindparam('mcid'))
+
+
+def _pdgid(db: MetaData) -> Select:
+    "Row of table `pdgid` for a PDG Identifier (parameter `pdgid`)."
+    pdgid_table = db.tables['pdgid']
+    return select(pdgid_table).where(pdgid_table.c.pdgid == bindparam('pdgid'))
+
+
+def _summary_values(db: MetaData) -> Select:
+    "Summary values for a PDG Identifier and edition (parameters `pdgid`, `edition`)."
+    pdgid_table = db.tables['pdgid']
+    pdgdata_table = db.tables['pdgdata']
+    query = select(pdgdata_table, pdgid_table.c.description).join(pdgid_table)
+    query = query.where(pdgid_table.c.pdgid == bindparam('pdgid'))
+    query = query.where(pdgdata_table.c.edition == bindparam('edition'))
+    return query.order_by(pdgdata_table.c.sort)
+
+
+def _count_data_entries(db: MetaData) -> Select:
+    "Number of summary values for a PDG Identifier and edition (parameters `pdgid`, `edition`)."
+    pdgdata_table = db.tables['pdgdata']
+    query = select(func.count('*')).select_from(pdgdata_table)
+    query = query.where(pdgdata_table.c.pdgid == bindparam('pdgid'))
+    return query.where(pdgdata_table.c.edition == bindparam('edition'))
+
+
+def _children(db: MetaData) -> Select:
+    "Child PDG Identifiers and their data types (parameter `parent_pdgid`)."
+    pdgid_table = db.tables['pdgid']
+    query = select(pdgid_table.c.pdgid, pdgid_table.c.data_type)
+    query = query.where(pdgid_table.c.parent_pdgid == bindparam('parent_pdgid'))
+    return query.order_by(pdgid_table.c.sort)
+
+
+def _properties(db: MetaData, join_data: bool, by_summary_table: bool, data_type_filter: str,
+                omit_branching_ratios: bool) -> Select:
+    """Properties of a particle (see :meth:`PdgParticle.properties <pdg.particle.PdgParticle.properties>`).
+
+    Each row is a row of table `pdgid` with the number of measurements of the
+    property (as `num_measurements`) and one of its summary values for the
+    edition (the columns of table `pdgdata` prefixed with `summary_`, or `NULL`
+    for properties without summary values), ordered by property and summary
+    value, so that the returned data objects need no further queries e.g. for
+    :meth:`PdgParticle.best <pdg.particle.PdgParticle.best>`. Parameters are
+    `parent_from` and `parent_to` (range of `parent_pdgid` starting with the
+    PDG Identifier of the particle), `edition`, `in_summary_table` and
+    `data_type_key`. `data_type_filter` is one of `'default'` (exclude
+    branching fractions and ratios), `'all'`, `'like'` and `'equal'`.
+    """
+    pdgid_table = db.tables['pdgid']
+    pdgdata_table = db.tables['pdgdata']
+    pdgmsmt_table = db.tables['pdgmeasurement']
+    num_measurements = select(func.count(pdgmsmt_table.c.id)).where(pdgmsmt_table.c.pdgid_id == pdgid_table.c.id)
+    query = select(pdgid_table, num_measurements.scalar_subquery().label('num_measurements'),
+                   *(column.label('summary_%s' % column.name) for column in pdgdata_table.c))
+    # Properties without summary values are only included if join_data is False. The edition
+    # is compared as an expression, since with the index on pdgdata.edition, which matches
+    # (almost) all rows, SQLite would otherwise scan pdgdata instead of using the index on
+    # pdgid.parent_pdgid.
+    query = query.select_from(pdgid_table.join(pdgdata_table,
+                                               and_(pdgdata_table.c.pdgid_id == pdgid_table.c.id,
+                                                    pdgdata_table.c.edition.concat('') == bindparam('edition')),
+                                               isouter=not join_data))
+    if by_summary_table:
+        # Select the properties, but not their summary values, by in_summary_table
+        pdgdata_alias = pdgdata_table.alias()
+        query = query.where(select(pdgdata_alias.c.id)
+                            .where(pdgdata_alias.c.pdgid_id == pdgid_table.c.id)
+                            .where(pdgdata_alias.c.edition == bindparam('edition'))
+                            .where(pdgdata_alias.c.in_summary_table == bindparam('in_summary_table')).exists())
+    # A range instead of LIKE '<parent>%' can use the index on parent_pdgid
+    query = query.where(pdgid_table.c.parent_pdgid >= bindparam('parent_from'))
+    query = query.where(pdgid_table.c.parent_pdgid < bindparam('parent_to'))
+    # NOTE: like/notlike SQL operators never match null values
+    if data_type_filter == 'default':
+        query = query.where((pdgid_table.c.data_type.notlike('BF%')) | (pdgid_table.c.data_type.is_(None)))
+        omit_branching_ratios = True
+    elif data_type_filter == 'like':
+        query = query.where(pdgid_table.c.data_type.like(bindparam('data_type_key')))
+    elif data_type_filter == 'equal':
+        query = query.where(pdgid_table.c.data_type == bindparam('data_type_key'))
+    if omit_branching_ratios:
+        query = query.where((pdgid_table.c.data_type.notlike('BR%')) | (pdgid_table.c.data_type.is_(None)))
+    return query.order_by(pdgid_table.c.sort, pdgdata_table.c.sort)
+
+
+def _pdgdecay(db: MetaData) -> Select:
+    "Rows of table `pdgdecay` for a PDG Identifier (parameter `pdgid`)."
+    pdgdecay_table = db.tables['pdgdecay']
+    return select(pdgdecay_table).where(pdgdecay_table.c.pdgid == bindparam('pdgid'))
+
+
+def _pdgid_map_targets(db: MetaData) -> Select:
+    "Targets of table `pdgid_map` for a source PDG Identifier (parameter `source`)."
+    pdgid_map = db.tables['pdgid_map']
+    return select(pdgid_map.c.target).where(pdgid_map.c.source == bindparam('source'))
+
+
+def _pdgid_map_sources(db: MetaData) -> Select:
+    "Sources of table `pdgid_map` for a target PDG Identifier (parameter `target`)."
+    pdgid_map = db.tables['pdgid_map']
+    return select(pdgid_map.c.source).where(pdgid_map.c.target == bindparam('target'))
+
+
+def _pdgitem(db: MetaData) -> Select:
+    "Row of table `pdgitem` for an item ID (parameter `pdgitem_id`)."
+    pdgitem_table = db.tables['pdgitem']
+    return select(pdgitem_table).where(pdgitem_table.c.id == bindparam('pdgitem_id'))
+
+
+def _pdgitem_map(db: MetaData) -> Select:
+    "Rows of table `pdgitem_map` for an item ID (parameter `pdgitem_id`)."
+    pdgitem_map_table = db.tables['pdgitem_map']
+    return select(pdgitem_map_table).where(pdgitem_map_table.c.pdgitem_id == bindparam('pdgitem_id'))
+
+
+def _item_particles(db: MetaData) -> Select:
+    "Rows of table `pdgparticle` for an item ID (parameter `pdgitem_id`)."
+    pdgparticle_table = db.tables['pdgparticle']
+    return select(pdgparticle_table).where(pdgparticle_table.c.pdgitem_id == bindparam('pdgitem_id'))
+
+
+def _all_items(db: MetaData) -> Select:
+    "Columns `id`, `name` and `item_type` of table `pdgitem` for all items, ordered by ID."
+    pdgitem_table = db.tables['pdgitem']
+    return select(pdgitem_table.c.id, pdgitem_table.c.name, pdgitem_table.c.item_type).order_by(pdgitem_table.c.id)
+
+
+def _all_item_maps(db: MetaData) -> Select:
+    "Columns `pdgitem_id` and `target_id` of table `pdgitem_map` for all items, ordered by ID."
+    pdgitem_map_table = db.tables['pdgitem_map']
+    return select(pdgitem_map_table.c.pdgitem_id, pdgitem_map_table.c.target_id).order_by(pdgitem_map_table.c.id)
+
+
+def _all_item_particles(db: MetaData) -> Select:
+    "Rows of table `pdgparticle` for all particles with an item ID, ordered by ID."
+    pdgparticle_table = db.tables['pdgparticle']
+    query = select(pdgparticle_table).where(pdgparticle_table.c.pdgitem_id.isnot(None))
+    return query.order_by(pdgparticle_table.c.id)
+
+
+def _closure(db: MetaData, seed: Select, item_columns: bool=False) -> Select:
+    """Rows of tables `pdgitem_map` and `pdgparticle` for the items selected by `seed` and all items they map to.
+
+    The items are found with a recursive common table expression, which stops
+    at items already found. Columns `closure_item_id` (the item ID),
+    `closure_map_id` and `closure_target_id` (columns `id` and `target_id` of
+    table `pdgitem_map`), and if `item_columns` is set, the columns of table
+    `pdgitem` prefixed with `closure_pdgitem_`, are followed by all columns of
+    table `pdgparticle`, which are null for items without particles.
+    """
+    pdgitem_table = db.tables['pdgitem']
+    pdgitem_map_table = db.tables['pdgitem_map']
+    pdgparticle_table = db.tables['pdgparticle']
+    closure = seed.cte('closure', recursive=True)
+    closure = closure.union(select(pdgitem_map_table.c.target_id)
+                            .join(closure, pdgitem_map_table.c.pdgitem_id == closure.c.id))
+    columns = [closure.c.id.label('closure_item_id'), pdgitem_map_table.c.id.label('closure_map_id'),
+               pdgitem_map_table.c.target_id.label('closure_target_id')]
+    joined = closure.outerjoin(pdgitem_map_table, pdgitem_map_table.c.pdgitem_id == closure.c.id)
+    if item_columns:
+        columns += [column.label('closure_pdgitem_' + column.name) for column in pdgitem_table.c]
+        joined = joined.join(pdgitem_table, pdgitem_table.c.id == closure.c.id)
+    query = select(*columns, *pdgparticle_table.c)
+    query = query.select_from(joined.outerjoin(pdgparticle_table, pdgparticle_table.c.pdgitem_id == closure.c.id))
+    return query.order_by(closure.c.id, pdgitem_map_table.c.id, pdgparticle_table.c.id)
+
+
+def _item_closure(db: MetaData) -> Select:
+    """Rows of tables `pdgitem_map` and `pdgparticle` for an item ID (parameter `pdgitem_id`) and all items it maps to.
+
+    See :func:`_closure` for the columns.
+    """
+    return _closure(db, select(bindparam('pdgitem_id', type_=Integer).label('id')))
+
+
+def _particle_decays(db: MetaData) -> Select:
+    """Rows of table `pdgdecay` for all decays of a particle.
+
+    The PDG Identifiers of the decays are selected by a range of PDG
+    Identifiers (parameters `parent_from` and `parent_to`, see
+    :func:`pdg.utils.prefix_range`).
+    """
+    pdgdecay_table = db.tables['pdgdecay']
+    query = select(pdgdecay_table).where(pdgdecay_table.c.pdgid >= bindparam('parent_from'),
+                                         pdgdecay_table.c.pdgid < bindparam('parent_to'))
+    return query.order_by(pdgdecay_table.c.pdgid, pdgdecay_table.c.id)
+
+
+def _decay_item_closure(db: MetaData) -> Select:
+    """Rows of tables `pdgitem`, `pdgitem_map` and `pdgparticle` for the items of all decays of a particle.
+
+    The decays are selected as in :func:`_particle_decays`, and their items and
+    all items they map to are returned with the columns described in
+    :func:`_closure` (including the columns of table `pdgitem`).
+    """
+    pdgdecay_table = db.tables['pdgdecay']
+    seed = select(pdgdecay_table.c.pdgitem_id.label('id'))
+    seed = seed.where(pdgdecay_table.c.pdgid >= bindparam('parent_from'), pdgdecay_table.c.pdgid < bindparam('parent_to'))
+    return _closure(db, seed, item_columns=True)
+
+
+def _particle(db: MetaData) -> Select:
+    "Rows of table `pdgparticle` for a PDG Identifier (parameter `pdgid`)."
+    pdgparticle_table = db.tables['pdgparticle']
+    return select(pdgparticle_table).where(pdgparticle_table.c.pdgid == bindparam('pdgid'))
+
+
+def _all_particles(db: MetaData) -> Select:
+    "Rows of table `pdgparticle` for all particles, ordered by PDG Identifier."
+    pdgid_table = db.tables['pdgid']
+    pdgparticle_table = db.tables['pdgparticle']
+    query = select(pdgparticle_table).join(pdgid_table)
+    query = query.where(pdgid_table.c.data_type == 'PART')
+    return query.order_by(pdgid_table.c.sort, pdgparticle_table.c.id)
+
+
+def _particle_table(db: MetaData) -> Select:
+    """Rows of table `pdgparticle` for all particles with column `flags` of table `pdgid` (as `pdgid_flags`).
+
+    The rows are ordered like those of statement `all_particles`.
+    """
+    pdgid_table = db.tables['pdgid']
+    pdgparticle_table = db.tables['pdgparticle']
+    query = select(pdgparticle_table, pdgid_table.c.flags.label('pdgid_flags')).join(pdgid_table)
+    query = query.where(pdgid_table.c.data_type == 'PART')
+    return query.order_by(pdgid_table.c.sort, pdgparticle_table.c.id)
+
+
+def _particles_with_mcid(db: MetaData) -> Select:
+    "Rows of table `pdgparticle` for all particles with an MC ID."
+    pdgparticle_table = db.tables['pdgparticle']
+    return select(pdgparticle_table).where(pdgparticle_table.c.mcid.isnot(None))
+
+
+def _property_summaries(db: MetaData, data_types: tuple[str, ...]) -> Select:
+    """Properties of the given data types with their summary values for an edition (parameter `edition`).
+
+    Each row is a row of table `pdgdata` with the `parent_pdgid`, `data_type`,
+    `flags` and `sort` (as `pdgid_sort`) of its PDG Identifier.
+    """
+    pdgid_table = db.tables['pdgid']
+    pdgdata_table = db.tables['pdgdata']
+    query = select(pdgdata_table, pdgid_table.c.description, pdgid_table.c.parent_pdgid, pdgid_table.c.data_type,
+                   pdgid_table.c.flags, pdgid_table.c.sort.label('pdgid_sort')).join(pdgid_table)
+    query = query.where(or_(*(pdgid_table.c.data_type == data_type for data_type in data_types)))
+    query = query.where(pdgdata_table.c.edition == bindparam('edition'))
+    return query.order_by(pdgid_table.c.sort, pdgdata_table.c.sort)
+
+
+def _all_decays(db: MetaData) -> Select:
+    """Items of all decays (columns of table `pdgdecay`) with the `data_type` and `description` of their PDG Identifier.
+
+    The rows are ordered by PDG Identifier and by column `sort` of table `pdgdecay`.
+    """
+    pdgid_table = db.tables['pdgid']
+    pdgdecay_table = db.tables['pdgdecay']
+    query = select(pdgdecay_table.c.pdgid, pdgdecay_table.c.pdgitem_id, pdgdecay_table.c.name,
+                   pdgdecay_table.c.is_outgoing, pdgdecay_table.c.multiplier, pdgid_table.c.data_type,
+                   pdgid_table.c.description)
+    query = query.join(pdgid_table, pdgid_table.c.id == pdgdecay_table.c.pdgid_id)
+    return query.order_by(pdgid_table.c.sort, pdgdecay_table.c.sort)
+
+
+def _decay_summaries(db: MetaData) -> Select:
+    """Summary values of all branching fractions (data types starting with `BF`) for an edition (parameter `edition`).
+
+    The rows are ordered by PDG Identifier and by column `sort` of table `pdgdata`.
+    """
+    pdgid_table = db.tables['pdgid']
+    pdgdata_table = db.tables['pdgdata']
+    query = select(pdgdata_table).join(pdgid_table)
+    query = query.where(pdgid_table.c.data_type >= bindparam('data_type_from'),
+                        pdgid_table.c.data_type < bindparam('data_type_to'))
+    query = query.where(pdgdata_table.c.edition == bindparam('edition'))
+    return query.order_by(pdgid_table.c.sort, pdgdata_table.c.sort)
+
+
+def _measurement_counts(db: MetaData, data_types: tuple[str, ...]) -> Select:
+    "Number of measurements for all PDG Identifiers of the given data types that have measurements."
+    pdgid_table = db.tables['pdgid']
+    pdgmsmt_table = db.tables['pdgmeasurement']
+    query = select(pdgid_table.c.pdgid, func.count(pdgmsmt_table.c.id).label('num_measurements'))
+    query = query.join(pdgmsmt_table, pdgmsmt_table.c.pdgid_id == pdgid_table.c.id)
+    query = query.where(or_(*(pdgid_table.c.data_type == data_type for data_type in data_types)))
+    return query.group_by(pdgid_table.c.pdgid)
+
+
+def _measurement_count(db: MetaData) -> Select:
+    "Number of measurements of a PDG Identifier (parameter `pdgid`)."
+    pdgmsmt_table = db.tables['pdgmeasurement']
+    return select(func.count().label('num_measurements')).where(pdgmsmt_table.c.pdgid == bindparam('pdgid'))
+
+
+def _row(db: MetaData, table_name: str) -> Select:
+    "Row of a table for a primary key (parameter `id`)."
+    table = db.tables[table_name]
+    return select(table).where(table.c.id == bindparam('id'))
+
+
+def _linked_ids(db: MetaData, table_name: str, src_col: str, dest_col: str) -> Select:
+    "Values of column `dest_col` for all rows of a table with a given value (parameter `src_id`) of `src_col`."
+    table = db.tables[table_name]
+    return select(table.c[dest_col]).where(table.c[src_col] == bindparam('src_id'))
+
+
+# Map statement names to the functions building them from the database metadata
+# (and any additional arguments given to PdgApi.statement())
+STATEMENTS: dict[str, Callable[..., Select]] = {
+    'all_pdgids': _all_pdgids,
+    'particle_pdgids_by_mcid': _particle_pdgids_by_mcid,
+    'pdgid': _pdgid,
+    'summary_values': _summary_values,
+    'count_data_entries': _count_data_entries,
+    'children': _children,
+    'properties': _properties,
+    'pdgdecay': _pdgdecay,
+    'pdgid_map_targets': _pdgid_map_targets,
+    'pdgid_map_sources': _pdgid_map_sources,
+    'pdgitem': _pdgitem,
+    'pdgitem_map': _pdgitem_map,
+    'item_particles': _item_particles,
+    'all_items': _all_items,
+    'all_item_maps': _all_item_maps,
+    'all_item_particles': _all_item_particles,
+    'item_closure': _item_closure,
+    'particle_decays': _particle_decays,
+    'decay_item_closure': _decay_item_closure,
+    'particle': _particle,
+    'all_particles': _all_particles,
+    'particle_table': _particle_table,
+    'particles_with_mcid': _particles_with_mcid,
+    'property_summaries': _property_summaries,
+    'measurement_counts': _measurement_counts,
+    'measurement_count': _measurement_count,
+    'all_decays': _all_decays,
+    'decay_summaries': _decay_summaries,
+    'row': _row,
+    'linked_ids': _linked_ids,
+}
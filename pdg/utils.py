@@ -1,11 +1,10 @@
 """
 Utilities for PDG API.
 """
+import bisect
 import math
 from typing import TYPE_CHECKING, Iterator, Optional, Tuple, cast
 
-from sqlalchemy import select, bindparam
-
 from pdg.errors import PdgNoDataError, PdgAmbiguousValueError, PdgRoundingError
 
 if TYPE_CHECKING:
@@ -101,12 +100,9 @@ def get_row_data(api: 'PdgApi', table_name: str, row_id: int) -> dict:
         table_name: Name of the table in the SQLite file.
         row_id: Value of the `id` column (i.e. the primary key) to look up.
     """
-    table = api.db.tables[table_name]
-    query = select(table).where(table.c.id == bindparam('id'))
-    with api.engine.connect() as conn:
-        matches = conn.execute(query, {'id': row_id}).fetchall()
+    matches = api.get_rows((table_name, 'id', row_id), api.statement('row', table_name), {'id': row_id})
     assert len(matches) == 1
-    return dict(matches[0]._mapping)
+    return matches[0]
 
 
 def get_linked_ids(api: 'PdgApi', table_name: str, src_col: str, src_id: int, dest_col: str='id') \
@@ -127,9 +123,39 @@ def get_linked_ids(api: 'PdgApi', table_name: str, src_col: str, src_id: int, de
         The values of the `dest_col` column for all rows in which the `src_col`
         column is equal to `src_id`.
     """
-    table = api.db.tables[table_name]
-    query = select(table.c[dest_col]) \
-        .where(table.c[src_col] == bindparam('src_id'))
-    with api.engine.connect() as conn:
-        for entry in conn.execute(query, {'src_id': src_id}):
-            yield cast(int, entry._mapping[dest_col])
+    rows = api.get_rows((table_name, dest_col, src_col, src_id),
+                        api.statement('linked_ids', table_name, src_col, dest_col), {'src_id': src_id})
+    for row in rows:
+        yield cast(int, row[dest_col])
+
+
+def find_prefixed(keys: list[str], prefix: str) -> Iterator[str]:
+    """Get an iterator over the strings in a sorted list that start with a prefix.
+
+    Args:
+        keys: Sorted list of strings.
+        prefix: Prefix to look for.
+
+    Returns:
+        The matching strings in sorted order, found by bisection.
+    """
+    i = bisect.bisect_left(keys, prefix)
+    while i < len(keys) and keys[i].startswith(prefix):
+        yield keys[i]
+        i += 1
+
+
+def prefix_range(prefix: str) -> tuple[str, str]:
+    """Get the range of strings starting with a (non-empty) prefix.
+
+    Unlike `LIKE '<prefix>%'`, which is case-insensitive in SQLite, a
+    comparison with the bounds of this range can use an index.
+
+    Args:
+        prefix: Prefix.
+
+    Returns:
+        Tuple `(lower, upper)` such that a string starts with `prefix` if and
+        only if `lower <= string < upper`.
+    """
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
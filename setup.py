@@ -17,6 +17,7 @@ setup(
     packages=find_packages(),
     package_data={"pdg": ["pdg.sqlite"]},
     install_requires=['SQLAlchemy>=1.4', 'typing_extensions>=4.15'],
+    extras_require={'numpy': ['numpy']},
     python_requires='>=3.10',
     classifiers=[
         'Development Status :: 5 - Production/Stable',
@@ -10,6 +10,7 @@ import time
 import sqlalchemy
 
 import pdg
+from pdg.errors import PdgNoDataError
 
 
 class TestMetaData(unittest.TestCase):
@@ -65,6 +66,31 @@ class TestMetaData(unittest.TestCase):
     def test_schema_version(self):
         self.assertTrue(float(self.api.info('schema_version')) >= pdg.MIN_SCHEMA_VERSION)
 
+    def test_prebuilt_schema(self):
+        reflected = pdg.connect(reflect=True).db
+        self.assertEqual(sorted(self.api.db.tables), sorted(reflected.tables))
+        for name, table in reflected.tables.items():
+            self.assertEqual([c.name for c in self.api.db.tables[name].c], [c.name for c in table.c],
+                             'column mismatch in table %s' % name)
+
+    def test_info_attributes(self):
+        for k in self.api.info_keys():
+            self.assertEqual(getattr(self.api, k), self.api.info(k))
+        self.assertIsNone(self.api.info('nonexistent'))
+
+    def test_doc_key_value(self):
+        doc = self.api.doc_key_value('PDGITEM', 'ITEM_TYPE', 'P')
+        self.assertEqual(doc['description'], 'particle with specific charge')
+        self.assertRaises(PdgNoDataError, self.api.doc_key_value, 'PDGITEM', 'ITEM_TYPE', 'nonexistent')
+        self.assertTrue(len(self.api.doc_data_type_keys(as_text=False)) > 0)
+
+    def test_clear_cache(self):
+        api = pdg.connect()
+        editions = api.editions
+        api.clear_cache()
+        self.assertEqual(api.editions, editions)
+        self.assertEqual(api.default_edition, self.api.info('edition'))
+
 
 if __name__ == '__main__':
     unittest.main()
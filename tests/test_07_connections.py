@@ -0,0 +1,114 @@
+"""
+Test cases for database connection handling.
+"""
+from __future__ import print_function
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import sqlalchemy
+
+import pdg
+from pdg.errors import PdgApiError
+
+
+class TestConnections(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = pdg.connect()
+
+    def test_read_only(self):
+        with self.api.connection() as conn:
+            self.assertEqual(conn.execute(sqlalchemy.text('PRAGMA query_only')).scalar(), 1)
+
+    def test_session(self):
+        with self.api.session() as api:
+            self.assertIs(api, self.api)
+            with self.api.connection() as conn1, self.api.connection() as conn2:
+                self.assertIs(conn1, conn2)
+            with self.api.session():
+                with self.api.connection() as conn3:
+                    self.assertIs(conn1, conn3)
+            with self.api.connection() as conn4:
+                self.assertIs(conn1, conn4)
+            self.assertEqual(self.api.get_particle_by_name('pi+').mcid, 211)
+        with self.api.connection() as conn:
+            self.assertIsNot(conn, conn1)
+
+    def test_session_data(self):
+        names = [p.name for plist in self.api.get_particles() for p in plist]
+        with self.api.session():
+            self.assertEqual([p.name for plist in self.api.get_particles() for p in plist], names)
+            self.assertEqual(round(self.api.get_particle_by_name('p').mass, 3), 0.938)
+
+    def test_in_memory(self):
+        api = pdg.connect(in_memory=True)
+        self.assertIsNotNone(api.in_memory_database)
+        self.assertTrue(api.in_memory_database.size > 0)
+        self.assertTrue(api.in_memory_database.copy_time >= 0)
+        self.assertIsNone(self.api.in_memory_database)
+        self.assertEqual(api.get('S008M').value, self.api.get('S008M').value)
+        self.assertEqual(api.get_particle_by_mcid(-211).name, 'pi-')
+        with api.connection() as conn1, api.connection() as conn2:
+            self.assertEqual(conn1.execute(sqlalchemy.text('SELECT COUNT(*) FROM pdgid')).scalar(),
+                             conn2.execute(sqlalchemy.text('SELECT COUNT(*) FROM pdgid')).scalar())
+        self.assertRaises(PdgApiError, pdg.connect, 'sqlite://', in_memory=True)
+
+    def test_statements(self):
+        api = pdg.connect()
+        self.assertIs(api.statement('pdgid'), api.statement('pdgid'))
+        self.assertIsNot(api.statement('all_pdgids', True), api.statement('all_pdgids', False))
+        api.get_particle_by_name('K+').mass
+        n_statements = len(api._statements)
+        self.assertEqual(round(api.get_particle_by_name('K-').mass, 4), 0.4937)
+        self.assertEqual(len(api._statements), n_statements)
+
+    def test_sqlite3_backend(self):
+        api = pdg.connect(backend='sqlite3')
+        self.assertEqual(api.backend, 'sqlite3')
+        with api.connection() as conn:
+            row = conn.execute(api.statement('pdgid'), {'pdgid': 'S008M'}).fetchone()
+        with self.api.connection() as conn:
+            expected = conn.execute(self.api.statement('pdgid'), {'pdgid': 'S008M'}).fetchone()
+        self.assertEqual(row._mapping, dict(expected._mapping))
+        self.assertEqual((row.description, row[1]), (expected.description, expected[1]))
+        self.assertEqual(api.get('S008M').value, self.api.get('S008M').value)
+        self.assertIs(api.get('S008M').best_summary().in_summary_table, True)
+        self.assertEqual([bf.pdgid for bf in api.get_particle_by_name('K+').branching_fractions()],
+                         [bf.pdgid for bf in self.api.get_particle_by_name('K+').branching_fractions()])
+        self.assertRaises(PdgApiError, pdg.connect, backend='mysql')
+        self.assertRaises(PdgApiError, pdg.connect, 'postgresql://localhost/pdg', backend='sqlite3')
+
+    def test_threads(self):
+        def workload(api, particles):
+            result = [api.get('S008M').value]
+            for p in particles:
+                result.append(p.mass)
+                result.append([bf.pdgid for bf in p.branching_fractions()])
+            return result
+
+        names = ['pi+', 'K+', 'p', 'mu-']
+        expected = workload(self.api, [self.api.get_particle_by_name(n) for n in names])
+
+        # Share both the API object and the particle objects (with their still
+        # empty caches) between all threads
+        api = pdg.connect()
+        particles = [api.get_particle_by_name(n) for n in names]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(workload, api, particles) for _ in range(16)]
+            for future in futures:
+                self.assertEqual(future.result(), expected)
+
+        def session_workload(api, names):
+            with api.session():
+                return workload(api, [api.get_particle_by_name(n) for n in names])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(session_workload, api, names) for _ in range(8)]
+            for future in futures:
+                self.assertEqual(future.result(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Test cases for pickling of API and data objects and for use with multiple processes.
+"""
+from __future__ import print_function
+
+import multiprocessing
+import os
+import pickle
+import unittest
+
+import pdg
+from pdg.api import PdgApi, get_process_api
+from pdg.particle import PdgParticle
+
+
+def particle_masses(plist):
+    return [(p.name, p.mass if p.has_mass_entry else None) for p in plist]
+
+
+def data_value(data):
+    return os.getpid(), round(data.value, 3)
+
+
+def lazy_copy(api):
+    pending = api.in_memory_database is None
+    return pending, round(api.get('S009M').value, 3), api.in_memory_database is not None
+
+
+class TestProcesses(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = pdg.connect()
+
+    def test_pickle_api(self):
+        api = pickle.loads(pickle.dumps(self.api))
+        self.assertIsInstance(api, PdgApi)
+        self.assertEqual(api.database_url, self.api.database_url)
+        self.assertFalse(api.pedantic)
+        pedantic_api = pickle.loads(pickle.dumps(pdg.connect(pedantic=True)))
+        self.assertTrue(pedantic_api.pedantic)
+        self.assertEqual(get_process_api(api.database_url, False, api._options)._options, self.api._options)
+
+    def test_pickle_data(self):
+        p = self.api.get_particle_by_name('K+')
+        self.assertEqual(round(p.mass, 4), 0.4937)
+        p2 = pickle.loads(pickle.dumps(p))
+        self.assertIsInstance(p2, PdgParticle)
+        self.assertEqual(p2.api.database_url, self.api.database_url)
+        self.assertEqual((p2.pdgid, p2.edition, p2.mcid, p2.name), (p.pdgid, p.edition, p.mcid, p.name))
+        self.assertIn('pdgparticle', p2.cache)
+        self.assertEqual(p2.mass, p.mass)
+        self.assertEqual([bf.pdgid for bf in p2.branching_fractions()],
+                         [bf.pdgid for bf in p.branching_fractions()])
+
+        plist = self.api.get('S008')
+        plist2 = pickle.loads(pickle.dumps(plist))
+        self.assertEqual([p.name for p in plist2], [p.name for p in plist])
+
+        mass = self.api.get('S008M', edition='2026')
+        mass2 = pickle.loads(pickle.dumps(mass))
+        self.assertEqual((mass2.pdgid, mass2.edition, mass2.value), (mass.pdgid, mass.edition, mass.value))
+
+        msmt = next(mass.get_measurements())
+        msmt2 = pickle.loads(pickle.dumps(msmt))
+        self.assertEqual(msmt2.id, msmt.id)
+        self.assertEqual(msmt2.reference.document_id, msmt.reference.document_id)
+
+    def test_map(self):
+        plists = [self.api.get(pdgid) for pdgid in ('S008', 'S010', 'S016', 'S004')]
+        expected = [particle_masses(plist) for plist in plists]
+        self.assertEqual(self.api.map(particle_masses, plists, processes=1), expected)
+        self.assertEqual(self.api.map(particle_masses, plists, processes=2), expected)
+
+    def test_fork(self):
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            self.skipTest('fork start method not available')
+        for api in (self.api, pdg.connect(in_memory=True)):
+            # Data objects are bound to the API object inherited by the workers,
+            # whose pool still holds a connection of the parent process
+            data = [api.get(pdgid) for pdgid in ('S008M', 'S010M', 'S016M')]
+            expected = [round(d.value, 3) for d in data]
+            with multiprocessing.get_context('fork').Pool(2) as pool:
+                results = pool.map(data_value, data)
+            self.assertTrue(all(pid != os.getpid() for pid, _ in results))
+            self.assertEqual([value for _, value in results], expected)
+
+    def test_fork_copy(self):
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            self.skipTest('fork start method not available')
+        # The in-memory database is copied by the first query in the child process, not by the fork
+        api = pdg.connect(in_memory=True)
+        expected = round(pdg.connect().get('S009M').value, 3)
+        with multiprocessing.get_context('fork').Pool(1) as pool:
+            self.assertEqual(pool.map(lazy_copy, [api]), [(True, expected, True)])
+        self.assertIsNotNone(api.in_memory_database)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,293 @@
+"""
+Test cases for the caches shared by all objects of an API object.
+"""
+from __future__ import print_function
+
+import pickle
+import unittest
+
+import sqlalchemy
+
+import pdg
+from pdg.cache import LruCache
+from pdg.errors import PdgAmbiguousValueError, PdgApiError, PdgNoDataError
+from pdg.particle import PdgItem, PdgParticle
+
+
+class TestLruCache(unittest.TestCase):
+
+    def test_lru(self):
+        cache = LruCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)     # 'b' is now least recently used
+        cache.put('c', 3)
+        self.assertNotIn('b', cache)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions, stats.size, stats.maxsize), (2, 1, 1, 2, 2))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertRaises(ValueError, LruCache, 0)
+
+
+class TestIdentityMap(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = pdg.connect(identity_map=100)
+
+    def test_disabled(self):
+        api = pdg.connect()
+        self.assertIsNone(api.identity_map)
+        self.assertIsNot(api.get('S008M'), api.get('S008M'))
+
+    def test_get(self):
+        mass = self.api.get('S008M')
+        self.assertEqual(round(mass.value, 2), 139.57)
+        self.assertIs(self.api.get('S008M'), mass)
+        self.assertIs(self.api.get('S008M/%s' % self.api.default_edition), mass)
+        self.assertIn('summary', mass.cache)
+        self.assertIsNot(self.api.get('S008M', edition='2024'), mass)
+        self.assertIs(self.api.get('S008'), self.api.get('S008'))
+
+    def test_particles(self):
+        pion = self.api.get_particle_by_name('pi+')
+        self.assertIs(self.api.get_particle_by_name('pi+'), pion)
+        self.assertIs(pion.antiparticle, self.api.get_particle_by_name('pi+').antiparticle)
+        self.assertIs(pion.antiparticle.antiparticle, self.api.get_particle_by_mcid(211))
+        self.assertIsInstance(pion, PdgParticle)
+        self.assertEqual(pion.antiparticle.name, 'pi-')
+
+    def test_eviction(self):
+        api = pdg.connect(identity_map=2)
+        mass = api.get('S008M')
+        api.get('S008M')
+        api.get('S009M')
+        api.get('S010M')
+        self.assertIsNot(api.get('S008M'), mass)
+        stats = api.identity_map.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 4, 2))
+        self.assertEqual(stats.evictions, 2)
+        api.clear_cache()
+        self.assertEqual(len(api.identity_map), 0)
+
+
+class TestRowCache(unittest.TestCase):
+
+    def setUp(self):
+        self.api = pdg.connect(backend='sqlalchemy', row_cache=1000)
+        self.statements = []
+        sqlalchemy.event.listen(self.api.engine, 'before_cursor_execute',
+                                lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+    def test_shared_rows(self):
+        kaon = PdgParticle(self.api, 'S010', set_mcid=321)
+        self.assertEqual(kaon.name, 'K+')
+        self.assertEqual(PdgParticle(self.api, 'S010', set_mcid=-321).name, 'K-')
+        self.assertEqual(len([s for s in self.statements if 'FROM pdgparticle' in s]), 1)
+        self.assertIs(kaon._get_pdgid(), self.api.get('S010')._get_pdgid())
+
+    def test_edition_change(self):
+        mass = self.api.get('S008M')
+        description = mass.description
+        mass.value
+        self.statements.clear()
+        mass.edition = '2024'
+        self.assertEqual(mass.description, description)
+        mass.summary_values()
+        self.assertFalse([s for s in self.statements if 'FROM pdgid \n' in s])
+        self.assertEqual(len([s for s in self.statements if 'FROM pdgdata' in s]), 1)
+
+    def test_measurements(self):
+        msmt = next(self.api.get('S008M').get_measurements())
+        msmt.technique, msmt.charge, msmt.comment
+        self.assertEqual(len([s for s in self.statements if 'WHERE pdgmeasurement.id' in s]), 1)
+
+    def test_best(self):
+        # The properties query provides everything needed for selecting the best of several masses
+        top = self.api.get_particle_by_name('t')
+        top.charge
+        self.statements.clear()
+        self.assertEqual(round(top.mass), 173)
+        self.assertEqual(len(self.statements), 1)
+        self.assertEqual(len([p for p in top.masses() if p.num_measurements > 0]), 3)
+        self.assertEqual(len(self.statements), 2)
+
+    def test_resolved_quantities(self):
+        # Values, errors and fallbacks share the properties, which are looked up once per data type
+        kaon = PdgParticle(self.api, 'S010', set_mcid=321)
+        kaon.charge
+        self.statements.clear()
+        quantities = (kaon.mass, kaon.mass_error, kaon.width, kaon.width_error, kaon.lifetime, kaon.lifetime_error,
+                      kaon.has_mass_entry, kaon.has_width_entry, kaon.has_lifetime_entry)
+        self.assertEqual(len(self.statements), 3)
+        self.assertEqual((kaon.mass, kaon.mass_error, kaon.width, kaon.width_error, kaon.lifetime,
+                          kaon.lifetime_error, kaon.has_mass_entry, kaon.has_width_entry, kaon.has_lifetime_entry),
+                         quantities)
+        self.assertEqual(len(self.statements), 3)
+        # Missing data is cached as well, separately for pedantic mode
+        self.api.pedantic = True
+        for _ in range(2):
+            self.assertRaises(PdgNoDataError, lambda: kaon.width)
+        self.assertEqual(len(self.statements), 3)
+        self.api.pedantic = False
+        self.assertEqual(kaon.width, quantities[2])
+        kaon.edition = '2024'
+        self.assertNotIn('resolved', kaon.cache)
+
+    def test_hydrated_properties(self):
+        # Properties are returned with the same data as loaded by a new data object
+        kaon = PdgParticle(self.api, 'S010', set_mcid=321)
+        kaon.charge
+        api = pdg.connect(row_cache=0)
+        for kwargs in ({}, {'data_type_key': '%'}, {'data_type_key': 'BF%', 'in_summary_table': True},
+                       {'in_summary_table': False}, {'require_summary_data': False}):
+            self.statements.clear()
+            props = [(p.pdgid, p._get_pdgid(), p._get_summary_values(), getattr(p, 'num_measurements', None))
+                     for p in kaon.properties(**kwargs)]
+            self.assertTrue(props)
+            self.assertEqual(len(self.statements), 1)
+            for pdgid, row, summary_values, num_measurements in props:
+                fresh = api.get(pdgid)
+                self.assertEqual((row, summary_values, num_measurements),
+                                 (fresh._get_pdgid(), fresh._get_summary_values(),
+                                  getattr(fresh, 'num_measurements', None)))
+
+    def test_particle_lists(self):
+        # The members of particle lists are created with their rows
+        particles = [(p.name, p.mcid, p.charge) for plist in self.api.get_particles() for p in plist]
+        self.assertEqual(len(self.statements), 1)
+        self.assertIn(('K+', 321, 1.0), particles)
+        self.statements.clear()
+        kaons = self.api.get('s010')
+        self.assertEqual([(p.name, p.mcid, p.charge) for p in kaons], [('K+', 321, 1.0), ('K-', -321, -1.0)])
+        self.assertEqual(len([s for s in self.statements if 'FROM pdgparticle' in s]), 1)
+
+    def test_lazy_particle_list(self):
+        # The members of a particle list are only created when accessed
+        pions = self.api.get('S008')
+        self.assertFalse([s for s in self.statements if 'FROM pdgparticle' in s])
+        self.assertEqual(len(pions), 2)
+        self.assertEqual(pions[1].name, 'pi-')
+        self.assertEqual(pions.index(pions[0]), 0)
+        self.assertEqual(len([s for s in self.statements if 'FROM pdgparticle' in s]), 1)
+        unpickled = pickle.loads(pickle.dumps(self.api.get('S010')))
+        self.assertEqual([p.name for p in unpickled], ['K+', 'K-'])
+        self.assertEqual(len(unpickled), 2)
+
+    def test_item_resolution(self):
+        # The particles of an item are resolved with a single query and cached on the item
+        item_id, = self.api.name_index.item_ids('pi+-')
+        self.statements.clear()
+        item = PdgItem(self.api, item_id)
+        self.assertEqual([p.name for p in item.particles], ['pi+', 'pi-'])
+        self.assertTrue(item.has_particles)
+        self.assertFalse(item.has_particle)
+        self.assertRaises(PdgAmbiguousValueError, lambda: item.particle)
+        self.assertEqual(len(self.statements), 1)
+        self.assertEqual([p.name for p in PdgItem(self.api, item_id).particles], ['pi+', 'pi-'])
+        self.assertEqual(len(self.statements), 1)
+
+    def test_prefetch_products(self):
+        # The decay products of all branching fractions are loaded with two queries
+        def products(bfs):
+            return [(bf.baseid, product.item.name, product.multiplier, product.item.has_particle,
+                     [p.name for p in product.item.particles], product.subdecay)
+                    for bf in bfs for product in bf.decay_products]
+
+        particle = self.api.get_particle_by_name('D+')
+        api = pdg.connect(row_cache=0)
+        expected = products(api.get_particle_by_name('D+').branching_fractions())
+        self.statements.clear()
+        bfs = list(particle.branching_fractions(prefetch_products=True))
+        self.assertEqual(len(self.statements), 3)
+        self.assertEqual(products(bfs), expected)
+        self.assertIn('K-', [product.item.particle.name for bf in bfs for product in bf.decay_products
+                             if product.item.has_particle])
+        self.assertEqual(len(self.statements), 3)
+        bfs = list(particle.exclusive_branching_fractions(include_subdecays=True, prefetch_products=True))
+        self.assertTrue(len(bfs) > 100)
+        self.assertTrue(all(bf.decay_products for bf in bfs))
+        self.assertEqual(len(self.statements), 6)
+
+    def test_bounded(self):
+        api = pdg.connect(row_cache=3)
+        for pdgid in ('S008M', 'S009M', 'S010M', 'S011M'):
+            api.get(pdgid).value
+        stats = api.row_cache.stats()
+        self.assertEqual(stats.size, 3)
+        self.assertTrue(stats.evictions > 0)
+        self.assertIsNone(pdg.connect(row_cache=0).row_cache)
+
+
+class TestPreload(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = pdg.connect()
+        cls.preloaded_api = pdg.connect(backend='sqlalchemy')
+        cls.preloaded = cls.preloaded_api.preload()
+        cls.statements = []
+        sqlalchemy.event.listen(cls.preloaded_api.engine, 'before_cursor_execute',
+                                lambda conn, cursor, statement, *args: cls.statements.append(statement))
+
+    def setUp(self):
+        self.statements.clear()
+
+    def particle_data(self, api, pdgid):
+        data = []
+        for p in api.get(pdgid):
+            bfs = list(p.branching_fractions())
+            data.append((p.name, p.mass, p.charge,
+                         [bf.pdgid for bf in bfs],
+                         [[(product.item.name, product.multiplier) for product in bf.decay_products] for bf in bfs],
+                         [bf.best_summary().value for bf in bfs if bf.best_summary() is not None]))
+        return data
+
+    def test_no_sql(self):
+        for pdgid in ('S008', 'S009', 'S010', 'S004', 'S041'):
+            self.assertEqual(self.particle_data(self.preloaded_api, pdgid), self.particle_data(self.api, pdgid))
+        self.assertEqual(self.statements, [])
+
+    def test_properties(self):
+        kaon, kaon_preloaded = self.api.get('S010')[0], self.preloaded_api.get('S010')[0]
+        for args in ((), ('%',), ('M',), ('BFX%',), ('BR%', True), ('%', False), ('%', True, True),
+                     ('%', True, False), (None, True, None, True)):
+            self.assertEqual([p.pdgid for p in kaon_preloaded.properties(*args)],
+                             [p.pdgid for p in kaon.properties(*args)])
+        self.assertEqual([p.pdgid for p in kaon_preloaded.get_children()], [p.pdgid for p in kaon.get_children()])
+        self.assertEqual(self.statements, [])
+
+    def test_null_data_type(self):
+        # Identifiers without data type are treated as in SQL: kept unless matched against a data type
+        api = pdg.connect()
+        preloaded = api.preload(tables=['pdgid'], editions=[])
+        row = dict(preloaded._properties['S010'][0], pdgid='S010X', data_type=None)
+        preloaded._properties['S010'].append(row)
+
+        def pdgids(data_type_filter, data_type_key=None, omit_branching_ratios=False):
+            return preloaded.property_pdgids('S010', api.default_edition, False, None, data_type_filter,
+                                             data_type_key, omit_branching_ratios)
+
+        self.assertIn('S010X', pdgids('default'))
+        self.assertIn('S010X', pdgids('all', None, True))
+        self.assertNotIn('S010X', pdgids('like', '%'))
+        self.assertNotIn('S010X', pdgids('equal', 'M'))
+
+    def test_tables(self):
+        self.assertEqual(self.preloaded.editions, (self.api.default_edition,))
+        self.assertEqual(self.preloaded.num_rows['pdgid'], len(self.preloaded.indexes[('pdgid', 'pdgid')]))
+        api = pdg.connect()
+        preloaded = api.preload(tables=['pdgid'], editions=[])
+        self.assertIs(api.preloaded, preloaded)
+        self.assertEqual(round(api.get('S008M').value, 2), 139.57)
+        self.assertEqual(api.get_particle_by_name('pi+').mass, self.api.get_particle_by_name('pi+').mass)
+        self.assertRaises(PdgApiError, api.preload, tables=['pdgreference'])
+        api.clear_cache()
+        self.assertIsNone(api.preloaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
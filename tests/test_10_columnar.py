@@ -0,0 +1,102 @@
+"""
+Test cases for columnar lookups of the properties of many particles.
+"""
+from __future__ import print_function
+
+import math
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import pdg
+from pdg.columnar import FIELDS
+from pdg.errors import PdgApiError, PdgNoDataError
+
+
+@unittest.skipIf(numpy is None, 'NumPy not installed')
+class TestParticleProperties(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = pdg.connect()
+        cls.mcids = [211, -211, 111, 321, 2212, 11, 22, 6, 23, 25, 130, 4122, 2112, 5]
+
+    def test_values(self):
+        columns = self.api.get_particle_properties(numpy.array(self.mcids))
+        self.assertEqual(set(columns), set(FIELDS))
+        for i, mcid in enumerate(self.mcids):
+            p = self.api.get_particle_by_mcid(mcid)
+            for field in FIELDS:
+                try:
+                    value = getattr(p, field)
+                except PdgNoDataError:
+                    value = None
+                if value is None:
+                    self.assertIs(columns[field][i], numpy.ma.masked, '%s %s' % (p.name, field))
+                else:
+                    self.assertTrue(math.isclose(columns[field][i], value, rel_tol=1e-12), '%s %s' % (p.name, field))
+
+    def test_missing(self):
+        columns = self.api.get_particle_properties([22, 999999999, 2212], fields=['mass', 'lifetime', 'charge'])
+        self.assertEqual(list(columns['charge'].mask), [False, True, False])
+        self.assertEqual(list(columns['mass'].mask), [True, True, False])    # the photon mass is a limit
+        self.assertEqual(columns['lifetime'][0], float('inf'))
+        self.assertEqual(self.api.get_particle_by_mcid(22).lifetime, float('inf'))
+
+    def test_units(self):
+        columns = self.api.get_particle_properties([211, 321], ['mass', 'lifetime'], units='MeV')
+        self.assertEqual(round(columns['mass'][0], 2), 139.57)
+        self.assertEqual(round(columns['lifetime'][1] * 1e9, 2), 12.38)
+        columns = self.api.get_particle_properties([211], ['lifetime'], units={'lifetime': 'year'})
+        self.assertTrue(columns['lifetime'][0] < 1e-15)
+        self.assertRaises(PdgApiError, self.api.get_particle_properties, [211], ['spin'])
+        self.assertRaises(PdgApiError, self.api.get_particle_properties, [211], ['mass'], {'mass': 's'})
+        self.assertRaises(PdgApiError, self.api.get_particle_properties, [211], None, {'charge': 'e'})
+
+    def test_mcid_table(self):
+        table = self.api.get_mcid_table(fields=['mass', 'charge'], units='MeV')
+        self.assertEqual(table.fields, ('mass', 'charge', 'pdgid', 'name'))
+        self.assertTrue(numpy.all(numpy.diff(table.mcids) > 0))
+        mcids = numpy.array([[211, -211, 0], [22, 2212, 999999999]])
+        self.assertEqual(table.index(mcids).shape, (2, 3))
+        self.assertTrue(numpy.all((table.index(mcids) < 0) == [[False, False, True], [False, False, True]]))
+        columns = table.lookup(mcids)
+        self.assertEqual(columns['mass'].shape, (2, 3))
+        self.assertEqual(columns['name'].tolist(), [['pi+', 'pi-', None], ['gamma', 'p', None]])
+        self.assertEqual(columns['pdgid'][0, 0], 'S008')
+        self.assertEqual(columns['charge'].tolist(), [[1., -1., None], [0., 1., None]])
+        expected = self.api.get_particle_properties(mcids.ravel(), ['mass'], 'MeV')['mass']
+        self.assertEqual(columns['mass'].ravel().tolist(), expected.tolist())
+        self.assertRaises(PdgApiError, table.lookup, [211], ['width'])
+
+    def test_particle_table(self):
+        table = self.api.particle_table(units='MeV')
+        particles = [p for plist in self.api.get_particles() for p in plist]
+        self.assertEqual(table['name'].tolist(), [p.name for p in particles])
+        self.assertTrue(all(len(column) == len(particles) for column in table.values()))
+        for name in ('pi+', 'K-', 'p', 'gamma', 't', 'Lambda_c(2880)+'):
+            i = table['name'].tolist().index(name)
+            p = particles[i]
+            self.assertEqual(table['pdgid'][i], p.pdgid.split('/')[0])
+            for field in ('mass', 'width', 'lifetime', 'charge', 'quantum_J', 'is_baryon', 'has_width_entry'):
+                try:
+                    value = getattr(p, field)
+                except PdgNoDataError:
+                    value = None
+                if field in ('mass', 'width') and value is not None:
+                    value *= 1000.
+                if value is None:
+                    self.assertIs(table[field][i], numpy.ma.masked, '%s %s' % (name, field))
+                elif isinstance(value, float):
+                    self.assertTrue(math.isclose(table[field][i], value, rel_tol=1e-12), '%s %s' % (name, field))
+                else:
+                    self.assertEqual(table[field][i], value, '%s %s' % (name, field))
+        self.assertTrue(table['mcid'].mask.any())     # not all particles have an MC ID
+        self.assertEqual(table['mcid'][table['name'].tolist().index('pi+')], 211)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Test cases for looking up particles by name with the in-memory name index.
+"""
+from __future__ import print_function
+
+import unittest
+
+import sqlalchemy
+
+import pdg
+from pdg.errors import PdgAmbiguousValueError, PdgNoDataError
+from pdg.particle import PdgItem
+
+
+class TestNameIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = pdg.connect(backend='sqlalchemy')
+        cls.index = cls.api.name_index
+
+    def test_aliases(self):
+        self.assertEqual(self.api.get_canonical_name('H0'), 'H')
+        self.assertEqual(self.api.get_canonical_name('f_0(600)'), 'f_0(500)0')
+        self.assertEqual(self.api.get_canonical_name('sigma'), 'f_0(500)0')
+        self.assertEqual(self.api.get_particle_by_name('K+').mcid, 321)
+        self.assertEqual(sorted(p.name for p in self.api.get_particles_by_name('pi')), ['pi+', 'pi-', 'pi0'])
+        self.assertRaises(ValueError, self.api.get_particle_by_name, 'k+')
+        self.assertEqual(self.api.get_particle_by_name('k+', case_sensitive=False).name, 'K+')
+        self.assertRaises(PdgAmbiguousValueError, self.api.get_particle_by_name, 'b', case_sensitive=False)
+        self.assertRaises(PdgAmbiguousValueError, self.api.get_particle_by_name, 'pi')
+
+    def test_items(self):
+        # Names are resolved like by PdgItem
+        for name in ('pi', 'K+', 'sigma', 'H0', 'pi+-', 'K^*(892)', 'KS', 'B', 'X'):
+            item_id, = self.index.item_ids(name)
+            item = PdgItem(self.api, item_id)
+            self.assertEqual(self.index.particle(item_id) is not None, item.has_particle)
+            self.assertEqual([p['name'] for p in self.index.particles(item_id)], [p.name for p in item.particles])
+
+    def test_no_sql(self):
+        statements = []
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sqlalchemy.event.listen(self.api.engine, 'before_cursor_execute', listener)
+        try:
+            particle = self.api.get_particle_by_name('D0')
+            self.assertEqual((particle.name, particle.mcid, particle.charge), ('D0', 421, 0.0))
+            self.api.get_particles_by_name('K^*(892)')
+            self.assertEqual(statements, [])
+        finally:
+            sqlalchemy.event.remove(self.api.engine, 'before_cursor_execute', listener)
+
+    def test_search(self):
+        names = self.index.prefix_search('K_1(1270)')
+        self.assertIn('K_1(1270)+', names)
+        self.assertTrue(all(name.startswith('K_1(1270)') for name in names))
+        self.assertEqual(self.index.prefix_search('k_1(1270)', case_sensitive=False), names)
+        self.assertEqual(len(self.index.prefix_search('K', limit=3)), 3)
+        self.assertEqual(self.index.prefix_search('no such particle'), [])
+        self.assertIn('Lambda_c(2880)+', self.index.fuzzy_search('lambda_c(2880)'))
+        self.assertEqual(self.index.fuzzy_search('xyzzy'), [])
+
+    def test_duplicate_names(self):
+        # Items with the same name are ambiguous, as for the lookup by SQL
+        self.assertEqual(self.index.item_id('K+'), self.index.item_ids('K+')[0])
+        self.assertRaises(PdgNoDataError, self.index.item_id, 'no such item')
+        api = pdg.connect(in_memory=True)
+        conn = api.in_memory_database.connect()
+        try:
+            conn.execute('DROP INDEX ix_pdgitem_name')
+            conn.execute("INSERT INTO pdgitem (id, name, item_type) SELECT MAX(id) + 1, 'K+', 'P' FROM pdgitem")
+            conn.commit()
+        finally:
+            conn.close()
+        self.assertEqual(len(api.name_index.item_ids('K+')), 2)
+        self.assertRaises(PdgAmbiguousValueError, api.get_particle_by_name, 'K+')
+        self.assertRaises(PdgAmbiguousValueError, api.name_index.item_id, 'K+')
+        self.assertRaises(PdgAmbiguousValueError, api.product_index.canonical_item, 'K+')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Test cases for the in-memory index of charge conjugates.
+"""
+from __future__ import print_function
+
+import unittest
+
+import sqlalchemy
+
+import pdg
+
+
+class TestConjugationIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = pdg.connect(backend='sqlalchemy')
+        cls.index = cls.api.conjugation_index
+
+    def item(self, name):
+        item_id, = self.api.name_index.item_ids(name)
+        return item_id
+
+    def test_particles(self):
+        self.assertEqual(self.index.conjugate_mcid(211), -211)
+        self.assertEqual(self.index.conjugate_mcid(-521), 521)
+        self.assertEqual(self.index.conjugate_mcid(111), 111)
+        self.assertEqual(self.index.conjugate_mcid(310), 310)
+        self.assertIsNone(self.index.conjugate_mcid(0))
+        for name, antiparticle in (('pi+', 'pi-'), ('K0', 'Kbar0'), ('B-', 'B+'), ('pi0', 'pi0'),
+                                   ('Delta(1232)++', 'Deltabar(1232)--'), ('K(S)0', 'K(S)0')):
+            self.assertEqual(self.api.get_particle_by_name(name).antiparticle.name, antiparticle)
+        # Particles without MC ID are paired by charge
+        particle = self.api.get_particle_by_name('K(1630)0')
+        self.assertIsNone(particle.mcid)
+        self.assertEqual(particle.antiparticle.name, 'Kbar(1630)0')
+        self.assertEqual(particle.antiparticle.antiparticle.name, 'K(1630)0')
+
+    def test_items(self):
+        for name, conjugate in (('pi+', 'pi-'), ('K-', 'K+'), ('pi+-', 'pi+-'), ('pi', 'pi'), ('gamma', 'gamma'),
+                                ('lepton+', 'lepton-'), ('e+-', 'e-+'), ('X', 'X')):
+            self.assertEqual(self.index.conjugate_item(self.item(name)), self.item(conjugate), name)
+        # Aliases are conjugated to the item of the conjugate particle
+        self.assertEqual(self.index.conjugate_item(self.item('K(S)')), self.item('K(S)0'))
+        products = [(self.item('K-'), 1), (self.item('pi+'), 2)]
+        self.assertEqual(self.index.conjugate_products(products), [(self.item('K+'), 1), (self.item('pi-'), 2)])
+        self.assertIsNone(self.index.conjugate_products([(self.item('T_c_c(3875)+'), 1)]))
+
+    def test_decays(self):
+        self.assertEqual([bf.pdgid for bf in self.api.get('S009.14').conjugates()], ['S009.22/2026'])
+        self.assertIn('S009.1', self.index.conjugate_decays('S009.1'))     # pi0 --> 2gamma
+        self.assertEqual(self.index.conjugate_decays('S042.1'), [])        # only B0 modes are listed
+        self.assertEqual(self.index.conjugate_decays('S008M'), [])
+
+    def test_no_sql(self):
+        statements = []
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        kaon = self.api.get_particle_by_name('K+')
+        kaon.self_conjugate
+        sqlalchemy.event.listen(self.api.engine, 'before_cursor_execute', listener)
+        try:
+            antikaon = kaon.antiparticle
+            self.assertEqual((antikaon.name, antikaon.mcid, antikaon.charge), ('K-', -321, -1.0))
+            self.assertEqual(statements, [])
+        finally:
+            sqlalchemy.event.remove(self.api.engine, 'before_cursor_execute', listener)
+
+    def test_without_index(self):
+        # Antiparticles are found among the states of the PDG Identifier unless the index has been built
+        api = pdg.connect()
+        kaon = api.get_particle_by_name('K(1630)0')
+        self.assertEqual(kaon.antiparticle.name, 'Kbar(1630)0')
+        self.assertEqual(api.get_particle_by_mcid(-521).antiparticle.name, 'B+')
+        self.assertIsNone(api._conjugation_index)
+        for plist in api.get_particles():
+            for particle in plist:
+                conjugate = self.index.conjugate_particle(particle._get_particle_data()['id'])
+                if conjugate is not None and not particle.self_conjugate:
+                    self.assertEqual(particle.antiparticle.name, conjugate['name'])
+        self.assertIsNone(api._conjugation_index)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Test cases for the in-memory decay graph.
+"""
+from __future__ import print_function
+
+import math
+import unittest
+
+import sqlalchemy
+
+import pdg
+from pdg.errors import PdgNoDataError
+
+
+class TestDecayGraph(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = pdg.connect(backend='sqlalchemy')
+        cls.graph = cls.api.get_decay_graph()
+
+    def test_modes(self):
+        self.assertIs(self.api.get_decay_graph(), self.graph)
+        kaon = self.api.get_particle_by_name('K+')
+        modes = [mode for mode in self.graph.modes(kaon) if mode.data_type == 'BFX']
+        self.assertEqual([mode.pdgid for mode in modes],
+                         [bf.baseid for bf in kaon.exclusive_branching_fractions(require_summary_data=False)])
+        for mode in modes[:5]:
+            bf = self.api.get(mode.pdgid)
+            self.assertEqual(mode.description, bf.description)
+            self.assertEqual([(p.name, p.multiplier) for p in mode.products],
+                             [(p.item.name, p.multiplier) for p in bf.decay_products])
+            if mode.branching_fraction is not None:
+                self.assertEqual(mode.branching_fraction, bf.value)
+        # The pi+ modes imply the charge conjugate modes of pi-
+        pion_modes = self.graph.modes('pi+')
+        antipion_modes = self.graph.modes('pi-')
+        self.assertEqual([mode.pdgid for mode in antipion_modes], [mode.pdgid for mode in pion_modes])
+        self.assertTrue(all(mode.conjugate and mode.parent['name'] == 'pi-' for mode in antipion_modes))
+        self.assertFalse(any(mode.conjugate for mode in pion_modes))
+        mode = antipion_modes[[m.pdgid for m in antipion_modes].index('S008.1')]      # pi+ --> mu+ nu_mu
+        self.assertEqual([p.name for p in mode.products], ['mu-', 'nubar_mu'])
+        self.assertEqual(len(self.graph.modes('D-')), len(self.graph.modes('D+')))
+        self.assertRaises(PdgNoDataError, self.graph.modes, 'pi')
+
+    def test_chains(self):
+        chains = list(self.graph.chains('D0', 2))
+        self.assertEqual(len([chain for chain in chains if len(chain.modes) == 1]),
+                         len(self.graph.tree('D0', 1).branches))
+        for chain in chains:
+            self.assertEqual(chain.modes[0].parent['name'], 'D0')
+            if len(chain.modes) == 2:
+                self.assertIn(chain.modes[1].parent['id'],
+                              [p.particle['id'] for p in chain.modes[0].products if p.particle is not None])
+            fractions = [mode.branching_fraction for mode in chain.modes]
+            if None in fractions:
+                self.assertIsNone(chain.branching_fraction)
+            else:
+                self.assertTrue(math.isclose(chain.branching_fraction, math.prod(fractions)))
+        selected = list(self.graph.chains('D0', 2, min_branching_fraction=0.01))
+        self.assertTrue(selected)
+        # Branching fractions are at most 1, so the beginnings of all selected chains are selected as well
+        self.assertEqual(selected, [chain for chain in chains
+                                    if chain.branching_fraction is not None and chain.branching_fraction >= 0.01])
+
+    def test_conjugate_chains(self):
+        # Antiparticle daughters are expanded with the conjugate modes, e.g. D- in B0 --> D- pi+
+        d_minus = self.api.get_particle_by_name('D-')
+        expected = [bf.baseid for bf in d_minus.exclusive_branching_fractions(require_summary_data=False)]
+        self.assertEqual([mode.pdgid for mode in self.graph.modes(d_minus) if mode.data_type == 'BFX'], expected)
+        chains = [chain for chain in self.graph.chains('B0', 2) if chain.modes[0].description == 'B0 --> D- pi+']
+        self.assertEqual(len(chains[0].modes), 1)
+        followed = [chain.modes[1] for chain in chains[1:] if chain.modes[1].parent['name'] == 'D-']
+        self.assertEqual([mode.pdgid for mode in followed], expected)
+        self.assertTrue(all(mode.conjugate for mode in followed))
+        kpipi = followed[expected.index('S031.1')]      # D+ --> K- 2pi+
+        self.assertEqual(sorted((p.name, p.multiplier) for p in kpipi.products), [('K+', 1), ('pi-', 2)])
+
+    def test_trees(self):
+        # Subtrees are shared, and cycles (p --> p pi+ pi+) end at the particle
+        tree = self.graph.tree('B0', 3)
+        self.assertIs(self.graph.tree('D0', 2), self.graph.tree(self.api.get_particle_by_name('D0'), 2))
+        d0 = [child for branch in tree.branches for child in branch.children if child.particle['name'] == 'D0']
+        self.assertTrue(d0)
+        self.assertTrue(all(node is d0[0] for node in d0))
+        proton = self.graph.tree('p', 3)
+        for branch in proton.branches:
+            for child in branch.children:
+                if child.particle['name'] == 'p':
+                    self.assertEqual(child.branches, ())
+
+    def test_no_sql(self):
+        statements = []
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sqlalchemy.event.listen(self.api.engine, 'before_cursor_execute', listener)
+        try:
+            self.assertTrue(sum(1 for _ in self.graph.chains('B+', 2)) > 1000)
+            self.assertEqual(statements, [])
+        finally:
+            sqlalchemy.event.remove(self.api.engine, 'before_cursor_execute', listener)
+
+
+if __name__ == '__main__':
+    unittest.main()
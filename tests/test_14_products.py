@@ -0,0 +1,137 @@
+"""
+Test cases for the in-memory index of decay products.
+"""
+from __future__ import print_function
+
+import unittest
+
+import sqlalchemy
+
+import pdg
+from pdg.errors import PdgNoDataError
+from pdg.particle import PdgParticle
+from pdg.products import DecaySignature
+
+
+class TestProductIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.api = pdg.connect(backend='sqlalchemy')
+        cls.index = cls.api.product_index
+
+    def descriptions(self, pdgids):
+        return [self.api.get(pdgid).description for pdgid in pdgids]
+
+    def test_products(self):
+        self.assertIs(self.api.product_index, self.index)
+        bf = self.api.get('S031.2')     # D+ --> K0S pi+
+        self.assertEqual(self.index.outgoing(bf.pdgid), self.index.multiset(['K(S)0', 'pi+']))
+        self.assertEqual(self.index.incoming('s031.2'), self.index.multiset(['D+']))
+        self.assertIsNone(self.index.outgoing('S031.999'))
+        # Aliases are resolved to the item of the particle
+        self.assertEqual(self.index.canonical_item('K0S'), self.index.canonical_item('K(S)0'))
+        self.assertEqual(self.index.canonical_item(self.api.get_particle_by_name('K(S)0')),
+                         self.index.canonical_item('K0S'))
+        self.assertEqual(self.index.multiset(['pi+', 'K-', 'pi+']), self.index.multiset({'K-': 1, 'pi+': 2}))
+        self.assertRaises(PdgNoDataError, self.index.multiset, ['no such item'])
+        particle = PdgParticle(self.api, 'S010', set_mcid=321)
+        particle.cache['pdgparticle'] = dict(particle._get_particle_data(), pdgitem_id=None)
+        self.assertRaisesRegex(PdgNoDataError, r'K\+', self.index.multiset, [particle, 'pi+'])
+        # The index agrees with the decay products of the data objects
+        for bf in self.api.get_particle_by_name('D0').branching_fractions():
+            products = [product.item for product in bf.decay_products for _ in range(product.multiplier)]
+            self.assertEqual(self.index.outgoing(bf.baseid), self.index.multiset(products))
+            self.assertIn(bf.baseid, self.index.find(products, exact=True))
+
+    def test_find(self):
+        found = self.index.find(['K0S', 'pi+'])
+        self.assertIn('S031.2', found)
+        self.assertIn('S031.387', found)      # subdecay mode with K0S pi+ pi-
+        self.assertEqual(found, self.index.find(['pi+', 'K(S)0']))
+        for pdgid in found:
+            products = dict(self.index.outgoing(pdgid))
+            self.assertTrue(products.get(self.index.canonical_item('K0S'), 0) >= 1)
+            self.assertTrue(products.get(self.index.canonical_item('pi+'), 0) >= 1)
+        # Multiplicities
+        self.assertEqual(self.descriptions(self.index.find(['K-', 'pi+', 'pi+'], exact=True)),
+                         ['D+ --> K- 2pi+', 'B+ --> K- pi+ pi+'])
+        self.assertEqual(self.index.find({'K-': 1, 'pi+': 2}, exact=True), self.index.find(['K-', 'pi+', 'pi+'],
+                                                                                             exact=True))
+        self.assertTrue(set(self.index.find({'pi0': 3})) < set(self.index.find({'pi0': 2})))
+        # Parents and charge conjugates
+        self.assertEqual(self.index.find(['K-', 'pi+', 'pi+'], exact=True, parent='D+'), ['S031.1'])
+        self.assertEqual(self.index.find(['K+', 'pi-', 'pi-'], exact=True, parent='D-'), [])
+        self.assertEqual(self.index.find(['K+', 'pi-', 'pi-'], exact=True, parent='D-', charge_conjugates=True),
+                         ['S031.1'])
+        self.assertEqual(len(self.index.find([])), 7938)
+        self.assertEqual(self.index.find(['pi+', 'pi+', 'pi+', 'pi+', 'pi+', 'pi+', 'pi+', 'pi+', 'pi+']), [])
+
+    def test_parents(self):
+        parents = self.index.parents(['J/psi'])
+        for name in ('B+', 'B0', 'psi(2S)', 'chi_c1(1P)'):
+            self.assertIn(name, parents)
+        self.assertNotIn('J/psi(1S)', parents)
+        self.assertEqual(self.index.parents(['K-', 'pi+', 'pi+'], exact=True), ['D+', 'B+'])
+
+    def test_signatures(self):
+        bf = self.api.get('S031.1')
+        self.assertEqual(bf.signature, DecaySignature(('D+',), ('K-', 'pi+', 'pi+')))
+        self.assertEqual(self.index.signature('S031.1/2026'), bf.signature)
+        self.assertIsNone(self.index.signature('S031M'))
+        for decay in ('D+ --> K- 2pi+', 'D+ -> pi+ K- pi+', 'D+ → K- pi+ pi+', '411 -> 211 -321 211'):
+            self.assertEqual(self.index.parse_decay(decay), bf.signature)
+        # Aliases have the same signature as the particle names
+        self.assertEqual(self.index.parse_decay('B+ -> J/psi K0S pi+'),
+                         self.index.parse_decay('B+ -> J/psi(1S) K(S)0 pi+'))
+        self.assertEqual(self.api.find_decays(['D+ --> K- 2pi+', 'B+ -> J/psi K+', 'D- -> K+ pi- pi-']),
+                         [['S031.1'], ['S041.3'], []])
+        self.assertEqual(self.api.find_decays(['D- -> K+ pi- pi-'], charge_conjugates=True), [['S031.1']])
+        self.assertEqual(self.api.find_decays([]), [])
+        for bf in self.api.get_particle_by_name('D0').exclusive_branching_fractions():
+            # Skip decay chains and decays without products or with products described in text
+            products = bf.signature.products
+            if bf.description.count('-->') != 1 or not products or any(' ' in name for name in products):
+                continue
+            found, = self.api.find_decays([bf.description])
+            if found is None:       # e.g. grouped products, such as 2(pi+ pi-)
+                continue
+            self.assertIn(bf.baseid, found)
+            for pdgid in found:
+                self.assertEqual(self.index.signature(pdgid), bf.signature)
+        self.assertRaises(ValueError, self.index.parse_decay, 'D+ K- pi+ pi+')
+        self.assertRaises(ValueError, self.index.parse_decay, 'D+ -> ')
+        self.assertRaises(PdgNoDataError, self.index.parse_decay, 'D+ -> K- pi+ no_such_particle')
+        self.assertRaises(PdgNoDataError, self.index.parse_decay, '999999999 -> 211 -211')
+
+    def test_find_decays_errors(self):
+        # Decays that cannot be parsed or resolved give None without affecting the rest of the batch
+        decays = ['D+ --> K- 2pi+', 'D+ -> K- pi+ no_such_particle', 'D+ K- pi+ pi+', '999999999 -> 211 -211',
+                  'X(1835) --> 3 ( pi+ pi- )', 'B+ -> J/psi K+', 'D- -> K+ pi- pi-']
+        # (grouped products are resolved token by token, and thus not found)
+        self.assertEqual(self.api.find_decays(decays), [['S031.1'], None, None, None, [], ['S041.3'], []])
+        self.assertEqual(self.api.find_decays(decays, charge_conjugates=True)[6], ['S031.1'])
+        # All descriptions of exclusive decays are looked up in one batch
+        descriptions = [pdgid.description for pdgid in self.api.get_all('BFX')]
+        results = self.api.find_decays(descriptions)
+        self.assertEqual(len(results), len(descriptions))
+        self.assertTrue(sum(1 for found in results if found) > 4000)
+
+    def test_no_sql(self):
+        statements = []
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sqlalchemy.event.listen(self.api.engine, 'before_cursor_execute', listener)
+        try:
+            self.assertTrue(len(self.index.find(['pi+', 'pi-'])) > 500)
+            self.assertTrue(len(self.index.parents(['J/psi(1S)'])) > 10)
+            self.assertEqual(self.api.find_decays(['D+ --> K- 2pi+'] * 100), [['S031.1']] * 100)
+            self.assertEqual(statements, [])
+        finally:
+            sqlalchemy.event.remove(self.api.engine, 'before_cursor_execute', listener)
+
+
+if __name__ == '__main__':
+    unittest.main()